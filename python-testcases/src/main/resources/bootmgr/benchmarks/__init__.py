@@ -0,0 +1,4 @@
+"""
+Benchmarks for the bootmgr test set helpers. Run from the bootmgr
+directory, e.g. python -m benchmarks.bench_fanout
+"""
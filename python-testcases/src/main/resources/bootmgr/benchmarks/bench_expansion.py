@@ -0,0 +1,107 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Generation of 4, 50 and 100 node expansion models from a
+            one node cluster spec, against a minimal exported model.
+
+            Usage: python -m benchmarks.bench_expansion [nodes ...]
+"""
+import sys
+import time
+
+from model_snapshot_utils import ModelSnapshot
+from expansion_utils import ExpansionBuilder, SyntheticClusterSpec, \
+    Topology, generate_expansion
+
+NS = 'xmlns:litp="http://www.ericsson.com/litp"'
+
+EXPORTS = [
+    '<litp:infrastructure {0} id="infrastructure">'
+    '<litp:infrastructure-systems-collection id="systems"/>'
+    '<litp:storage id="storage">'
+    '<litp:storage-storage_profiles-collection id="storage_profiles">'
+    '<litp:storage-profile id="profile_1"/>'
+    '</litp:storage-storage_profiles-collection>'
+    '<litp:storage-nfs_mounts-collection id="nfs_mounts">'
+    '<litp:nfs-mount id="mount2"/></litp:storage-nfs_mounts-collection>'
+    '</litp:storage><litp:networking id="networking">'
+    '<litp:networking-routes-collection id="routes">'
+    '<litp:route id="r1"/><litp:route id="traffic2_gw"/>'
+    '<litp:route6 id="default_ipv6"/>'
+    '</litp:networking-routes-collection></litp:networking>'
+    '</litp:infrastructure>'.format(NS),
+    '<litp:software {0} id="software">'
+    '<litp:software-profiles-collection id="profiles">'
+    '<litp:os-profile id="os_prof1"/></litp:software-profiles-collection>'
+    '<litp:software-items-collection id="items"><litp:package id="ntp1"/>'
+    '<litp:package id="jdk"/><litp:package id="dovecot"/>'
+    '</litp:software-items-collection>'
+    '<litp:software-services-collection id="services">'
+    '<litp:service id="sentinel"/></litp:software-services-collection>'
+    '</litp:software>'.format(NS),
+    '<litp:deployments {0} id="deployments"><litp:deployment id="d1">'
+    '<litp:deployment-clusters-collection id="clusters">'
+    '<litp:vcs-cluster id="c1"><litp:cluster-nodes-collection id="nodes"/>'
+    '</litp:vcs-cluster></litp:deployment-clusters-collection>'
+    '</litp:deployment></litp:deployments>'.format(NS),
+]
+
+SPEC = dict(('node_expansion_' + name, {1: value}) for name, value in (
+    ('sysname', 'CZ00001'), ('disk_uuid', '6000c29f0000000000000001'),
+    ('ip', '10.44.86.2'), ('hostname', 'node2'),
+    ('ipv6_00', 'fdde:4d7e:d471::835:86:2/64'), ('ip_2', '10.19.86.2'),
+    ('ip_3', '10.20.86.2'), ('eth0_mac', '00:50:56:00:00:01'),
+    ('eth1_mac', '00:50:56:00:01:01'), ('eth2_mac', '00:50:56:00:02:01'),
+    ('eth3_mac', '00:50:56:00:03:01'), ('eth4_mac', '00:50:56:00:04:01'),
+    ('eth5_mac', '00:50:56:00:05:01'), ('eth6_mac', '00:50:56:00:06:01'),
+    ('eth7_mac', '00:50:56:00:07:01')))
+SPEC['dhcp_expansion_ip_1'] = {1: '10.21.86.2'}
+
+
+class _Test(object):
+    """Assertions used by ModelSnapshot.load_documents"""
+
+    def assertEqual(self, first, second, msg=None):
+        """unittest style assertEqual"""
+        assert first == second, msg
+
+    def assertNotEqual(self, first, second, msg=None):
+        """unittest style assertNotEqual"""
+        assert first != second, msg
+
+
+def run(node_count, cluster_count=2):
+    """
+    Returns:
+        tuple. (seconds, created items, xml bytes, remote command bytes)
+    """
+    model = ModelSnapshot(_Test(), 'ms')
+    model.load_documents(EXPORTS)
+    start = time.time()
+    builder = ExpansionBuilder(model)
+    generate_expansion(builder, SyntheticClusterSpec(dict(SPEC)),
+                       Topology.spread(node_count, cluster_count))
+    xml_bytes = sum(len(xml) for _, xml in builder.documents())
+    cmd_bytes = len(builder.get_cmd())
+    return time.time() - start, len(builder.created), xml_bytes, cmd_bytes
+
+
+def main(argv):
+    """Entry point"""
+    sizes = [int(arg) for arg in argv[1:]] or [4, 50, 100]
+    for node_count in sizes:
+        seconds, items, xml_bytes, cmd_bytes = run(node_count)
+        sys.stdout.write(
+            "nodes={0} items={1} xml={2}B cmd={3}B time={4:.3f}s\n".format(
+                node_count, items, xml_bytes, cmd_bytes, seconds))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
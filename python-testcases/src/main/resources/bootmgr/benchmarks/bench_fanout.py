@@ -0,0 +1,70 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Serial vs NodeFanout run of the Story4016 multipath checks
+            against a local fake SSH target.
+
+            Usage: python -m benchmarks.bench_fanout [nodes] [latency_s]
+"""
+import sys
+import time
+
+from fanout_utils import NodeFanout
+from benchmarks.fake_ssh_target import FakeSSHTarget
+
+RESPONSES = [
+    (r'is-active multipathd', (['unknown'], [], 3)),
+    (r'rpm -q', ([], [], 1)),
+    (r'lsmod', ([], [], 1)),
+]
+
+
+def check_node(node, target):
+    """The three Story4016.test_01 probes for one node"""
+    out, _, ret = target.run_command(
+        node, '/usr/bin/systemctl is-active multipathd', su_root=True)
+    assert (out, ret) == (['unknown'], 3), node
+    out, _, ret = target.run_command(
+        node, '/bin/rpm -q device-mapper-multipath', su_root=True)
+    assert (out, ret) == ([], 1), node
+    out, _, ret = target.run_command(
+        node, '/sbin/lsmod | grep multipath', su_root=True)
+    assert (out, ret) == ([], 1), node
+
+
+def run(node_count=32, latency=0.05, max_workers=8):
+    """
+    Returns:
+        dict. wall-clock seconds for the serial and the parallel run.
+    """
+    nodes = ['node{0}'.format(i) for i in range(1, node_count + 1)]
+    timings = {}
+    with FakeSSHTarget(latency=latency, responses=RESPONSES) as target:
+        for label, workers in (('serial', 1), ('parallel', max_workers)):
+            start = time.time()
+            NodeFanout(workers).map(check_node, nodes, target)
+            timings[label] = time.time() - start
+    return timings
+
+
+def main(argv):
+    """Entry point"""
+    node_count = int(argv[1]) if len(argv) > 1 else 32
+    latency = float(argv[2]) if len(argv) > 2 else 0.05
+    timings = run(node_count, latency)
+    sys.stdout.write(
+        "nodes={0} latency={1}s serial={2:.2f}s parallel={3:.2f}s "
+        "speedup={4:.1f}x\n".format(
+            node_count, latency, timings['serial'], timings['parallel'],
+            timings['serial'] / timings['parallel']))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
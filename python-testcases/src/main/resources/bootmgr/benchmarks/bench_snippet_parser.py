@@ -0,0 +1,69 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Single pass parse of synthetic partition snippets for a
+            large deployment.
+
+            Usage: python -m benchmarks.bench_snippet_parser [nodes]
+"""
+import sys
+import time
+
+from kickstart_snippet_utils import SnippetIndex
+
+SNIPPET_DIR = "/var/lib/cobbler/snippets"
+SNIPPET_LINES = [
+    'part /boot --fstype=xfs --size=1000 --ondisk=sda',
+    'part pv.008002 --size=1 --grow --ondisk=sda',
+    'volgroup vg_root --pesize=4096 pv.008002',
+    'echo "logvol / --fstype=xfs --name=vg1_root --vgname=vg_root '
+    '--size=16384" >> /tmp/partitioninfo',
+    'echo "logvol swap --fstype=swap --name=vg1_swap --vgname=vg_root '
+    '--size=2048" >> /tmp/partitioninfo',
+    'echo "logvol /var --fstype=xfs --name=vg1_var --grow '
+    '--maxsize=20480 --vgname=vg_root --size=10240" >> /tmp/partitioninfo',
+    'echo "logvol /home --fstype=xfs --name=vg1_home --vgname=vg_root '
+    '--size=6144" >> /tmp/partitioninfo',
+]
+
+
+def synthetic_grep_output(node_count):
+    """'grep -H' output of FETCH_CMD for node_count nodes"""
+    for i in range(node_count):
+        path = "{0}/node{1}.ks.partition.snippet".format(SNIPPET_DIR, i)
+        for line in SNIPPET_LINES:
+            yield "{0}:{1}".format(path, line)
+
+
+def main(argv):
+    """Entry point"""
+    node_count = int(argv[1]) if len(argv) > 1 else 5000
+    lines = list(synthetic_grep_output(node_count))
+
+    start = time.time()
+    index = SnippetIndex()
+    index.add_grep_output(lines)
+    parse_time = time.time() - start
+
+    start = time.time()
+    for hostname in index.hostnames():
+        assert index[hostname].volume_groups == set(['vg_root'])
+        assert index[hostname].by_mount_point()['/'].size == 16384
+    query_time = time.time() - start
+
+    sys.stdout.write(
+        "nodes={0} lines={1} parse={2:.3f}s ({3:.1f}us/line) "
+        "query={4:.3f}s\n".format(
+            node_count, len(lines), parse_time,
+            parse_time * 1e6 / len(lines), query_time))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,87 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   The Story4016 multipath probes on many nodes against a local
+            sshd stand-in, run through SSHMux three ways: blocking and
+            serial, blocking on a NodeFanout thread pool, and submitted
+            all at once from the calling thread, which needs no worker
+            threads besides the SSHMux event loop.
+
+            Usage: python -m benchmarks.bench_ssh_mux [nodes] [latency_s]
+"""
+import sys
+import time
+
+from fanout_utils import NodeFanout
+from ssh_mux_utils import SSHMux, gather
+from benchmarks.fake_sshd import FakeSSHD
+
+RESPONSES = [
+    (r'is-active multipathd', (['unknown'], [], 3)),
+    (r'rpm -q', ([], [], 1)),
+    (r'lsmod', ([], [], 1)),
+]
+PROBES = [
+    ('/usr/bin/systemctl is-active multipathd', (['unknown'], [], 3)),
+    ('/bin/rpm -q device-mapper-multipath', ([], [], 1)),
+    ('/sbin/lsmod | grep multipath', ([], [], 1)),
+]
+
+
+def check_node(node, mux):
+    """The three Story4016.test_01 probes for one node, blocking"""
+    for cmd, expected in PROBES:
+        assert mux.run_command(node, cmd) == expected, node
+
+
+def check_nodes_async(nodes, mux):
+    """The probes of every node, all outstanding at once"""
+    futures = [mux.submit(node, cmd) for node in nodes for cmd, _ in PROBES]
+    results = gather(futures)
+    expected = [result for _ in nodes for _, result in PROBES]
+    assert [tuple(result) for result in results] == expected
+
+
+def run(node_count=100, latency=0.05, max_workers=8):
+    """
+    Returns:
+        dict. label -> wall-clock seconds.
+    """
+    nodes = ['node{0}'.format(i) for i in range(1, node_count + 1)]
+    timings = {}
+    with FakeSSHD(latency=latency, responses=RESPONSES) as sshd:
+        with SSHMux(sshd.connect) as mux:
+            # connect first, so every mode runs on open connections
+            gather([mux.submit(node, 'true') for node in nodes])
+            for label, func in (
+                    ('serial', lambda: NodeFanout(1).map(check_node, nodes,
+                                                         mux)),
+                    ('fanout', lambda: NodeFanout(max_workers).map(
+                        check_node, nodes, mux)),
+                    ('mux', lambda: check_nodes_async(nodes, mux))):
+                start = time.time()
+                func()
+                timings[label] = time.time() - start
+    return timings
+
+
+def main(argv):
+    """Entry point"""
+    node_count = int(argv[1]) if len(argv) > 1 else 100
+    latency = float(argv[2]) if len(argv) > 2 else 0.05
+    timings = run(node_count, latency)
+    sys.stdout.write("nodes={0} latency={1}s\n".format(node_count, latency))
+    for label in ('serial', 'fanout', 'mux'):
+        sys.stdout.write("{0:>7}: {1:6.2f}s {2:5.1f}x\n".format(
+            label, timings[label], timings['serial'] / timings[label]))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
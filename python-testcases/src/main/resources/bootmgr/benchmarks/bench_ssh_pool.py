@@ -0,0 +1,112 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   The Story588 uid and umask probes, alternating between
+            litp-admin and root, against a local sshd stand-in whose
+            log in and su take a configurable time. Run with a new
+            connection per command and su per root command, as
+            run_command does, then through the SSHMux the pool shares:
+            pooled connection and root shell, one command at a time
+            and pipelined.
+
+            Usage: python -m benchmarks.bench_ssh_pool [commands]
+                       [auth_latency_s] [su_latency_s]
+"""
+import sys
+import time
+
+from ssh_mux_utils import SSHMux, gather
+from benchmarks.fake_sshd import FakeSSHD
+
+ADMIN = 'litp-admin'
+ROOT_PASSWORD = 'passw0rd'
+RESPONSES = [
+    (r'^id -u$', (['1000'], [], 0)),
+    (r'^umask$', (['0002'], [], 0)),
+]
+PROBES = [(False, 'id -u'), (True, 'id -u'), (False, 'umask'),
+          (True, 'umask')]
+
+
+def new_mux(sshd):
+    """
+    Returns:
+        SSHMux. Connecting to the stand-in as ADMIN, su'ing with
+        ROOT_PASSWORD.
+    """
+    return SSHMux(lambda node: sshd.connect(ADMIN),
+                  lambda node: ROOT_PASSWORD)
+
+
+def run_fresh(sshd, probes):
+    """A connection per command, and su per root command"""
+    results = []
+    for su_root, cmd in probes:
+        with new_mux(sshd) as mux:
+            results.append(mux.run_command('node1', cmd, su_root))
+    return results
+
+
+def run_pooled(mux, probes):
+    """One command at a time through the pool"""
+    return [mux.run_command('node1', cmd, su_root)
+            for su_root, cmd in probes]
+
+
+def run_pipelined(mux, probes):
+    """Every command submitted at once, then the results gathered"""
+    return gather([mux.submit('node1', cmd, su_root)
+                   for su_root, cmd in probes])
+
+
+def run(count=40, auth_latency=0.2, su_latency=0.1):
+    """
+    Returns:
+        dict. label -> seconds per command.
+    """
+    probes = (PROBES * (count // len(PROBES) + 1))[:count]
+    timings = {}
+    with FakeSSHD(latency=0, responses=RESPONSES,
+                  auth_latency=auth_latency, su_latency=su_latency,
+                  root_password=ROOT_PASSWORD) as sshd:
+        with new_mux(sshd) as mux:
+            # open the pooled connection and shell, as an earlier test
+            # would
+            mux.run_command('node1', 'id -u', su_root=True)
+            expected = None
+            for label, func in (
+                    ('fresh', lambda: run_fresh(sshd, probes)),
+                    ('pooled', lambda: run_pooled(mux, probes)),
+                    ('pipelined', lambda: run_pipelined(mux, probes))):
+                start = time.time()
+                results = func()
+                timings[label] = (time.time() - start) / count
+                if expected is None:
+                    expected = results
+                assert results == expected, label
+    return timings
+
+
+def main(argv):
+    """Entry point"""
+    count = int(argv[1]) if len(argv) > 1 else 40
+    auth_latency = float(argv[2]) if len(argv) > 2 else 0.2
+    su_latency = float(argv[3]) if len(argv) > 3 else 0.1
+    timings = run(count, auth_latency, su_latency)
+    sys.stdout.write("commands={0} auth={1}s su={2}s\n".format(
+        count, auth_latency, su_latency))
+    for label in ('fresh', 'pooled', 'pipelined'):
+        sys.stdout.write("{0:>9}: {1:7.1f}ms/cmd {2:6.1f}x\n".format(
+            label, timings[label] * 1000,
+            timings['fresh'] / timings[label]))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,104 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Local stand-in for the SSH targets of a deployment. Every
+            command opens a new TCP connection to a loopback server that
+            waits a configurable latency before answering, which mimics
+            the cost of an SSH exec channel without any real node.
+"""
+import json
+import re
+import socket
+import threading
+import time
+
+try:
+    import SocketServer as socketserver
+except ImportError:
+    import socketserver
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Answers one command per connection"""
+
+    def handle(self):
+        request = json.loads(self.rfile.readline().decode('utf-8'))
+        time.sleep(self.server.latency)
+        out, err, ret = self.server.respond(request['node'], request['cmd'])
+        reply = json.dumps({'out': out, 'err': err, 'rc': ret})
+        self.wfile.write(reply.encode('utf-8') + b'\n')
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """Threaded loopback server"""
+    daemon_threads = True
+    allow_reuse_address = True
+    # TCPServer listens with a backlog of 5; any more workers connecting
+    # at once get their SYN dropped and wait a 1s retransmit.
+    request_queue_size = 128
+
+
+class FakeSSHTarget(object):
+    """
+    Loopback server plus a run_command compatible client.
+
+    Responses are looked up in a list of (regex, (out, err, rc)) tuples;
+    the first regex that matches the command wins. Unknown commands
+    return rc 127 like a shell would.
+    """
+
+    def __init__(self, latency=0.05, responses=None):
+        self.responses = [(re.compile(pattern), reply)
+                          for pattern, reply in (responses or [])]
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._server = _Server(('127.0.0.1', 0), _Handler)
+        self._server.latency = latency
+        self._server.respond = self.respond
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def respond(self, node, cmd):
+        """Return the canned (out, err, rc) for a command"""
+        with self._lock:
+            self.calls += 1
+        for pattern, reply in self.responses:
+            if pattern.search(cmd):
+                return reply
+        return [], ['{0}: {1}: command not found'.format(node, cmd)], 127
+
+    def run_command(self, node, cmd, su_root=False, **kwargs):
+        """
+        Same contract as GenericTest.run_command: returns a tuple of
+        (stdout lines, stderr lines, return code).
+        """
+        # pylint: disable=unused-argument
+        conn = socket.create_connection(self._server.server_address)
+        try:
+            request = json.dumps({'node': node, 'cmd': cmd})
+            conn.sendall(request.encode('utf-8') + b'\n')
+            data = b''
+            while not data.endswith(b'\n'):
+                chunk = conn.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+        finally:
+            conn.close()
+        reply = json.loads(data.decode('utf-8'))
+        return reply['out'], reply['err'], reply['rc']
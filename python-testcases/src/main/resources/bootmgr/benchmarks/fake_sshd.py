@@ -0,0 +1,226 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Local sshd stand-in built on paramiko's server side. Any
+            user and password is accepted, the user name standing for
+            the node; exec channels answer after a configurable latency
+            from a list of canned responses, like FakeSSHTarget does for
+            the plain TCP benchmarks. 'su -' on a pty asks for the root
+            password and then hands the pty to a local interactive
+            shell, for the SSHMux root shells.
+"""
+import logging
+import os
+import re
+import signal
+import socket
+import subprocess
+import threading
+import time
+
+import paramiko
+
+# paramiko replies to an exec request after check_channel_exec_request
+# returns; an answer closing the channel before that fails the exec.
+_MIN_LATENCY = 0.005
+
+# the server side logs every client that drops its connection
+logging.getLogger('fake_sshd').addHandler(logging.NullHandler())
+
+
+class _ServerInterface(paramiko.ServerInterface):
+    """Accepts everyone and answers exec requests"""
+
+    def __init__(self, sshd):
+        self.sshd = sshd
+        self.node = None
+        self.ptys = set()
+
+    def check_auth_password(self, username, password):
+        time.sleep(self.sshd.auth_latency)
+        self.node = username
+        return paramiko.AUTH_SUCCESSFUL
+
+    def get_allowed_auths(self, username):
+        return 'password'
+
+    def check_channel_request(self, kind, chanid):
+        if kind == 'session':
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_pty_request(self, channel, *args):
+        self.ptys.add(channel.get_id())
+        return True
+
+    def check_channel_exec_request(self, channel, command):
+        if not isinstance(command, str):
+            command = command.decode('utf-8')
+        if command == 'su -' and channel.get_id() in self.ptys:
+            target, args = self.sshd.su_shell, (channel,)
+        else:
+            target, args = self.sshd.answer, (channel, self.node, command)
+        thread = threading.Thread(target=target, args=args)
+        thread.daemon = True
+        thread.start()
+        return True
+
+
+class FakeSSHD(object):
+    """
+    Loopback SSH server.
+
+    Responses are (regex, (out, err, rc)) tuples; the first regex that
+    matches the command wins. Unknown commands return rc 127.
+    auth_latency is added to each log in and su_latency to each su,
+    standing for the key exchange and PAM.
+    """
+
+    def __init__(self, latency=0.05, responses=None, auth_latency=0,
+                 su_latency=0, root_password='passw0rd',
+                 shell=('/bin/bash', '--norc', '-i')):
+        self.latency = latency
+        self.auth_latency = auth_latency
+        self.su_latency = su_latency
+        self.root_password = root_password
+        self.shell = list(shell)
+        self.responses = [(re.compile(pattern), reply)
+                          for pattern, reply in (responses or [])]
+        self.calls = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._host_key = paramiko.RSAKey.generate(2048)
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind(('127.0.0.1', 0))
+        self._sock.listen(128)
+        self._transports = []
+        self._thread = threading.Thread(target=self._accept)
+        self._thread.daemon = True
+
+    @property
+    def address(self):
+        """(host, port) the server listens on"""
+        return self._sock.getsockname()
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._sock.close()
+        for transport in self._transports:
+            transport.close()
+
+    def _accept(self):
+        """Serve every connection with a paramiko server transport"""
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except (OSError, socket.error):
+                return
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            transport = paramiko.Transport(conn)
+            transport.set_log_channel('fake_sshd.transport')
+            transport.add_server_key(self._host_key)
+            transport.start_server(server=_ServerInterface(self))
+            with self._lock:
+                self.connections += 1
+                self._transports.append(transport)
+
+    def respond(self, node, cmd):
+        """Return the canned (out, err, rc) for a command"""
+        with self._lock:
+            self.calls += 1
+        for pattern, reply in self.responses:
+            if pattern.search(cmd):
+                return reply
+        return [], ['{0}: {1}: command not found'.format(node, cmd)], 127
+
+    def answer(self, channel, node, cmd):
+        """Answer one exec channel"""
+        time.sleep(max(self.latency, _MIN_LATENCY))
+        out, err, ret = self.respond(node, cmd)
+        if out:
+            channel.sendall(("\n".join(out) + "\n").encode('utf-8'))
+        if err:
+            channel.sendall_stderr(("\n".join(err) + "\n").encode('utf-8'))
+        channel.send_exit_status(ret)
+        channel.shutdown_write()
+        channel.close()
+
+    def su_shell(self, channel):
+        """Ask for the root password, then run a local interactive
+        shell on a new pty until it exits"""
+        channel.sendall(b'Password: ')
+        password = b''
+        while b'\r' not in password and b'\n' not in password:
+            data = channel.recv(1024)
+            if not data:
+                return
+            password += data
+        # what was typed after the password is flushed, as PAM does
+        password = password.splitlines()[0]
+        time.sleep(self.su_latency)
+        if password.decode('utf-8') != self.root_password:
+            channel.sendall(b'\r\nsu: Authentication failure\r\n')
+            channel.send_exit_status(1)
+            channel.close()
+            return
+        channel.sendall(b'\r\n')
+        master, slave = os.openpty()
+        process = subprocess.Popen(self.shell, stdin=slave, stdout=slave,
+                                   stderr=slave, preexec_fn=os.setsid,
+                                   close_fds=True)
+        os.close(slave)
+
+        def to_shell():
+            """Channel input to the pty"""
+            while True:
+                data = channel.recv(32768)
+                if not data:
+                    break
+                os.write(master, data)
+            try:
+                # the client went away: hang up, as a tty would
+                os.killpg(process.pid, signal.SIGHUP)
+            except OSError:
+                pass
+        writer = threading.Thread(target=to_shell)
+        writer.daemon = True
+        writer.start()
+        while True:
+            try:
+                data = os.read(master, 32768)
+            except OSError:
+                break
+            if not data:
+                break
+            channel.sendall(data)
+        ret = process.wait()
+        os.close(master)
+        try:
+            # killed by a signal: report it as a shell would
+            channel.send_exit_status(ret if ret >= 0 else 128 - ret)
+        except (EOFError, socket.error):
+            # the client has closed the connection already
+            pass
+        channel.close()
+
+    def connect(self, node, password='passw0rd'):
+        """
+        Returns:
+            paramiko.Transport. Client connection as node, for SSHMux.
+        """
+        sock = socket.create_connection(self.address)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        transport = paramiko.Transport(sock)
+        transport.connect(username=node, password=password)
+        return transport
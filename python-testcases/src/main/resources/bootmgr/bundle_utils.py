@@ -0,0 +1,171 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Runs several probes on a node in a single remote shell
+            invocation and splits the framed output back into one
+            (stdout, stderr, rc) tuple per probe
+"""
+import re
+import uuid
+
+# One command of a get_cmd() script, up to the marker of its stdout.
+_BUNDLED_CMD_RE = re.compile(
+    r'(?:_bdir=\$\(mktemp -d\)|RC \$_brc"); \( (?P<cmd>.*?) \) '
+    r'>"\$_bdir/o" 2>"\$_bdir/e" </dev/null; _brc=\$\?; '
+    r'echo "(?P<token>@@BUNDLE_[0-9a-f]+) (?P<index>\d+) OUT"', re.DOTALL)
+
+
+class BundleFramingError(ValueError):
+    """Raised when the output of a bundle does not contain the framing
+    for every command (e.g. the remote shell was killed part way)"""
+
+
+class CommandBundle(object):
+    """
+    A list of shell commands sent to a node as one script.
+
+    Every command runs in its own subshell with stdout and stderr
+    redirected to temporary files; the files are then printed between
+    marker lines carrying a per-bundle token, the command index and its
+    return code, so the results can be split without any ambiguity.
+
+    Example:
+        bundle = CommandBundle()
+        bundle.add("id -u")
+        bundle.add("umask")
+        (uid, _, _), (umask, _, _) = bundle.run(self, node)
+    """
+
+    def __init__(self, cmds=None):
+        self.cmds = []
+        self.token = "@@BUNDLE_{0}".format(uuid.uuid4().hex)
+        for cmd in cmds or []:
+            self.add(cmd)
+
+    def __len__(self):
+        return len(self.cmds)
+
+    def add(self, cmd):
+        """
+        Description:
+            Append a command to the bundle.
+        Args:
+            cmd (str): Shell command, may contain pipes and quotes.
+        Returns:
+            int. Index of the command's result in the parsed output.
+        """
+        self.cmds.append(cmd)
+        return len(self.cmds) - 1
+
+    def get_cmd(self):
+        """
+        Returns:
+            str. The single shell command that runs the whole bundle.
+        """
+        parts = ['_bdir=$(mktemp -d)']
+        for index, cmd in enumerate(self.cmds):
+            marker = "{0} {1}".format(self.token, index)
+            parts.append(
+                '( {cmd} ) >"$_bdir/o" 2>"$_bdir/e" </dev/null; _brc=$?; '
+                'echo "{marker} OUT"; sed -e \'$a\\\' "$_bdir/o"; '
+                'echo "{marker} ERR"; sed -e \'$a\\\' "$_bdir/e"; '
+                'echo "{marker} RC $_brc"'.format(cmd=cmd, marker=marker))
+        parts.append('rm -rf "$_bdir"')
+        return "; ".join(parts)
+
+    def parse(self, stdout):
+        """
+        Description:
+            Split the output of get_cmd() into per-command results.
+        Args:
+            stdout (list): Lines printed by the bundle.
+        Returns:
+            list. One (stdout lines, stderr lines, rc) tuple per command,
+            in the order the commands were added.
+        Raises:
+            BundleFramingError if a command's framing is missing.
+        """
+        results = [None] * len(self.cmds)
+        index, out, err, current = None, [], [], None
+
+        for line in stdout:
+            if not line.startswith(self.token):
+                if current is not None:
+                    current.append(line)
+                continue
+            fields = line[len(self.token):].split()
+            index, section = int(fields[0]), fields[1]
+            if section == 'OUT':
+                out, err = [], []
+                current = out
+            elif section == 'ERR':
+                current = err
+            else:
+                results[index] = (out, err, int(fields[2]))
+                current = None
+
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            raise BundleFramingError(
+                "No result framing for command(s): {0}".format(
+                    ", ".join(repr(self.cmds[i]) for i in missing)))
+        return results
+
+    @classmethod
+    def from_cmd(cls, cmd):
+        """
+        Description:
+            Rebuild the bundle a get_cmd() script was made from, so a
+            stand-in for the remote shell can answer each command.
+        Args:
+            cmd (str): Command received by run_command.
+        Returns:
+            CommandBundle, or None if cmd is not a bundle.
+        """
+        matches = list(_BUNDLED_CMD_RE.finditer(cmd))
+        if not matches:
+            return None
+        bundle = cls([match.group('cmd') for match in matches])
+        bundle.token = matches[0].group('token')
+        return bundle
+
+    def format_results(self, results):
+        """
+        Description:
+            Frame per-command results the way the get_cmd() script
+            prints them; the inverse of parse().
+        Args:
+            results (list): One (stdout, stderr, rc) tuple per command.
+        Returns:
+            list. Lines of output.
+        """
+        lines = []
+        for index, (stdout, stderr, ret) in enumerate(results):
+            marker = "{0} {1}".format(self.token, index)
+            lines.append(marker + " OUT")
+            lines.extend(stdout)
+            lines.append(marker + " ERR")
+            lines.extend(stderr)
+            lines.append("{0} RC {1}".format(marker, ret))
+        return lines
+
+    def run(self, test, node, **kwargs):
+        """
+        Description:
+            Run the bundle on a node in one run_command call.
+        Args:
+            test (GenericTest): Test case whose run_command is used.
+            node (str): Node filename to run the bundle on.
+            kwargs: Passed to run_command, e.g. su_root=True.
+        Returns:
+            list. One (stdout, stderr, rc) tuple per command.
+        """
+        stdout, _, _ = test.run_command(node, self.get_cmd(), **kwargs)
+        return self.parse(stdout)
@@ -0,0 +1,103 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   SHA-256 and size manifests of remote directory trees, built
+            by one find per tree in a single round trip, and the diff
+            of two manifests.
+"""
+from collections import namedtuple
+
+from bundle_utils import CommandBundle
+
+# One walk of the tree: -printf emits the size of each file as it is
+# visited and -exec ... + hashes the files in batches.
+DIGEST_CMD = ("cd {0} && /usr/bin/find . -type f -printf 'S\\t%s\\t%P\\n' "
+              "-exec /usr/bin/sha256sum {{}} +")
+
+FileDigest = namedtuple('FileDigest', ['size', 'sha256'])
+
+
+class ManifestDiff(namedtuple('ManifestDiff',
+                              ['added', 'removed', 'changed'])):
+    """Sorted relative paths added, removed and changed between two
+    manifests"""
+    __slots__ = ()
+
+    @property
+    def names_match(self):
+        """True if both manifests hold the same file names"""
+        return not self.added and not self.removed
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+    __nonzero__ = __bool__
+
+
+def parse_digest_output(lines):
+    """
+    Description:
+        Build a manifest from the output of DIGEST_CMD as it streams in.
+    Args:
+        lines (iterable): Lines printed by DIGEST_CMD.
+    Returns:
+        dict. relative path -> FileDigest.
+    """
+    sizes = {}
+    hashes = {}
+    for line in lines:
+        if line.startswith('S\t'):
+            _, size, path = line.split('\t', 2)
+            sizes[path] = int(size)
+        else:
+            digest, sep, path = line.partition('  ')
+            if sep:
+                hashes[path[2:] if path.startswith('./') else path] = digest
+    return dict((path, FileDigest(sizes.get(path), digest))
+                for path, digest in hashes.items())
+
+
+def diff_manifests(old, new):
+    """
+    Description:
+        Compare two manifests.
+    Args:
+        old (dict): Reference manifest.
+        new (dict): Manifest compared against it.
+    Returns:
+        ManifestDiff. Empty (false) if the manifests are identical.
+    """
+    return ManifestDiff(
+        sorted(set(new) - set(old)),
+        sorted(set(old) - set(new)),
+        sorted(path for path in set(old) & set(new)
+               if old[path] != new[path]))
+
+
+def fetch_manifests(test, node, roots, su_root=True):
+    """
+    Description:
+        Build the manifest of every root in one run_command call.
+    Args:
+        test (GenericTest): Test case whose run_command is used.
+        node (str): Node filename.
+        roots (list): Directories; shell globs are expanded remotely and
+            must match a single directory.
+        su_root (bool): Read the trees as root.
+    Returns:
+        list. One manifest per root, in the order of roots.
+    """
+    bundle = CommandBundle([DIGEST_CMD.format(root) for root in roots])
+    manifests = []
+    for root, (stdout, stderr, ret) in zip(
+            roots, bundle.run(test, node, su_root=su_root)):
+        test.assertEqual(0, ret, "Failed to digest {0}: {1}".format(
+            root, "\n".join(stderr)))
+        manifests.append(parse_digest_output(stdout))
+    return manifests
@@ -0,0 +1,18 @@
+#!/bin/bash
+#
+# Writes the expansion arrays of a cluster spec file to
+# /tmp/expansion_cluster_spec.sh as 'declare -p' lines, so that
+# expansion_utils can build the expansion items in Python and load
+# them with 'litp load' instead of running the expand_cloud_* scripts.
+#
+
+if [ "$#" -lt 1 ]; then
+    echo -e "Usage:\n  $0 <CLUSTER_SPEC_FILE>" >&2
+    exit 1
+fi
+
+cluster_file="$1"
+source "$cluster_file"
+
+declare -p $(compgen -A variable | grep -E '^(node|dhcp)_expansion_') \
+    > /tmp/expansion_cluster_spec.sh
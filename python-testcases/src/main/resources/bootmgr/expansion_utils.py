@@ -0,0 +1,616 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Builds the items of a cluster expansion (systems, disks, BMC,
+            nodes, interfaces, inherits) in Python from the cluster spec
+            file and submits them as a few 'litp load --merge' calls in a
+            single round trip, instead of one 'litp create'/'litp
+            inherit' CLI call per item.
+"""
+import base64
+import binascii
+import gzip
+import io
+from collections import OrderedDict
+import re
+import socket
+import xml.etree.ElementTree as ElementTree
+import zlib
+
+LITP_NS = "http://www.ericsson.com/litp"
+XSI_NS = "http://www.w3.org/2001/XMLSchema-instance"
+SCHEMA_LOCATION = "http://www.ericsson.com/litp litp-xml-schema/litp.xsd"
+
+# Written by expandscripts/dump_cluster_spec.sh
+SPEC_DUMP_SCRIPT = "dump_cluster_spec.sh"
+SPEC_DUMP_FILE = "/tmp/expansion_cluster_spec.sh"
+
+LITP_LOAD_CMD = "/usr/bin/litp load -p {0} -f {1} --merge"
+
+_DECLARE_RE = re.compile(r"^declare -\S+ (?P<name>\w+)=(?P<value>.*)$")
+_ELEMENT_RE = re.compile(r'\[(?P<index>\d+)\]="(?P<value>(?:[^"\\]|\\.)*)"')
+
+_HEX_RE = re.compile(r'^[0-9a-fA-F]+$')
+_TRAILING_NUMBER_RE = re.compile(r'^(.*?)(\d+)$')
+
+# Properties of the vcs-clusters generate_expansion creates; cluster_id
+# is added per cluster.
+DEFAULT_CLUSTER_PROPS = [('cluster_type', 'sfha'), ('low_prio_net', 'mgmt'),
+                         ('llt_nets', 'hb1,hb2'),
+                         ('default_nic_monitor', 'mii')]
+FIRST_GENERATED_CLUSTER_ID = 2000
+
+ElementTree.register_namespace('litp', LITP_NS)
+ElementTree.register_namespace('xsi', XSI_NS)
+
+
+def _gzip(data):
+    """gzip data in memory; large expansions would otherwise exceed the
+    128KiB limit of a single argument of the remote shell"""
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode='wb') as gz_file:
+        gz_file.write(data)
+    return buf.getvalue()
+
+
+class ClusterSpec(object):
+    """
+    The expansion arrays of a cluster spec file, e.g.
+    node_expansion_hostname[2]="node3".
+
+    Example:
+        spec = ClusterSpec.fetch(self, self.test_ms, '192.168.0.42_4node.sh')
+        spec.get('node_expansion_ip', 2)
+    """
+
+    def __init__(self, arrays=None):
+        self.arrays = arrays if arrays is not None else {}
+
+    @classmethod
+    def parse(cls, lines):
+        """
+        Description:
+            Parse 'declare -p' output of bash arrays.
+        Args:
+            lines (list): Lines written by dump_cluster_spec.sh.
+        Returns:
+            ClusterSpec.
+        """
+        arrays = {}
+        for line in lines:
+            match = _DECLARE_RE.match(line.strip())
+            if match is None:
+                continue
+            arrays[match.group('name')] = dict(
+                (int(element.group('index')),
+                 re.sub(r'\\(.)', r'\1', element.group('value')))
+                for element in _ELEMENT_RE.finditer(match.group('value')))
+        return cls(arrays)
+
+    @classmethod
+    def fetch(cls, test, ms_node, cluster_filename):
+        """
+        Description:
+            Source the cluster spec file on the MS through the framework's
+            expand script runner and read its arrays back.
+        Args:
+            test (GenericTest): Test case running the expansion.
+            ms_node (str): Filename of the MS.
+            cluster_filename (str): Cluster spec file name, as passed to
+                execute_expand_script.
+        Returns:
+            ClusterSpec.
+        """
+        test.execute_expand_script(ms_node, SPEC_DUMP_SCRIPT,
+                                   cluster_filename=cluster_filename)
+        stdout, _, ret = test.run_command(
+            ms_node, "/bin/cat {0}".format(SPEC_DUMP_FILE))
+        test.assertEqual(0, ret)
+        return cls.parse(stdout)
+
+    def get(self, name, index):
+        """
+        Returns:
+            str. Element index of the array name.
+        Raises:
+            KeyError if the spec does not define it.
+        """
+        try:
+            return self.arrays[name][index]
+        except KeyError:
+            raise KeyError("{0}[{1}] is not set in the cluster spec".format(
+                name, index))
+
+
+def _offset_address(value, offset):
+    """IPv4/IPv6 address (optionally with /prefix) moved by offset"""
+    address, sep, prefix = value.partition('/')
+    family = socket.AF_INET6 if ':' in address else socket.AF_INET
+    packed = socket.inet_pton(family, address)
+    number = int(binascii.hexlify(packed), 16) + offset
+    width = len(packed) * 2
+    packed = binascii.unhexlify("{0:0{1}x}".format(number, width))
+    return socket.inet_ntop(family, packed) + sep + prefix
+
+
+def _continue_value(name, value, index, offset):
+    """
+    Description:
+        Derive the value of element index of array name from the value
+        of the element offset positions before it.
+    """
+    if name.endswith('_mac'):
+        # locally administered, unique per interface and index
+        nic = re.search(r'eth(\d+)', name)
+        nic = int(nic.group(1)) if nic else \
+            zlib.crc32(name.encode('utf-8')) & 0xff
+        return "02:00:{0:02x}:{1:02x}:{2:02x}:{3:02x}".format(
+            (index >> 16) & 0xff, (index >> 8) & 0xff, index & 0xff, nic)
+    try:
+        return _offset_address(value, offset)
+    except (socket.error, ValueError, TypeError):
+        pass
+    if _HEX_RE.match(value) and 'uuid' in name:
+        return "{0:0{1}x}".format(int(value, 16) + offset, len(value))
+    match = _TRAILING_NUMBER_RE.match(value)
+    if match is not None:
+        return "{0}{1}".format(match.group(1), int(match.group(2)) + offset)
+    return "{0}{1}".format(value, index)
+
+
+class SyntheticClusterSpec(ClusterSpec):
+    """
+    Cluster spec extended past its last node.
+
+    Elements beyond the spec are derived from the highest element the
+    spec defines: addresses and uuids are offset, trailing numbers of
+    hostnames and system names are incremented and MAC addresses are
+    generated in the locally administered range. The derived values
+    are only unique among themselves and the spec, which is what model
+    level scale tests need.
+    """
+
+    def get(self, name, index):
+        """
+        Returns:
+            str. Element index of array name, derived if the spec does
+            not define it.
+        """
+        elements = self.arrays.get(name)
+        if not elements:
+            raise KeyError("{0} is not set in the cluster spec".format(name))
+        if index in elements:
+            return elements[index]
+        last = max(elements)
+        return _continue_value(name, elements[last], index, index - last)
+
+
+class Topology(object):
+    """
+    Number of expansion nodes per cluster, e.g. Topology.parse('c1=1,c2=2')
+    for node2 in c1 and node3, node4 in c2.
+    """
+
+    def __init__(self, clusters):
+        """
+        Args:
+            clusters (list): (cluster id, number of new nodes) pairs.
+        """
+        self.clusters = list(clusters)
+
+    @classmethod
+    def parse(cls, text):
+        """
+        Returns:
+            Topology. From 'cluster_id=count,...'.
+        """
+        clusters = []
+        for part in text.split(','):
+            cluster_id, _, count = part.strip().partition('=')
+            clusters.append((cluster_id, int(count)))
+        return cls(clusters)
+
+    @classmethod
+    def spread(cls, node_count, cluster_count, prefix='c', first=1):
+        """
+        Returns:
+            Topology. node_count nodes spread evenly over cluster_count
+            clusters named <prefix><first>, <prefix><first + 1>, ...
+        """
+        per_cluster, extra = divmod(node_count, cluster_count)
+        return cls(("{0}{1}".format(prefix, first + number),
+                    per_cluster + (1 if number < extra else 0))
+                   for number in range(cluster_count))
+
+    def __len__(self):
+        return sum(count for _, count in self.clusters)
+
+    def placements(self, first_index=1):
+        """
+        Returns:
+            generator. (spec index, cluster id) of every new node.
+        """
+        index = first_index
+        for cluster_id, count in self.clusters:
+            for _ in range(count):
+                yield index, cluster_id
+                index += 1
+
+
+class ItemSpec(object):
+    """An item to create, or a reference to an inherited one"""
+    __slots__ = ('item_id', 'item_type', 'props', 'source_path',
+                 'children')
+
+    def __init__(self, item_id, item_type, props=None, source_path=None):
+        self.item_id = item_id
+        self.item_type = item_type
+        self.props = props if props is not None else OrderedDict()
+        self.source_path = source_path
+        self.children = OrderedDict()
+
+
+class ExpansionBuilder(object):
+    """
+    Collects create/inherit operations and turns them into LITP xml.
+
+    Item types of inherit sources and of the collections are taken from
+    the model snapshot, so the generated xml matches what 'litp export'
+    prints for the same items.
+
+    Example:
+        builder = ExpansionBuilder(ModelSnapshot(self, self.test_ms))
+        builder.create('/infrastructure/systems/sys3', 'blade',
+                       system_name='CZ3')
+        builder.inherit(node_url + '/system', '/infrastructure/systems/sys3')
+        builder.load(self, self.test_ms)
+    """
+
+    def __init__(self, model):
+        """
+        Args:
+            model (ModelSnapshot): Snapshot of the model being expanded.
+        """
+        self.model = model
+        self.created = OrderedDict()
+        self._collection_types = None
+        self._prop_order = None
+
+    def create(self, url, item_type, props=None, **kwargs):
+        """
+        Description:
+            Equivalent of 'litp create -p url -t item_type -o props'.
+        Args:
+            url (str): Path of the new item.
+            item_type (str): Item type.
+            props (list): (name, value) pairs, for names that are not
+                valid keywords; kwargs are added after them.
+        """
+        values = OrderedDict(props or [])
+        values.update(sorted(kwargs.items()))
+        self.created[url] = ItemSpec(url.rsplit('/', 1)[1], item_type,
+                                     values)
+
+    def inherit(self, url, source_path, **props):
+        """
+        Description:
+            Equivalent of 'litp inherit -p url -s source_path'.
+        """
+        source = self.created.get(source_path) or \
+            self.model.get(source_path)
+        if source is None:
+            raise ValueError("Inherit source {0} does not exist".format(
+                source_path))
+        self.created[url] = ItemSpec(url.rsplit('/', 1)[1],
+                                     source.item_type,
+                                     OrderedDict(sorted(props.items())),
+                                     source_path=source_path)
+
+    def _index_model(self):
+        """Collection types and property order of the existing items"""
+        self._collection_types = {}
+        self._prop_order = {}
+        for item in self.model.items.values():
+            self._prop_order.setdefault(item.item_type, list(item.props))
+            if item.is_collection:
+                parent = self.model.get(self.model.parent_url(item.url))
+                if parent is not None:
+                    self._collection_types.setdefault(
+                        (parent.item_type, item.url.rsplit('/', 1)[1]),
+                        item.item_type)
+
+    def collection_type(self, parent_type, name):
+        """
+        Returns:
+            str. Type of collection name under an item of parent_type,
+            as exported by LITP, e.g. 'node-network_interfaces-collection'.
+        """
+        if self._collection_types is None:
+            self._index_model()
+        return self._collection_types.get(
+            (parent_type, name),
+            "{0}-{1}-collection".format(parent_type, name))
+
+    def _tree(self):
+        """
+        Returns:
+            OrderedDict. url of an existing collection -> ItemSpec tree
+            of the new items to merge into it.
+        Raises:
+            ValueError if an item's parent neither exists nor is created.
+        """
+        roots = OrderedDict()
+        for url, spec in self.created.items():
+            parent_url = self.model.parent_url(url)
+            grandparent_url = self.model.parent_url(url, 2)
+            if parent_url in self.created:
+                # child item, e.g. .../nodes/n2/system
+                self.created[parent_url].children[spec.item_id] = spec
+            elif grandparent_url in self.created:
+                # item in a collection of a new item, e.g. .../n2/items/x
+                parent = self.created[grandparent_url]
+                name = parent_url.rsplit('/', 1)[1]
+                collection = parent.children.get(name)
+                if collection is None:
+                    collection = parent.children[name] = ItemSpec(
+                        name, self.collection_type(parent.item_type, name))
+                collection.children[spec.item_id] = spec
+            else:
+                existing = self.model.get(parent_url)
+                if existing is None or not existing.is_collection:
+                    raise ValueError(
+                        "{0} must be created in an existing collection or "
+                        "with its parent".format(url))
+                collection = roots.get(parent_url)
+                if collection is None:
+                    collection = roots[parent_url] = ItemSpec(
+                        parent_url.rsplit('/', 1)[1], existing.item_type)
+                collection.children[spec.item_id] = spec
+        return roots
+
+    def _element(self, spec, parent=None):
+        """Build the xml element of spec and its children"""
+        tag = "{{{0}}}{1}".format(
+            LITP_NS, spec.item_type + ('-inherit' if spec.source_path
+                                       else ''))
+        if parent is None:
+            element = ElementTree.Element(tag)
+        else:
+            element = ElementTree.SubElement(parent, tag)
+        element.set('id', spec.item_id)
+        if spec.source_path:
+            element.set('source_path', spec.source_path)
+
+        order = self._prop_order.get(spec.item_type, [])
+        names = [name for name in order if name in spec.props] + \
+            [name for name in spec.props if name not in order]
+        for name in names:
+            ElementTree.SubElement(element, name).text = str(
+                spec.props[name])
+        for child in spec.children.values():
+            self._element(child, element)
+        return element
+
+    def documents(self):
+        """
+        Returns:
+            list. (path to load at, xml string) per existing collection
+            that receives new items.
+        """
+        if self._collection_types is None:
+            self._index_model()
+        documents = []
+        # systems, storage etc. first: the new nodes inherit from them
+        roots = sorted(self._tree().items(),
+                       key=lambda root: root[0].startswith('/deployments'))
+        for collection_url, spec in roots:
+            root = self._element(spec)
+            root.set("{{{0}}}schemaLocation".format(XSI_NS), SCHEMA_LOCATION)
+            xml = ElementTree.tostring(root)
+            if not isinstance(xml, str):
+                xml = xml.decode('utf-8')
+            documents.append((self.model.parent_url(collection_url),
+                              "<?xml version='1.0' encoding='utf-8'?>\n" +
+                              xml))
+        return documents
+
+    def get_cmd(self):
+        """
+        Returns:
+            str. One shell command that writes every document to a
+            temporary file and loads it.
+        """
+        parts = ['_xdir=$(mktemp -d)']
+        for index, (path, xml) in enumerate(self.documents()):
+            xml_file = '"$_xdir/expansion{0}.xml"'.format(index)
+            encoded = base64.b64encode(_gzip(xml.encode('utf-8')))
+            parts.append("echo {0} | base64 -d | gunzip > {1}".format(
+                encoded.decode('ascii'), xml_file))
+            parts.append(LITP_LOAD_CMD.format(path, xml_file))
+        return " && ".join(parts) + '; _rc=$?; rm -rf "$_xdir"; exit $_rc'
+
+    def load(self, test, ms_node):
+        """
+        Description:
+            Load all the created items into the model in one
+            run_command call.
+        Args:
+            test (GenericTest): Test case whose run_command is used.
+            ms_node (str): Filename of the MS.
+        """
+        _, stderr, ret = test.run_command(ms_node, self.get_cmd())
+        test.assertEqual(0, ret, "litp load failed: {0}".format(
+            "\n".join(stderr)))
+        test.assertEqual([], stderr)
+        self.model.invalidate()
+
+
+_FIREWALL_RULES = (
+    ('fw_nfsudp', [('name', '011 nfsudp'), ('dport', '111,2049,4001'),
+                   ('proto', 'udp')]),
+    ('fw_nfstcp', [('name', '001 nfstcp'), ('dport', '111,2049,4001,12987'),
+                   ('proto', 'tcp')]),
+    ('fw_icmp_ip6', [('name', '101 icmpipv6'), ('proto', 'ipv6-icmp')]),
+    ('fw_dhcpudp', [('name', '400 dhcp'), ('proto', 'udp'), ('dport', '67'),
+                    ('provider', 'iptables')]),
+    ('fw_dhcpsynctcp', [('name', '401 dhcpsync'), ('proto', 'tcp'),
+                        ('dport', '647'), ('provider', 'iptables')]),
+    ('fw_dnstcp', [('name', '200 dnstcp'), ('dport', '53'),
+                   ('proto', 'tcp')]),
+    ('fw_dnsudp', [('name', '053 dnsudp'), ('dport', '53'),
+                   ('proto', 'udp')]),
+)
+
+_NODE_INHERITS = (
+    ('os', '/software/profiles/os_prof1'),
+    ('storage_profile', '/infrastructure/storage/storage_profiles/profile_1'),
+    ('items/ntp1', '/software/items/ntp1'),
+    ('items/java', '/software/items/jdk'),
+    ('items/dovecot', '/software/items/dovecot'),
+    ('routes/traffic2_gw', '/infrastructure/networking/routes/traffic2_gw'),
+    ('routes/r1', '/infrastructure/networking/routes/r1'),
+    ('routes/r2_ipv6', '/infrastructure/networking/routes/default_ipv6'),
+    ('file_systems/mfs2', '/infrastructure/storage/nfs_mounts/mount2'),
+    ('services/sentinel', '/software/services/sentinel'),
+)
+
+_LOGROTATE_POSTROTATE = ("/bin/kill -HUP `cat /var/run/syslogd.pid "
+                         "2> /dev/null` 2> /dev/null || true")
+
+
+def add_pxe_expansion_node(builder, spec, index, cluster_url):
+    """
+    Description:
+        Add the items expandscripts/expand_cloud_c*_mn*_pxe.sh create for
+        element index of the cluster spec: system sys<index + 2> with
+        its disk and BMC, and node n<index + 1> of cluster_url.
+    Args:
+        builder (ExpansionBuilder): Builder to add the items to.
+        spec (ClusterSpec): Cluster spec of the deployment.
+        index (int): Index of the node in the spec arrays.
+        cluster_url (str): Url of the cluster the node joins.
+    Returns:
+        str. Url of the new node.
+    """
+    def value(name):
+        """Element index of a node_expansion_* array"""
+        return spec.get(name, index)
+
+    sys_url = "/infrastructure/systems/sys{0}".format(index + 2)
+    builder.create(sys_url, 'blade',
+                   system_name=value('node_expansion_sysname'))
+    builder.create(sys_url + '/disks/disk0', 'disk',
+                   [('name', 'sda'), ('size', '40G'), ('bootable', 'true'),
+                    ('uuid', value('node_expansion_disk_uuid'))])
+    builder.create(sys_url + '/bmc', 'bmc',
+                   [('username', 'no-user'), ('password_key', 'key-for-user'),
+                    ('ipaddress', value('node_expansion_ip'))])
+
+    node_url = "{0}/nodes/n{1}".format(cluster_url, index + 1)
+    builder.create(node_url, 'node',
+                   hostname=value('node_expansion_hostname'))
+    builder.inherit(node_url + '/system', sys_url)
+    for path, source in _NODE_INHERITS:
+        builder.inherit("{0}/{1}".format(node_url, path), source)
+
+    configs = node_url + '/configs'
+    builder.create(configs + '/logrotate', 'logrotate-rule-config')
+    builder.create(configs + '/logrotate/rules/messages', 'logrotate-rule',
+                   [('name', 'syslog'),
+                    ('path', '/var/log/messages,/var/log/cron,'
+                             '/var/log/maillog,/var/log/secure,'
+                             '/var/log/spooler'),
+                    ('size', '10M'), ('rotate', '50'),
+                    ('copytruncate', 'true'), ('sharedscripts', 'true'),
+                    ('postrotate', _LOGROTATE_POSTROTATE)])
+
+    nics = node_url + '/network_interfaces'
+    builder.create(nics + '/b0', 'bond',
+                   [('device_name', 'bondmgmt'), ('network_name', 'mgmt'),
+                    ('miimon', '100'),
+                    ('ipaddress', value('node_expansion_ip')),
+                    ('ipv6address', value('node_expansion_ipv6_00'))])
+    for nic_id, extra in (('if0', [('master', 'bondmgmt')]),
+                          ('if7', [('master', 'bondmgmt')]),
+                          ('if1', [('pxe_boot_only', 'true')]),
+                          ('if2', [('network_name', 'hb1')]),
+                          ('if3', [('network_name', 'hb2')]),
+                          ('if4', [('network_name', 'traffic1'),
+                                   ('ipaddress',
+                                    value('node_expansion_ip_2'))]),
+                          ('if5', [('network_name', 'traffic2'),
+                                   ('ipaddress',
+                                    value('node_expansion_ip_3'))]),
+                          ('if6', [('bridge', 'br6')])):
+        device = 'eth' + nic_id[2:]
+        builder.create("{0}/{1}".format(nics, nic_id), 'eth',
+                       [('device_name', device),
+                        ('macaddress',
+                         value('node_expansion_{0}_mac'.format(device)))] +
+                       extra)
+    builder.create(nics + '/br6', 'bridge',
+                   [('device_name', 'br6'), ('forwarding_delay', '4'),
+                    ('network_name', 'dhcp_network'),
+                    ('ipaddress', spec.get('dhcp_expansion_ip_1', index))])
+
+    builder.create(configs + '/fw_config_init', 'firewall-node-config')
+    for rule_id, props in _FIREWALL_RULES:
+        builder.create("{0}/fw_config_init/rules/{1}".format(
+            configs, rule_id), 'firewall-rule', props)
+
+    builder.create(configs + '/init_config', 'sysparam-node-config')
+    builder.create(configs + '/init_config/params/sysctrl_01', 'sysparam',
+                   [('key', 'net.ipv4.tcp_wmem'),
+                    ('value', '4096 65536 16777215')])
+
+    builder.create(configs + '/dns_client', 'dns-client',
+                   search='ammeonvpn.com,exampleone.com,exampletwo.com,'
+                          'examplethree.com,examplefour.com,'
+                          'examplefive.com')
+    builder.create(configs + '/dns_client/nameservers/init_name_server',
+                   'nameserver', [('ipaddress', '10.44.86.212'),
+                                  ('position', '1')])
+    return node_url
+
+
+def generate_expansion(builder, spec, topology,
+                       deployment_url='/deployments/d1', first_index=1,
+                       cluster_props=None):
+    """
+    Description:
+        Add the items of every node of topology to builder, creating
+        the vcs-clusters that do not exist yet.
+    Args:
+        builder (ExpansionBuilder): Builder to add the items to.
+        spec (ClusterSpec): Cluster spec; use SyntheticClusterSpec for
+            more nodes than the spec file describes.
+        topology (Topology): Clusters and their number of new nodes.
+        deployment_url (str): Deployment holding the clusters.
+        first_index (int): Spec index of the first new node; index i
+            becomes node n<i + 1> on system sys<i + 2>.
+        cluster_props (list): (name, value) properties of new clusters,
+            DEFAULT_CLUSTER_PROPS by default.
+    Returns:
+        list. Urls of the new nodes.
+    """
+    clusters_url = deployment_url + '/clusters'
+    new_cluster_id = FIRST_GENERATED_CLUSTER_ID
+    for cluster_id, _ in topology.clusters:
+        cluster_url = "{0}/{1}".format(clusters_url, cluster_id)
+        if builder.model.get(cluster_url) is None and \
+                cluster_url not in builder.created:
+            builder.create(cluster_url, 'vcs-cluster',
+                           list(cluster_props or DEFAULT_CLUSTER_PROPS) +
+                           [('cluster_id', str(new_cluster_id))])
+            new_cluster_id += 1
+
+    return [add_pxe_expansion_node(builder, spec, index,
+                                   "{0}/{1}".format(clusters_url, cluster_id))
+            for index, cluster_id in topology.placements(first_index)]
@@ -0,0 +1,641 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   In-process stand-in for a deployment: a fake LITP model that
+            answers the litp CLI on the MS, and a command responder that
+            answers every other command from recorded fixtures.
+
+            A fixture is a directory holding:
+                nodes.json     {"ms": "ms1", "nodes": {"node1": "<url>"}}
+                model/*.xml    'litp export' of the top level paths
+                commands.json  ordered list of responses (see
+                               CommandResponder)
+                outputs/       long outputs referenced by commands.json
+                plan.json      optional task templates (see FakeLitp)
+                transcript.jsonl.gz
+                               optional recorded run, see transcript_utils
+"""
+import base64
+import copy
+import fnmatch
+import glob
+import gzip
+import io
+import json
+import os
+import re
+import shlex
+import threading
+from collections import OrderedDict
+import xml.etree.ElementTree as ElementTree
+
+from bundle_utils import CommandBundle
+from expansion_utils import LITP_NS
+from model_snapshot_utils import INHERIT_SUFFIX, COLLECTION_SUFFIX
+from plan_watch_utils import PlanTask, TASK_INITIAL, TASK_SUCCESS, \
+    TASK_STATES, PLAN_SUCCESSFUL
+from transcript_utils import TranscriptReplayer, read_transcript, \
+    FIXTURE_TRANSCRIPT
+
+STATE_APPLIED = 'Applied'
+STATE_INITIAL = 'Initial'
+STATE_UPDATED = 'Updated'
+STATE_FOR_REMOVAL = 'ForRemoval'
+
+PLAN_INITIAL = 'Initial'
+
+# Tasks create_plan generates per item type, one phase per template.
+# Templates are formatted with the item's properties; items lacking a
+# property a template uses get no task from it.
+DEFAULT_TASK_TEMPLATES = {
+    'node': ['Create "RHEL7" partition kickstart snippet for node '
+             '"{hostname}"'],
+}
+
+_LITP_FLAGS = ('-p', '-t', '-s', '-o', '-d', '-f', '-r', '-j')
+_SHELL_SYNTAX_RE = re.compile(r'[;&|<>`]|\$\(')
+
+# The steps of ExpansionBuilder.get_cmd(): a temporary directory, the
+# xml documents decoded into it and one litp load per document
+_LOAD_SCRIPT_START = '_xdir=$(mktemp -d)'
+_LOAD_SCRIPT_WRITE_RE = re.compile(
+    r'^echo (?P<data>\S+) \| base64 -d \| gunzip > (?P<path>\S+)$')
+
+
+class FakeLitpError(Exception):
+    """A litp CLI error; lines holds what the CLI prints on stderr"""
+
+    def __init__(self, error_type, message, url=None):
+        super(FakeLitpError, self).__init__(message)
+        self.lines = ([url] if url else []) + [
+            "{0}    {1}".format(error_type, message)]
+
+
+class FakeItem(object):
+    """One item of the fake model"""
+    __slots__ = ('url', 'item_type', 'props', 'source_path', 'state',
+                 'children')
+
+    def __init__(self, url, item_type, props=None, source_path=None,
+                 state=STATE_APPLIED):
+        self.url = url
+        self.item_type = item_type
+        self.props = OrderedDict(props or [])
+        self.source_path = source_path
+        self.state = state
+        self.children = []
+
+
+def _local_name(tag):
+    """Strip the xml namespace from a tag"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _parse_args(args):
+    """
+    Returns:
+        dict. flag -> list of values, e.g. {'-p': ['/x'], '-o': [...]}
+    """
+    options = {}
+    flag = None
+    for arg in args:
+        if arg in _LITP_FLAGS or arg.startswith('--'):
+            flag = arg
+            options.setdefault(flag, [])
+        elif flag is not None:
+            options[flag].append(arg)
+    return options
+
+
+def _split_props(values):
+    """'name=value' arguments of -o as (name, value) pairs"""
+    return [tuple(value.split('=', 1)) for value in values if '=' in value]
+
+
+class FakeLitp(object):
+    """
+    A LITP model and plan that answer the litp CLI.
+
+    Items loaded from the fixture are Applied. create, inherit, update,
+    remove and load change the item states as LITP does; create_plan makes
+    one task per template of DEFAULT_TASK_TEMPLATES (or the fixture's
+    plan.json) for every Initial item, run_plan completes every task at
+    once and applies the model.
+    """
+
+    def __init__(self, documents, task_templates=None):
+        """
+        Args:
+            documents (list): Exported xml documents of the model.
+            task_templates (dict): Item type -> list of task
+                description templates, DEFAULT_TASK_TEMPLATES by
+                default.
+        """
+        self.documents = list(documents)
+        self.task_templates = dict(DEFAULT_TASK_TEMPLATES,
+                                   **(task_templates or {}))
+        self.items = OrderedDict()
+        self.plan = None
+        self.plan_status = None
+        self._applied = None
+        self.reset()
+
+    def reset(self):
+        """Reload the fixture model and drop the plan"""
+        self.items = OrderedDict()
+        for document in self.documents:
+            if not isinstance(document, bytes):
+                document = document.encode('utf-8')
+            self._add_element(ElementTree.fromstring(document), '')
+        self._applied = copy.deepcopy(self.items)
+        self.plan = None
+        self.plan_status = None
+
+    def _add_element(self, element, parent_url):
+        """Add an exported element and its descendants as Applied"""
+        item_type = _local_name(element.tag)
+        if item_type.endswith(INHERIT_SUFFIX):
+            item_type = item_type[:-len(INHERIT_SUFFIX)]
+        item = self._add(FakeItem("{0}/{1}".format(parent_url,
+                                                   element.get('id')),
+                                  item_type,
+                                  source_path=element.get('source_path')))
+        for child in element:
+            if child.get('id') is not None:
+                self._add_element(child, item.url)
+            elif child.text is not None:
+                item.props[_local_name(child.tag)] = child.text.strip()
+
+    def _add(self, item):
+        """Index an item under its parent"""
+        self.items[item.url] = item
+        parent = self.items.get(item.url.rsplit('/', 1)[0])
+        if parent is not None:
+            parent.children.append(item.url)
+        return item
+
+    def _get(self, url):
+        """The live item at url, or raise InvalidLocationError"""
+        item = self.items.get(url.rstrip('/'))
+        if item is None or item.state == STATE_FOR_REMOVAL:
+            raise FakeLitpError('InvalidLocationError',
+                                'Not found', url)
+        return item
+
+    def _descendants(self, item):
+        """item and everything below it"""
+        stack = [item]
+        while stack:
+            current = stack.pop()
+            yield current
+            stack.extend(self.items[url] for url in current.children)
+
+    def _new_item(self, url, item_type, props=(), source_path=None):
+        """Create an Initial item, and its missing parent collection"""
+        url = url.rstrip('/')
+        existing = self.items.get(url)
+        if existing is not None and existing.state != STATE_FOR_REMOVAL:
+            raise FakeLitpError('ItemExistsError',
+                                'Item already exists in model', url)
+        parent_url = url.rsplit('/', 1)[0]
+        if parent_url not in self.items:
+            grandparent = self._get(parent_url.rsplit('/', 1)[0])
+            # LITP creates the collections of an item with the item
+            self._add(FakeItem(parent_url, "{0}-{1}{2}".format(
+                grandparent.item_type, parent_url.rsplit('/', 1)[1],
+                COLLECTION_SUFFIX), state=STATE_INITIAL))
+        if existing is not None:
+            self._delete(existing)
+        return self._add(FakeItem(url, item_type, props, source_path,
+                                  state=STATE_INITIAL))
+
+    def _delete(self, item):
+        """Drop an item and its descendants from the model"""
+        for descendant in list(self._descendants(item)):
+            del self.items[descendant.url]
+        parent = self.items.get(item.url.rsplit('/', 1)[0])
+        if parent is not None:
+            parent.children.remove(item.url)
+
+    def create(self, url, item_type, props=()):
+        """litp create"""
+        self._new_item(url, item_type, props)
+
+    def inherit(self, url, source_path, props=()):
+        """litp inherit"""
+        source = self._get(source_path)
+        self._new_item(url, source.item_type, props, source.url)
+
+    def update(self, url, props=(), deleted=()):
+        """litp update"""
+        item = self._get(url)
+        item.props.update(props)
+        for name in deleted:
+            item.props.pop(name, None)
+        if item.state == STATE_APPLIED:
+            item.state = STATE_UPDATED
+
+    def remove(self, url):
+        """litp remove; Initial items are deleted at once"""
+        item = self._get(url)
+        if item.state == STATE_INITIAL:
+            self._delete(item)
+            return
+        for descendant in self._descendants(item):
+            descendant.state = STATE_FOR_REMOVAL
+
+    def _load_element(self, element, parent_url, merge):
+        """Create the items of an element and its descendants, or
+        update the existing ones with merge"""
+        item_type = _local_name(element.tag)
+        source_path = element.get('source_path')
+        if item_type.endswith(INHERIT_SUFFIX):
+            item_type = item_type[:-len(INHERIT_SUFFIX)]
+        url = "{0}/{1}".format(parent_url, element.get('id'))
+        props = [(_local_name(child.tag), child.text.strip())
+                 for child in element
+                 if child.get('id') is None and child.text is not None]
+        existing = self.items.get(url)
+        if existing is None or existing.state == STATE_FOR_REMOVAL:
+            self._new_item(url, item_type, props, source_path)
+        elif not merge:
+            raise FakeLitpError('ItemExistsError',
+                                'Item already exists in model', url)
+        elif props:
+            self.update(url, props)
+        for child in element:
+            if child.get('id') is not None:
+                self._load_element(child, url, merge)
+
+    def load(self, url, document, merge=False):
+        """litp load of an exported document under url"""
+        self._get(url)
+        if not isinstance(document, bytes):
+            document = document.encode('utf-8')
+        try:
+            root = ElementTree.fromstring(document)
+        except ElementTree.ParseError as err:
+            raise FakeLitpError('InvalidXMLError', str(err))
+        self._load_element(root, url.rstrip('/'), merge)
+
+    def _element(self, item):
+        """The export element of an item"""
+        tag = item.item_type + (INHERIT_SUFFIX if item.source_path else '')
+        element = ElementTree.Element("{{{0}}}{1}".format(LITP_NS, tag))
+        element.set('id', item.url.rsplit('/', 1)[1])
+        if item.source_path:
+            element.set('source_path', item.source_path)
+        for name, value in item.props.items():
+            ElementTree.SubElement(element, name).text = value
+        for url in item.children:
+            child = self.items[url]
+            if child.state != STATE_FOR_REMOVAL:
+                element.append(self._element(child))
+        return element
+
+    def export(self, url):
+        """
+        Returns:
+            list. Lines printed by 'litp export -p url'.
+        """
+        xml = ElementTree.tostring(self._element(self._get(url)))
+        if isinstance(xml, bytes):
+            xml = xml.decode('utf-8')
+        return ['<?xml version="1.0" encoding="utf-8"?>', xml]
+
+    def show(self, url):
+        """
+        Returns:
+            list. Lines printed by 'litp show -p url'.
+        """
+        item = self._get(url)
+        lines = [item.url, "    type: {0}".format(item.item_type),
+                 "    state: {0}".format(item.state)]
+        if item.source_path:
+            lines.append("    inherited from: {0}".format(item.source_path))
+        if item.props:
+            lines.append("    properties:")
+            lines.extend("        {0}: {1}".format(name, value)
+                         for name, value in item.props.items())
+        return lines
+
+    def create_plan(self):
+        """litp create_plan"""
+        phases = {}
+        for item in self.items.values():
+            if item.state != STATE_INITIAL:
+                continue
+            templates = self.task_templates.get(item.item_type, [])
+            for number, template in enumerate(templates):
+                try:
+                    description = template.format(**item.props)
+                except KeyError:
+                    continue
+                phases.setdefault(number, []).append(PlanTask(
+                    "Phase {0}".format(number + 1), TASK_INITIAL,
+                    item.url, description))
+        if not phases:
+            raise FakeLitpError('DoNothingPlanError',
+                                'Create plan failed: no tasks were '
+                                'generated')
+        self.plan = [phases[number] for number in sorted(phases)]
+        self.plan_status = PLAN_INITIAL
+
+    def _require_plan(self):
+        """The current plan, or raise InvalidLocationError"""
+        if self.plan is None:
+            raise FakeLitpError('InvalidLocationError',
+                                'Plan does not exist', '/plans/plan')
+        return self.plan
+
+    def run_plan(self):
+        """litp run_plan; the whole plan succeeds immediately"""
+        if self.plan_status != PLAN_INITIAL:
+            self._require_plan()
+            raise FakeLitpError('InvalidRequestError',
+                                'Plan not in initial state')
+        for phase in self.plan:
+            for task in phase:
+                task.state = TASK_SUCCESS
+        for item in list(self.items.values()):
+            if item.url not in self.items:
+                continue
+            if item.state == STATE_FOR_REMOVAL:
+                self._delete(item)
+            else:
+                item.state = STATE_APPLIED
+        self._applied = copy.deepcopy(self.items)
+        self.plan_status = PLAN_SUCCESSFUL
+
+    def stop_plan(self):
+        """litp stop_plan; plans never run long enough to stop"""
+        self._require_plan()
+        raise FakeLitpError('InvalidRequestError',
+                            'Plan not currently running')
+
+    def remove_plan(self):
+        """litp remove_plan"""
+        self._require_plan()
+        self.plan = None
+        self.plan_status = None
+
+    def restore_model(self):
+        """litp restore_model: back to the last applied model"""
+        self.items = copy.deepcopy(self._applied)
+        self.plan = None
+        self.plan_status = None
+
+    def show_plan(self):
+        """
+        Returns:
+            list. Lines printed by 'litp show_plan'.
+        """
+        lines = []
+        counts = dict((state, 0) for state in TASK_STATES)
+        for number, phase in enumerate(self._require_plan(), 1):
+            lines.extend(['Phase {0}'.format(number), '-' * 60,
+                          'Task status', '-----------'])
+            for task in phase:
+                counts[task.state] += 1
+                lines.extend(["{0}\t\t{1}".format(task.state, task.url),
+                              "\t\t{0}".format(task.description), ""])
+        lines.append("Tasks: {0} | {1}".format(
+            sum(counts.values()),
+            " | ".join("{0}: {1}".format(state, counts[state])
+                       for state in TASK_STATES)))
+        lines.append("Plan Status: {0}".format(self.plan_status))
+        return lines
+
+    def run(self, args, files=None):
+        """
+        Description:
+            Run one litp CLI command.
+        Args:
+            args (list): Arguments after 'litp'.
+            files (dict): Path -> content of the files load can read.
+        Returns:
+            tuple. (stdout lines, stderr lines, rc)
+        """
+        if not args:
+            return [], ['usage: litp <command> ...'], 2
+        command, options = args[0], _parse_args(args[1:])
+        url = (options.get('-p') or [None])[0]
+        props = _split_props(options.get('-o', []))
+        files = files or {}
+
+        def load():
+            """load the file given with -f"""
+            path = options['-f'][0]
+            if path not in files:
+                raise FakeLitpError('InvalidRequestError',
+                                    'File not found: ' + path)
+            self.load(url, files[path], '--merge' in options)
+        handlers = {
+            'create': lambda: self.create(url, options['-t'][0], props),
+            'inherit': lambda: self.inherit(url, options['-s'][0], props),
+            'update': lambda: self.update(url, props, options.get('-d', [])),
+            'remove': lambda: self.remove(url),
+            'export': lambda: self.export(url),
+            'show': lambda: self.show(url),
+            'load': load,
+            'create_plan': self.create_plan,
+            'run_plan': self.run_plan,
+            'stop_plan': self.stop_plan,
+            'remove_plan': self.remove_plan,
+            'restore_model': self.restore_model,
+            'show_plan': self.show_plan,
+        }
+        if command not in handlers:
+            return [], ["{0}: not supported by the fake MS".format(
+                command)], 1
+        try:
+            return handlers[command]() or [], [], 0
+        except FakeLitpError as error:
+            return [], error.lines, 1
+        except (KeyError, IndexError):
+            return [], ["{0}: missing arguments".format(command)], 2
+
+
+class CommandResponder(object):
+    """
+    Recorded command outputs. Each response is a dict with:
+        cmd      regular expression searched in the command
+        node     fnmatch pattern of node filenames, '*' by default
+        user     'root' to only answer su_root commands, any other
+                 value to only answer the others
+        out/err  lines, or out_file/err_file relative to the fixture
+        rc       return code, 0 by default
+    The first matching response wins.
+    """
+
+    def __init__(self, responses, base_dir='.'):
+        self.responses = []
+        for response in responses:
+            response = dict(response)
+            response['regex'] = re.compile(response['cmd'])
+            for stream in ('out', 'err'):
+                filename = response.pop(stream + '_file', None)
+                if filename is not None:
+                    with open(os.path.join(base_dir, filename)) as out_file:
+                        response[stream] = out_file.read().splitlines()
+            self.responses.append(response)
+
+    def respond(self, node, cmd, su_root=False):
+        """
+        Returns:
+            tuple. (stdout, stderr, rc), None if nothing matches.
+        """
+        for response in self.responses:
+            user = response.get('user')
+            if user is not None and (user == 'root') != bool(su_root):
+                continue
+            if not fnmatch.fnmatch(node, response.get('node', '*')):
+                continue
+            if response['regex'].search(cmd):
+                return (list(response.get('out', [])),
+                        list(response.get('err', [])),
+                        response.get('rc', 0))
+        return None
+
+
+class FakeDeployment(object):
+    """
+    The MS and peer nodes of a fixture. run() has the run_command
+    contract and is thread safe.
+
+    Example:
+        deployment = FakeDeployment.load('fixtures/two_node')
+        out, err, rc = deployment.run('ms1', '/usr/bin/litp show_plan')
+    """
+
+    def __init__(self, ms_node, nodes, litp, responder, replayer=None):
+        """
+        Args:
+            ms_node (str): Filename of the MS.
+            nodes (dict): Filename -> url of every peer node.
+            litp (FakeLitp): Model answering the litp CLI on the MS.
+            responder (CommandResponder): Every other command.
+            replayer (TranscriptReplayer): Recorded calls, used for the
+                commands the responder does not answer.
+        """
+        self.ms_node = ms_node
+        self.nodes = OrderedDict(sorted(nodes.items()))
+        self.litp = litp
+        self.responder = responder
+        self.replayer = replayer
+        self.unmatched = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, fixture_dir):
+        """
+        Returns:
+            FakeDeployment. Built from a fixture directory.
+        """
+        def read_json(name, default=None):
+            """Load a json file of the fixture"""
+            path = os.path.join(fixture_dir, name)
+            if not os.path.exists(path):
+                return default
+            with open(path) as json_file:
+                return json.load(json_file)
+
+        documents = []
+        for path in sorted(glob.glob(os.path.join(fixture_dir, 'model',
+                                                  '*.xml'))):
+            with open(path) as xml_file:
+                documents.append(xml_file.read())
+        nodes = read_json('nodes.json')
+        transcript = os.path.join(fixture_dir, FIXTURE_TRANSCRIPT)
+        replayer = None
+        if os.path.exists(transcript):
+            replayer = TranscriptReplayer(read_transcript(transcript))
+        return cls(nodes['ms'], nodes.get('nodes', {}),
+                   FakeLitp(documents, read_json('plan.json')),
+                   CommandResponder(read_json('commands.json', []),
+                                    fixture_dir), replayer)
+
+    def reset(self):
+        """Back to the fixture state, as a reverted test leaves it"""
+        with self._lock:
+            self.litp.reset()
+
+    def _litp_args(self, cmd):
+        """The litp arguments of cmd, None if it is not a lone litp
+        call"""
+        if _SHELL_SYNTAX_RE.search(cmd):
+            return None
+        try:
+            args = shlex.split(cmd)
+        except ValueError:
+            return None
+        if args and os.path.basename(args[0]) == 'litp':
+            return args[1:]
+        return None
+
+    def _run_load_script(self, cmd):
+        """
+        Returns:
+            tuple. Result of an ExpansionBuilder load command, None if
+            cmd is not one.
+        """
+        steps = cmd.split(';', 1)[0].split(' && ')
+        if steps[0] != _LOAD_SCRIPT_START:
+            return None
+        files = {}
+        for step in steps[1:]:
+            match = _LOAD_SCRIPT_WRITE_RE.match(step)
+            if match is not None:
+                data = base64.b64decode(match.group('data'))
+                with gzip.GzipFile(fileobj=io.BytesIO(data)) as gz_file:
+                    files[shlex.split(match.group('path'))[0]] = \
+                        gz_file.read()
+                continue
+            args = self._litp_args(step)
+            if args is None:
+                return None
+            with self._lock:
+                result = self.litp.run(args, files)
+            if result[2] != 0:
+                return result
+        return [], [], 0
+
+    def _run_one(self, node, cmd, su_root):
+        """Answer a single command"""
+        if node == self.ms_node:
+            args = self._litp_args(cmd)
+            if args is not None:
+                with self._lock:
+                    return self.litp.run(args)
+            result = self._run_load_script(cmd)
+            if result is not None:
+                return result
+        result = self.responder.respond(node, cmd, su_root)
+        if result is None and self.replayer is not None:
+            result = self.replayer.respond(node, cmd, su_root)
+        if result is None:
+            self.unmatched.append((node, cmd))
+            return [], ["fake: no fixture for '{0}' on {1}".format(
+                cmd, node)], 127
+        return result
+
+    def run(self, node, cmd, su_root=False):
+        """
+        Description:
+            Answer a command as node would, splitting command bundles.
+        Returns:
+            tuple. (stdout lines, stderr lines, rc)
+        """
+        bundle = CommandBundle.from_cmd(cmd)
+        if bundle is None:
+            return self._run_one(node, cmd, su_root)
+        results = [self._run_one(node, bundled, su_root)
+                   for bundled in bundle.cmds]
+        return bundle.format_results(results), [], 0
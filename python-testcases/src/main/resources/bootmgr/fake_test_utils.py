@@ -0,0 +1,163 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Runs the test sets against a FakeDeployment instead of a live
+            MS. The GenericTest calls that reach the deployment are
+            served by the fake; everything else is the framework's own.
+
+            Usage: python fake_test_utils.py <fixture dir> <module> ...
+                       [-a <attr>]
+            e.g.   python fake_test_utils.py fixtures/two_node \\
+                       testset_story588 -a story588
+"""
+import importlib
+import inspect
+import logging
+import sys
+import unittest
+
+from litp_generic_test import GenericTest
+from fake_ms_utils import FakeDeployment
+from model_snapshot_utils import ModelSnapshot
+
+_LOGGER = logging.getLogger('fake_ms')
+
+
+class FakeGenericTest(GenericTest):
+    """
+    GenericTest whose connection to the deployment is replaced by
+    the class attribute deployment, a FakeDeployment.
+
+    fake_test_case() places it after the test set in the MRO, so the
+    test set's super() calls land here rather than on GenericTest.
+    """
+    deployment = None
+
+    def setUp(self):
+        """Skips the framework set up, which reads the connection data
+        of a live deployment"""
+        # pylint: disable=bad-super-call
+        super(GenericTest, self).setUp()
+
+    def tearDown(self):
+        """Reverts the fake model, like the framework does for 'revert'
+        tests"""
+        self.deployment.reset()
+        # pylint: disable=bad-super-call
+        super(GenericTest, self).tearDown()
+
+    def log(self, level, msg):
+        """Logs to the 'fake_ms' logger"""
+        _LOGGER.log(logging.getLevelName(level.upper()), msg)
+
+    def run_command(self, node, cmd, su_root=False, default_asserts=False,
+                    **kwargs):
+        """
+        Same contract as GenericTest.run_command: returns a tuple of
+        (stdout lines, stderr lines, return code).
+        """
+        # pylint: disable=unused-argument,arguments-differ
+        stdout, stderr, ret = self.deployment.run(node, cmd, su_root)
+        if default_asserts:
+            self.assertEqual([], stderr)
+            self.assertEqual(0, ret)
+        return stdout, stderr, ret
+
+    def get_management_node_filename(self):
+        """Filename of the fixture's MS"""
+        return self.deployment.ms_node
+
+    def get_managed_node_filenames(self):
+        """Filenames of the fixture's peer nodes"""
+        return list(self.deployment.nodes)
+
+    def get_node_filename_from_url(self, ms_node, node_url):
+        """Filename of the peer node at node_url"""
+        # pylint: disable=unused-argument,arguments-differ
+        for filename, url in self.deployment.nodes.items():
+            if url == node_url.rstrip('/'):
+                return filename
+        return None
+
+    def find(self, ms_node, path, resource, rtn_type_children=True,
+             assert_not_empty=True, **kwargs):
+        """GenericTest.find answered from an export of the fake model"""
+        # pylint: disable=unused-argument,arguments-differ
+        return ModelSnapshot(self, ms_node).find(
+            path, resource, rtn_type_children, assert_not_empty)
+
+    def get_props_from_url(self, ms_node, url, filter_prop=None,
+                           **kwargs):
+        """GenericTest.get_props_from_url answered from an export of the
+        fake model"""
+        # pylint: disable=unused-argument,arguments-differ
+        return ModelSnapshot(self, ms_node).get_props(url, filter_prop)
+
+    def stop_plan_if_running(self, ms_node, **kwargs):
+        """Fake plans complete as soon as they run"""
+        # pylint: disable=unused-argument,arguments-differ
+        return True
+
+
+def fake_test_case(test_cls, deployment):
+    """
+    Returns:
+        type. A subclass of test_cls served by deployment.
+    """
+    return type('Fake' + test_cls.__name__, (test_cls, FakeGenericTest),
+                {'deployment': deployment})
+
+
+def load_suite(deployment, module_names, attrs=()):
+    """
+    Description:
+        Collect the tests of the GenericTest subclasses of the modules,
+        bound to deployment.
+    Args:
+        deployment (FakeDeployment): Deployment answering the tests.
+        module_names (list): Test set modules, e.g. 'testset_story588'.
+        attrs (tuple): Only keep tests tagged with all these attrs.
+    Returns:
+        unittest.TestSuite.
+    """
+    suite = unittest.TestSuite()
+    for module_name in module_names:
+        module = importlib.import_module(module_name)
+        for _, test_cls in inspect.getmembers(module, inspect.isclass):
+            if not issubclass(test_cls, GenericTest) or \
+                    test_cls.__module__ != module.__name__:
+                continue
+            fake_cls = fake_test_case(test_cls, deployment)
+            for name in unittest.TestLoader().getTestCaseNames(fake_cls):
+                method = getattr(fake_cls, name)
+                if all(getattr(method, tag, False) for tag in attrs):
+                    suite.addTest(fake_cls(name))
+    return suite
+
+
+def main(argv):
+    """Entry point"""
+    args = argv[1:]
+    attrs = []
+    while '-a' in args:
+        index = args.index('-a')
+        attrs.append(args[index + 1])
+        del args[index:index + 2]
+    logging.basicConfig(level=logging.INFO)
+    deployment = FakeDeployment.load(args[0])
+    result = unittest.TextTestRunner(verbosity=2).run(
+        load_suite(deployment, args[1:], attrs))
+    for node, cmd in deployment.unmatched:
+        _LOGGER.warning("no fixture for %r on %s", cmd, node)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,120 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Bounded thread pool used by the test sets to run the same
+            per-node verification on many nodes at once
+"""
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+import sys
+import traceback
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class NodeFanoutError(AssertionError):
+    """
+    Raised when the worker failed on one or more nodes.
+
+    Subclasses AssertionError so that nose reports a FAIL (not an ERROR)
+    when the per-node worker failed on one of its own assertions.
+
+    Attributes:
+        failures (OrderedDict): node -> formatted traceback of the
+            exception raised by the worker on that node.
+        results (OrderedDict): node -> return value of the worker for
+            the nodes that passed.
+    """
+
+    def __init__(self, failures, results, total):
+        self.failures = failures
+        self.results = results
+        lines = ["{0} of {1} node(s) failed:".format(len(failures), total)]
+        for node, trace in failures.items():
+            lines.append("--- {0} ---".format(node))
+            lines.append(trace.rstrip())
+        super(NodeFanoutError, self).__init__("\n".join(lines))
+
+
+class NodeFanout(object):
+    """
+    Runs a callable once per node on a bounded pool of threads.
+
+    The callable is given the node as its first argument and is expected
+    to only touch state that belongs to that node (run_command on the
+    node, assertions on its output). Results are returned in node order
+    and every failure is attributed to the node it happened on.
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Args:
+            max_workers (int): Upper bound on the number of nodes
+                processed at the same time. 1 runs the nodes serially in
+                the calling thread.
+        """
+        self.max_workers = max(1, int(max_workers))
+
+    @staticmethod
+    def _call(func, node, args, kwargs):
+        """
+        Run func for one node and capture the outcome instead of letting
+        the exception escape the worker thread.
+
+        Returns:
+            tuple. (node, passed, result or formatted traceback)
+        """
+        try:
+            return node, True, func(node, *args, **kwargs)
+        except Exception:  # pylint: disable=broad-except
+            return node, False, "".join(
+                traceback.format_exception(*sys.exc_info()))
+
+    def map(self, func, nodes, *args, **kwargs):
+        """
+        Description:
+            Call func(node, *args, **kwargs) for every node and wait for
+            all of them to finish.
+        Args:
+            func (callable): Per-node worker.
+            nodes (list): Nodes (filenames, urls, ...) to fan out over.
+        Returns:
+            OrderedDict. node -> value returned by func, in node order.
+        Raises:
+            NodeFanoutError if func raised on any node. The error lists
+            every failing node, not only the first one.
+        """
+        nodes = list(nodes)
+        workers = min(self.max_workers, len(nodes))
+
+        if workers <= 1:
+            outcomes = [self._call(func, node, args, kwargs)
+                        for node in nodes]
+        else:
+            pool = ThreadPool(workers)
+            try:
+                outcomes = pool.map(
+                    lambda node: self._call(func, node, args, kwargs),
+                    nodes, chunksize=1)
+            finally:
+                pool.close()
+                pool.join()
+
+        results = OrderedDict()
+        failures = OrderedDict()
+        for node, passed, value in outcomes:
+            if passed:
+                results[node] = value
+            else:
+                failures[node] = value
+
+        if failures:
+            raise NodeFanoutError(failures, results, len(nodes))
+        return results
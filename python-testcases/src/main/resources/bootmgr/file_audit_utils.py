@@ -0,0 +1,144 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Mode/ownership audit of the cobbler trees on the MS. One
+            'find -printf' lists every file and the output is checked
+            against declarative rules as it is parsed.
+"""
+import fnmatch
+
+COBBLER_KICKSTARTS_DIR = "/var/lib/cobbler/kickstarts"
+
+FIND_CMD = "/usr/bin/find {0} -printf '%m\\t%u\\t%g\\t%s\\t%y\\t%p\\n'"
+
+
+class FileEntry(object):
+    """Mode, ownership and size of one file as listed by find"""
+    __slots__ = ('mode', 'owner', 'group', 'size', 'ftype', 'path')
+
+    def __init__(self, mode, owner, group, size, ftype, path):
+        self.mode = mode
+        self.owner = owner
+        self.group = group
+        self.size = size
+        self.ftype = ftype
+        self.path = path
+
+    def __repr__(self):
+        return "<FileEntry {0:o} {1}:{2} {3}>".format(
+            self.mode, self.owner, self.group, self.path)
+
+
+class PermissionRule(object):
+    """
+    Expected mode/ownership for the files whose path matches a glob.
+
+    Only the attributes that are given are checked, e.g.
+    PermissionRule('/var/lib/cobbler/snippets/*', mode='644') checks the
+    mode of every regular file in the snippets directory.
+    """
+
+    def __init__(self, pattern, mode=None, owner=None, group=None,
+                 ftype='f'):
+        """
+        Args:
+            pattern (str): fnmatch glob matched against the full path.
+            mode (str): Expected octal mode, e.g. '644'.
+            owner (str): Expected owner name.
+            group (str): Expected group name.
+            ftype (str): find %y file type the rule applies to ('f'
+                regular file, 'd' directory, None for any).
+        """
+        self.pattern = pattern
+        self.mode = int(mode, 8) if mode is not None else None
+        self.owner = owner
+        self.group = group
+        self.ftype = ftype
+
+    def applies_to(self, entry):
+        """True if the rule covers the entry"""
+        return (self.ftype is None or self.ftype == entry.ftype) and \
+            fnmatch.fnmatch(entry.path, self.pattern)
+
+    def check(self, entry):
+        """
+        Returns:
+            list. (path, attribute, expected, actual) for every
+            attribute of the entry that breaks the rule.
+        """
+        violations = []
+        if self.mode is not None and entry.mode != self.mode:
+            violations.append((entry.path, 'mode', '{0:o}'.format(self.mode),
+                               '{0:o}'.format(entry.mode)))
+        if self.owner is not None and entry.owner != self.owner:
+            violations.append((entry.path, 'owner', self.owner,
+                               entry.owner))
+        if self.group is not None and entry.group != self.group:
+            violations.append((entry.path, 'group', self.group,
+                               entry.group))
+        return violations
+
+
+def parse_find_output(lines):
+    """
+    Description:
+        Parse the output of FIND_CMD lazily.
+    Args:
+        lines (iterable): Lines printed by FIND_CMD.
+    Returns:
+        generator of FileEntry.
+    """
+    for line in lines:
+        fields = line.split('\t', 5)
+        if len(fields) != 6:
+            continue
+        mode, owner, group, size, ftype, path = fields
+        yield FileEntry(int(mode, 8), owner, group, int(size), ftype, path)
+
+
+def audit_entries(entries, rules):
+    """
+    Description:
+        Check every entry against every rule that applies to it.
+    Args:
+        entries (iterable): FileEntry objects.
+        rules (list): PermissionRule objects.
+    Returns:
+        tuple. (number of entries a rule applies to, list of
+        violations)
+    """
+    checked = 0
+    violations = []
+    for entry in entries:
+        applying = [rule for rule in rules if rule.applies_to(entry)]
+        if applying:
+            checked += 1
+        for rule in applying:
+            violations.extend(rule.check(entry))
+    return checked, violations
+
+
+def audit_files(test, node, roots, rules):
+    """
+    Description:
+        List every file under roots in one round trip and audit them.
+    Args:
+        test (GenericTest): Test case whose run_command is used.
+        node (str): Node filename, normally the MS.
+        roots (list): Directories to walk.
+        rules (list): PermissionRule objects.
+    Returns:
+        tuple. (number of entries a rule applies to, list of
+        violations)
+    """
+    stdout, stderr, ret = test.run_command(
+        node, FIND_CMD.format(" ".join(roots)), su_root=True)
+    test.assertEqual(0, ret, "find failed: {0}".format("\n".join(stderr)))
+    return audit_entries(parse_find_output(stdout), rules)
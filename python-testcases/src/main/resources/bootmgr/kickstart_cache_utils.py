@@ -0,0 +1,238 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Content addressed cache, on the test host, of the kickstart
+            files and partition snippets cobbler holds on the MS. A
+            state of the files (path -> sha256) is read with one
+            sha256sum call and only content the cache has not seen is
+            transferred. States saved under a name, e.g. before and
+            after a plan or at the end of a previous run, are diffed to
+            find the nodes whose kickstart changed.
+
+            The cache is kept in the BOOTMGR_KS_CACHE directory,
+            ~/.bootmgr_ks_cache by default.
+"""
+import difflib
+import json
+import os
+import re
+from collections import OrderedDict
+
+from file_audit_utils import COBBLER_KICKSTARTS_DIR
+from kickstart_lint_utils import KS_SUFFIX, fetch_files
+from kickstart_snippet_utils import SNIPPET_SUFFIX
+
+CACHE_ENV = 'BOOTMGR_KS_CACHE'
+DEFAULT_CACHE_DIR = os.path.join('~', '.bootmgr_ks_cache')
+
+HASH_CMD = "/usr/bin/sha256sum {0} 2>/dev/null"
+
+_SAFE_NAME_RE = re.compile(r'[^\w.-]+')
+
+
+def kickstart_paths(snippets_dir):
+    """
+    Returns:
+        list. Globs of the nodes' kickstart files and partition
+        snippets.
+    """
+    return [os.path.join(COBBLER_KICKSTARTS_DIR, '*' + KS_SUFFIX),
+            os.path.join(snippets_dir, '*' + SNIPPET_SUFFIX)]
+
+
+def node_of(path):
+    """
+    Returns:
+        str. Node a kickstart file or partition snippet belongs to.
+    """
+    name = path.rsplit('/', 1)[-1]
+    for suffix in (SNIPPET_SUFFIX, KS_SUFFIX):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def parse_hashes(lines):
+    """
+    Returns:
+        OrderedDict. path -> sha256 of the 'sha256sum' output, sorted by
+        path.
+    """
+    hashes = {}
+    for line in lines:
+        digest, _, path = line.strip().partition(' ')
+        if path:
+            hashes[path.lstrip(' *')] = digest
+    return OrderedDict(sorted(hashes.items()))
+
+
+class StateDiff(object):
+    """Paths added, removed and changed between two states"""
+
+    def __init__(self, before, after):
+        """
+        Args:
+            before (dict): path -> sha256.
+            after (dict): path -> sha256.
+        """
+        self.before = before
+        self.after = after
+        self.added = sorted(set(after) - set(before))
+        self.removed = sorted(set(before) - set(after))
+        self.changed = sorted(path for path in set(before) & set(after)
+                              if before[path] != after[path])
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+    __nonzero__ = __bool__
+
+    def nodes(self):
+        """
+        Returns:
+            list. Sorted nodes with a file added, removed or changed.
+        """
+        return sorted(set(node_of(path) for path in
+                          self.added + self.removed + self.changed))
+
+    def __repr__(self):
+        return "<StateDiff +{0} -{1} ~{2}>".format(
+            len(self.added), len(self.removed), len(self.changed))
+
+
+class KickstartCache(object):
+    """
+    Contents by sha256 under objects/, named states of an MS under
+    states/<ms>/<name>.json.
+
+    Example:
+        cache = KickstartCache()
+        before = cache.snapshot(self, ms, paths, 'before_plan')
+        ... run the plan ...
+        after = cache.snapshot(self, ms, paths, 'after_plan')
+        changed = StateDiff(before, after).nodes()
+    """
+
+    def __init__(self, root=None):
+        """
+        Args:
+            root (str): Cache directory; BOOTMGR_KS_CACHE or
+                DEFAULT_CACHE_DIR by default.
+        """
+        self.root = os.path.expanduser(
+            root or os.environ.get(CACHE_ENV) or DEFAULT_CACHE_DIR)
+
+    def _object_path(self, digest):
+        """File holding the content with the given sha256"""
+        return os.path.join(self.root, 'objects', digest[:2], digest)
+
+    def _state_path(self, ms_node, name):
+        """File holding a named state of an MS"""
+        return os.path.join(self.root, 'states',
+                            _SAFE_NAME_RE.sub('_', ms_node),
+                            _SAFE_NAME_RE.sub('_', name) + '.json')
+
+    @staticmethod
+    def _write(path, data):
+        """Write data to path atomically, creating its directory"""
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                # created by a concurrent test
+                if not os.path.isdir(directory):
+                    raise
+        temp_path = "{0}.{1}.tmp".format(path, os.getpid())
+        with open(temp_path, 'wb') as temp_file:
+            temp_file.write(data)
+        os.rename(temp_path, path)
+
+    def has(self, digest):
+        """
+        Returns:
+            bool. True if the content with the given sha256 is cached.
+        """
+        return os.path.exists(self._object_path(digest))
+
+    def get(self, digest):
+        """
+        Returns:
+            str. The content with the given sha256, None if not cached.
+        """
+        if not self.has(digest):
+            return None
+        with open(self._object_path(digest), 'rb') as object_file:
+            return object_file.read().decode('utf-8', 'replace')
+
+    def put(self, digest, content):
+        """Cache the content of a file under its sha256"""
+        if not self.has(digest):
+            self._write(self._object_path(digest), content.encode('utf-8'))
+
+    def save_state(self, ms_node, name, state):
+        """Keep a state (path -> sha256) of an MS under name"""
+        self._write(self._state_path(ms_node, name),
+                    json.dumps(state, indent=1, sort_keys=True).encode(
+                        'utf-8'))
+
+    def load_state(self, ms_node, name):
+        """
+        Returns:
+            OrderedDict. The state saved under name, None if there is
+            none.
+        """
+        path = self._state_path(ms_node, name)
+        if not os.path.exists(path):
+            return None
+        with open(path) as state_file:
+            return OrderedDict(sorted(json.load(state_file).items()))
+
+    def snapshot(self, test, ms_node, paths, name=None):
+        """
+        Description:
+            Read the state of the files on the MS and cache the contents
+            not seen before. Costs one call, two if any file is new.
+        Args:
+            test (GenericTest): Test case whose run_command is used.
+            ms_node (str): Filename of the MS.
+            paths (list): Absolute paths or shell globs.
+            name (str): Also save the state under this name.
+        Returns:
+            OrderedDict. path -> sha256.
+        """
+        stdout, _, _ = test.run_command(
+            ms_node, HASH_CMD.format(" ".join(paths)), su_root=True)
+        state = parse_hashes(stdout)
+        missing = [path for path, digest in state.items()
+                   if not self.has(digest)]
+        if missing:
+            for path, content in fetch_files(test, ms_node,
+                                             missing).items():
+                self.put(state[path], content)
+        if name is not None:
+            self.save_state(ms_node, name, state)
+        return state
+
+    def format_diff(self, diff):
+        """
+        Returns:
+            str. Unified diff of the changed files, from the cache.
+        """
+        lines = []
+        for path in diff.added:
+            lines.append("added {0}".format(path))
+        for path in diff.removed:
+            lines.append("removed {0}".format(path))
+        for path in diff.changed:
+            before = (self.get(diff.before[path]) or '').splitlines()
+            after = (self.get(diff.after[path]) or '').splitlines()
+            lines.extend(difflib.unified_diff(before, after, path, path,
+                                              lineterm=''))
+        return "\n".join(lines)
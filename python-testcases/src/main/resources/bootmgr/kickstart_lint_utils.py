@@ -0,0 +1,355 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Lint of the kickstart files on the MS. Any number of files
+            (the kickstart.erb template and every node's .ks) are
+            fetched in one tar stream, each parsed once into its command
+            section, %sections and embedded puppet.conf settings, then
+            checked against a table of expectations and compared across
+            nodes.
+"""
+import base64
+import fnmatch
+import io
+import re
+import shlex
+import tarfile
+from collections import OrderedDict
+
+KS_SUFFIX = '.ks'
+
+# Absolute member names (-P) so a file is found under the path asked
+# for; base64 as run_command returns text lines. Missing files only
+# warn (tar exits 2 for them otherwise), pipefail keeps the exit status
+# of any other tar failure.
+FETCH_CMD = ("set -o pipefail; /bin/tar --ignore-failed-read -czPf - {0} "
+             "| /usr/bin/base64")
+
+PUPPET_SECTIONS = ('main', 'agent', 'master')
+SECTION_END = '%end'
+
+_INI_HEADER_RE = re.compile(r'^\s*\[(\w+)\]\s*$')
+_INI_SETTING_RE = re.compile(r'^\s*(\w+)\s*=\s*(.*?)\s*$')
+
+
+def _split(line):
+    """Shell words of a line, or its blank separated words if it does
+    not parse (e.g. an erb tag)"""
+    try:
+        return shlex.split(line, comments=True)
+    except ValueError:
+        return line.split()
+
+
+def fetch_files(test, ms_node, paths):
+    """
+    Description:
+        Fetch files from the MS in one run_command call.
+    Args:
+        test (GenericTest): Test case whose run_command is used.
+        ms_node (str): Filename of the MS.
+        paths (list): Absolute paths or shell globs.
+    Returns:
+        OrderedDict. path -> content (str), sorted by path. Files that
+        do not exist are left out.
+    """
+    stdout, stderr, ret = test.run_command(
+        ms_node, FETCH_CMD.format(" ".join(paths)), su_root=True)
+    test.assertEqual(0, ret, "Fetching {0} failed: {1}".format(
+        " ".join(paths), "\n".join(stderr)))
+    return read_archive(base64.b64decode("".join(stdout)))
+
+
+def read_archive(data):
+    """
+    Returns:
+        OrderedDict. path -> content (str) of the regular files of a
+        gzip compressed tar archive, sorted by path.
+    """
+    files = {}
+    with tarfile.open(fileobj=io.BytesIO(data), mode='r:gz') as archive:
+        for member in archive:
+            if member.isfile():
+                content = archive.extractfile(member).read()
+                files['/' + member.name.lstrip('/')] = content.decode(
+                    'utf-8', 'replace')
+    return OrderedDict(sorted(files.items()))
+
+
+class KickstartFile(object):
+    """
+    One kickstart file (or template), parsed.
+
+    Attributes:
+        commands (OrderedDict): Command section directive -> list of
+            its argument lists, e.g. 'bootloader' -> [['--append=...']].
+        sections (OrderedDict): '%pre', '%post', ... -> list of the
+            bodies (lists of lines) of the sections with that header.
+        puppet (OrderedDict): 'section.key' -> value of the puppet.conf
+            settings written by the file, e.g. 'agent.runinterval'.
+    """
+
+    def __init__(self, path, lines):
+        self.path = path
+        self.lines = lines
+        self.commands = OrderedDict()
+        self.sections = OrderedDict()
+        self.puppet = OrderedDict()
+        self._parse()
+
+    @classmethod
+    def from_text(cls, path, text):
+        """
+        Returns:
+            KickstartFile. Parsed from the file's content.
+        """
+        return cls(path, text.splitlines())
+
+    @property
+    def name(self):
+        """Base name without the .ks suffix, the node for a node's file"""
+        name = self.path.rsplit('/', 1)[-1]
+        return name[:-len(KS_SUFFIX)] if name.endswith(KS_SUFFIX) else name
+
+    def _parse(self):
+        """Split the lines into commands, sections and puppet settings"""
+        body = None
+        puppet_section = None
+        for line in self.lines:
+            stripped = line.strip()
+            if stripped.startswith('%'):
+                header = stripped.split()[0]
+                if header == SECTION_END:
+                    body = None
+                    puppet_section = None
+                    continue
+                if header != '%include':
+                    body = []
+                    self.sections.setdefault(header, []).append(body)
+                    puppet_section = None
+                    continue
+            if body is not None:
+                body.append(line)
+            elif stripped and not stripped.startswith(('#', '$')):
+                words = _split(stripped)
+                if words:
+                    self.commands.setdefault(words[0], []).append(words[1:])
+
+            header = _INI_HEADER_RE.match(line)
+            if header is not None:
+                puppet_section = header.group(1) \
+                    if header.group(1) in PUPPET_SECTIONS else None
+                continue
+            if puppet_section is None or not stripped or \
+                    stripped.startswith('#'):
+                continue
+            setting = _INI_SETTING_RE.match(line)
+            if setting is None:
+                # the end of the puppet.conf heredoc
+                puppet_section = None
+            else:
+                self.puppet["{0}.{1}".format(puppet_section,
+                                             setting.group(1))] = \
+                    setting.group(2)
+
+    def puppet_setting(self, key):
+        """
+        Returns:
+            str. Value of a puppet.conf setting, key being 'section.key'
+            or just 'key' for any section; None if it is not set.
+        """
+        if key in self.puppet:
+            return self.puppet[key]
+        for name, value in self.puppet.items():
+            if name.split('.', 1)[1] == key:
+                return value
+        if '.' not in key:
+            # settings written line by line, e.g. with echo >> puppet.conf
+            regex = re.compile(r'\b{0}\s*=\s*([^\s"\']+)'.format(key))
+            for line in self.lines:
+                match = regex.search(line)
+                if match is not None:
+                    return match.group(1)
+        return None
+
+    def options(self, command):
+        """
+        Returns:
+            OrderedDict. --option -> value (True for flags) of every
+            occurrence of a command section directive.
+        """
+        options = OrderedDict()
+        for args in self.commands.get(command, []):
+            for arg in args:
+                if arg.startswith('--'):
+                    key, sep, value = arg.partition('=')
+                    options[key] = value.strip('"\'') if sep else True
+        return options
+
+    def facts(self):
+        """
+        Returns:
+            OrderedDict. What nodes are expected to have in common:
+            the puppet settings, the options of each directive (values
+            only for bootloader, as network options are per node) and
+            the sections present.
+        """
+        facts = OrderedDict()
+        for key, value in self.puppet.items():
+            facts['puppet:' + key] = value
+        for command in self.commands:
+            options = self.options(command)
+            if command == 'bootloader':
+                value = " ".join("{0}={1}".format(key, value)
+                                 for key, value in options.items())
+            else:
+                value = " ".join(options)
+            facts['command:' + command] = value
+        facts['sections'] = " ".join(self.sections)
+        return facts
+
+
+class Expectation(object):
+    """
+    One row of an expectation table: a description and a check of a
+    KickstartFile returning (passed, what was found).
+    """
+
+    def __init__(self, description, check):
+        self.description = description
+        self.check = check
+
+    def __repr__(self):
+        return "<Expectation {0}>".format(self.description)
+
+
+def expect_puppet(key, value):
+    """
+    Returns:
+        Expectation. The puppet.conf setting key is value.
+    """
+    def check(kickstart):
+        """Compare the setting"""
+        found = kickstart.puppet_setting(key)
+        return found == value, found
+    return Expectation("puppet.conf {0} = {1}".format(key, value), check)
+
+
+def expect_command(command, *options):
+    """
+    Returns:
+        Expectation. The command section has command, with each of the
+        options, given as '--option' or fnmatch patterns of
+        '--option=value'.
+    """
+    def check(kickstart):
+        """Look the command and its options up"""
+        if command not in kickstart.commands:
+            return False, None
+        found = ["{0}={1}".format(key, value) if value is not True
+                 else key for key, value in kickstart.options(
+                     command).items()]
+        names = [arg.split('=', 1)[0] for arg in found]
+        missing = [option for option in options if option not in names and
+                   not fnmatch.filter(found, option)]
+        return not missing, " ".join(found)
+    return Expectation("{0} {1}".format(command, " ".join(options)).strip(),
+                       check)
+
+
+def expect_line(description, pattern):
+    """
+    Returns:
+        Expectation. A line matches the regular expression, where
+        {name} is replaced by the file's node name.
+    """
+    def check(kickstart):
+        """Search the lines"""
+        regex = re.compile(pattern.format(name=re.escape(kickstart.name)))
+        for line in kickstart.lines:
+            if regex.search(line):
+                return True, line.strip()
+        return False, None
+    return Expectation(description, check)
+
+
+class Finding(object):
+    """An expectation a file does not meet"""
+    __slots__ = ('path', 'description', 'found')
+
+    def __init__(self, path, description, found):
+        self.path = path
+        self.description = description
+        self.found = found
+
+    def __repr__(self):
+        return "{0}: expected {1}, found {2!r}".format(
+            self.path, self.description, self.found)
+
+
+def lint(kickstarts, expectations):
+    """
+    Description:
+        Check every file against every expectation, in one pass.
+    Args:
+        kickstarts (list): KickstartFile objects.
+        expectations (list): Expectation objects.
+    Returns:
+        list. Finding per expectation not met.
+    """
+    findings = []
+    for kickstart in kickstarts:
+        for expectation in expectations:
+            passed, found = expectation.check(kickstart)
+            if not passed:
+                findings.append(Finding(kickstart.path,
+                                        expectation.description, found))
+    return findings
+
+
+def diff_nodes(kickstarts):
+    """
+    Description:
+        Compare the facts of the files of several nodes.
+    Args:
+        kickstarts (list): KickstartFile objects.
+    Returns:
+        OrderedDict. fact -> OrderedDict of file name -> value, for the
+        facts whose value is not the same in every file (None where a
+        file does not have the fact).
+    """
+    facts = OrderedDict((kickstart.name, kickstart.facts())
+                        for kickstart in kickstarts)
+    keys = []
+    for node_facts in facts.values():
+        keys.extend(key for key in node_facts if key not in keys)
+    differences = OrderedDict()
+    for key in keys:
+        values = OrderedDict((name, node_facts.get(key))
+                             for name, node_facts in facts.items())
+        if len(set(values.values())) > 1:
+            differences[key] = values
+    return differences
+
+
+def format_diff(differences):
+    """
+    Returns:
+        str. One line per differing fact and value.
+    """
+    lines = []
+    for key, values in differences.items():
+        by_value = OrderedDict()
+        for name, value in values.items():
+            by_value.setdefault(value, []).append(name)
+        lines.append("{0}: {1}".format(key, "; ".join(
+            "{0!r} on {1}".format(value, ", ".join(names))
+            for value, names in by_value.items())))
+    return "\n".join(lines)
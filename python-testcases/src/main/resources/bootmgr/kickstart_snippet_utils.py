@@ -0,0 +1,243 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Parser for the '<hostname>.ks.partition.snippet' files that
+            bootmgr writes to the cobbler snippets directory. All the
+            snippets are fetched in one transfer and indexed by node
+            hostname and volume group.
+"""
+import os
+
+SNIPPET_SUFFIX = ".ks.partition.snippet"
+DIRECTIVES = ('part', 'logvol', 'volgroup')
+
+# Only the directive lines are transferred; every line is prefixed with
+# the snippet path by 'grep -H'.
+FETCH_CMD = ("/bin/grep -H -E '(^|[[:space:]\"])(part|logvol|volgroup)"
+             "[[:space:]]' {0}")
+
+# Tokens that end the kickstart directive inside a shell line,
+# e.g. echo "logvol / ... --size=16384" >> /tmp/partitioninfo
+_SHELL_TOKENS = ('>', '>>', '|', ';', '&&', '||')
+
+
+class PartitionDirective(object):
+    """
+    One part, logvol or volgroup directive.
+
+    Attributes:
+        kind (str): 'part', 'logvol' or 'volgroup'.
+        target (str): mount point for part/logvol, volume group name for
+            volgroup.
+        name (str): --name of a logvol.
+        volume_group (str): --vgname of a logvol, target of a volgroup.
+        size (int): --size in MiB, None if not given.
+        grow (bool): True if --grow is set.
+        fstype (str): --fstype.
+        options (dict): every --option, flags map to True.
+        members (tuple): remaining positional arguments, e.g. the
+            physical volumes of a volgroup.
+    """
+    __slots__ = ('kind', 'target', 'name', 'volume_group', 'size', 'grow',
+                 'fstype', 'options', 'members')
+
+    def __init__(self, kind, target, options, members):
+        self.kind = kind
+        self.target = target
+        self.options = options
+        self.members = members
+        self.name = options.get('name')
+        self.fstype = options.get('fstype')
+        self.grow = options.get('grow') is True
+        self.volume_group = target if kind == 'volgroup' else \
+            options.get('vgname')
+        size = options.get('size')
+        try:
+            self.size = int(size) if size not in (None, True) else None
+        except ValueError:
+            self.size = None
+
+    def __repr__(self):
+        return "<{0} {1} size={2}>".format(self.kind, self.target,
+                                           self.size)
+
+
+def parse_directive(line):
+    """
+    Description:
+        Parse a kickstart part/logvol/volgroup directive without relying
+        on the position of its options. The directive may be wrapped in
+        a shell command (echo "..." >> file).
+    Args:
+        line (str): One line of a snippet.
+    Returns:
+        PartitionDirective or None if the line holds no directive.
+    """
+    if line.lstrip().startswith('#'):
+        return None
+    tokens = line.replace('"', ' ').replace("'", ' ').split()
+    for start, token in enumerate(tokens):
+        if token in DIRECTIVES:
+            break
+    else:
+        return None
+
+    target = None
+    options = {}
+    members = []
+    for token in tokens[start + 1:]:
+        if token in _SHELL_TOKENS:
+            break
+        if token.startswith('--'):
+            key, sep, value = token[2:].partition('=')
+            options[key] = value if sep else True
+        elif target is None:
+            target = token
+        else:
+            members.append(token)
+    if target is None:
+        return None
+    return PartitionDirective(tokens[start], target, options,
+                              tuple(members))
+
+
+class PartitionSnippet(object):
+    """The directives of one node's partition snippet"""
+    __slots__ = ('hostname', 'directives')
+
+    def __init__(self, hostname):
+        self.hostname = hostname
+        self.directives = []
+
+    def of_kind(self, kind):
+        """
+        Returns:
+            list. Directives of the given kind, in file order.
+        """
+        return [d for d in self.directives if d.kind == kind]
+
+    @property
+    def logvols(self):
+        """logvol directives, in file order"""
+        return self.of_kind('logvol')
+
+    @property
+    def volume_groups(self):
+        """set of volume group names used by the logvols"""
+        return set(d.volume_group for d in self.logvols)
+
+    def by_volume_group(self):
+        """
+        Returns:
+            dict. volume group name -> list of its logvol directives.
+        """
+        groups = {}
+        for directive in self.logvols:
+            groups.setdefault(directive.volume_group, []).append(directive)
+        return groups
+
+    def by_mount_point(self):
+        """
+        Returns:
+            dict. mount point -> part or logvol directive.
+        """
+        return dict((d.target, d) for d in self.directives
+                    if d.kind != 'volgroup')
+
+
+class SnippetIndex(object):
+    """
+    Partition snippets of every node, keyed by hostname.
+
+    Example:
+        snippets = SnippetIndex.fetch(self, self.ms_node)
+        root_vgs = snippets['node1'].volume_groups
+    """
+
+    def __init__(self):
+        self.snippets = {}
+
+    def __contains__(self, hostname):
+        return hostname in self.snippets
+
+    def __getitem__(self, hostname):
+        return self.snippets[hostname]
+
+    def __len__(self):
+        return len(self.snippets)
+
+    def hostnames(self):
+        """sorted hostnames with a snippet"""
+        return sorted(self.snippets)
+
+    def add_line(self, path, line):
+        """
+        Description:
+            Index one line of the snippet at path.
+        """
+        filename = os.path.basename(path)
+        if not filename.endswith(SNIPPET_SUFFIX):
+            return
+        hostname = filename[:-len(SNIPPET_SUFFIX)]
+        snippet = self.snippets.get(hostname)
+        if snippet is None:
+            snippet = self.snippets[hostname] = PartitionSnippet(hostname)
+        directive = parse_directive(line)
+        if directive is not None:
+            snippet.directives.append(directive)
+
+    def add_grep_output(self, lines):
+        """
+        Description:
+            Index the 'grep -H' output of FETCH_CMD line by line.
+        Args:
+            lines (iterable): '<path>:<line>' strings.
+        """
+        for line in lines:
+            path, sep, content = line.partition(':')
+            if sep:
+                self.add_line(path, content)
+
+    @classmethod
+    def fetch(cls, test, ms_node, hostnames=None, snippets_dir=None):
+        """
+        Description:
+            Fetch and parse the partition snippets from the MS in one
+            run_command call.
+        Args:
+            test (GenericTest): Test case whose run_command is used.
+            ms_node (str): Filename of the MS.
+            hostnames (list): Only fetch these nodes' snippets; all the
+                snippets in snippets_dir by default.
+            snippets_dir (str): Directory holding the snippets,
+                test_constants.COBBLER_SNIPPETS_DIR by default.
+        Returns:
+            SnippetIndex.
+        """
+        if snippets_dir is None:
+            # test_constants ships with the test framework; imported here
+            # so the parser itself can be used without it.
+            import test_constants
+            snippets_dir = test_constants.COBBLER_SNIPPETS_DIR
+        if hostnames:
+            paths = " ".join(
+                os.path.join(snippets_dir, host + SNIPPET_SUFFIX)
+                for host in hostnames)
+        else:
+            paths = os.path.join(snippets_dir, '*' + SNIPPET_SUFFIX)
+        std_out, std_err, exit_code = test.run_command(
+            ms_node, FETCH_CMD.format(paths))
+        test.assertNotEqual([], std_out)
+        test.assertEqual([], std_err)
+        test.assertEqual(0, exit_code)
+
+        index = cls()
+        index.add_grep_output(std_out)
+        return index
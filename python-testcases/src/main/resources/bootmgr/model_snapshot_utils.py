@@ -0,0 +1,324 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   In-memory snapshot of the LITP model built from one round
+            trip of 'litp export' calls, indexed by url and item type.
+            Replaces repeated find/get_props_from_url walks.
+"""
+from collections import OrderedDict
+import xml.etree.ElementTree as ElementTree
+
+from bundle_utils import CommandBundle
+
+LITP_EXPORT_CMD = "/usr/bin/litp export -p {0}"
+
+# /software is exported too so items inherited from it resolve.
+DEFAULT_EXPORT_PATHS = ('/deployments', '/infrastructure', '/software')
+
+INHERIT_SUFFIX = '-inherit'
+COLLECTION_SUFFIX = '-collection'
+
+# Item types extended by the types found in bootmgr deployments; used
+# to match the children of a collection against the collection's type.
+TYPE_EXTENDS = {
+    'blade': 'system',
+    'vcs-cluster': 'cluster',
+    'cluster': 'cluster-base',
+    'storage-profile': 'storage-profile-base',
+}
+
+
+class ModelItem(object):
+    """One item of the model"""
+    __slots__ = ('url', 'item_type', 'props', 'source_path', 'children')
+
+    def __init__(self, url, item_type, props=None, source_path=None):
+        self.url = url
+        self.item_type = item_type
+        self.props = props if props is not None else {}
+        self.source_path = source_path
+        self.children = []
+
+    @property
+    def is_collection(self):
+        """True for collection items (e.g. .../nodes)"""
+        return self.item_type.endswith(COLLECTION_SUFFIX)
+
+    def __repr__(self):
+        return "<ModelItem {0} ({1})>".format(self.url, self.item_type)
+
+
+def _local_name(tag):
+    """Strip the xml namespace from a tag"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def is_a(item_type, wanted_type):
+    """
+    Returns:
+        bool. True if item_type is wanted_type or extends it.
+    """
+    while item_type is not None:
+        if item_type == wanted_type:
+            return True
+        item_type = TYPE_EXTENDS.get(item_type)
+    return False
+
+
+class ModelSnapshot(object):
+    """
+    Lazily loaded, memoized view of the model.
+
+    The snapshot is fetched on first use and kept until invalidate() is
+    called. Test cases must call invalidate() after they change the
+    model (execute_cli_create_cmd/update/remove/inherit, litp load) and
+    after a plan has run, since plans can remove ForRemoval items.
+
+    Inherited items are resolved: their properties are merged with the
+    properties of their source and the source's children are visible
+    under the inherited path, as 'litp show' reports them.
+    """
+
+    def __init__(self, test, ms_node, paths=DEFAULT_EXPORT_PATHS):
+        """
+        Args:
+            test (GenericTest): Test case whose run_command is used.
+            ms_node (str): Filename of the MS.
+            paths (tuple): Model paths exported into the snapshot.
+        """
+        self.test = test
+        self.ms_node = ms_node
+        self.paths = tuple(paths)
+        self._items = None
+        self._by_type = None
+
+    def invalidate(self):
+        """Drop the snapshot; the next lookup exports the model again"""
+        self._items = None
+        self._by_type = None
+
+    def refresh(self):
+        """Export the model now, replacing any previous snapshot"""
+        bundle = CommandBundle(
+            [LITP_EXPORT_CMD.format(path) for path in self.paths])
+        results = bundle.run(self.test, self.ms_node)
+        documents = []
+        for path, (stdout, stderr, ret) in zip(self.paths, results):
+            self.test.assertEqual(
+                0, ret, "litp export -p {0} failed: {1}".format(
+                    path, "\n".join(stderr)))
+            documents.append(stdout)
+        self.load_documents(documents)
+
+    def load_documents(self, documents):
+        """
+        Description:
+            Build the indexes from exported xml documents.
+        Args:
+            documents (list): Each document is either a string or the
+                list of lines printed by 'litp export'.
+        """
+        self._items = OrderedDict()
+        for document in documents:
+            if not isinstance(document, (bytes, type(u''))):
+                document = "\n".join(document)
+            if not isinstance(document, bytes):
+                document = document.encode('utf-8')
+            root = ElementTree.fromstring(document)
+            self._add_element(root, '')
+
+        resolved = set()
+        for url in list(self._items):
+            self._resolve_inherit(url, resolved)
+
+        self._by_type = {}
+        for item in self._items.values():
+            self._by_type.setdefault(item.item_type, []).append(item.url)
+
+    def _add_element(self, element, parent_url):
+        """Index an exported element and its descendants"""
+        item_type = _local_name(element.tag)
+        source_path = element.get('source_path')
+        if item_type.endswith(INHERIT_SUFFIX):
+            item_type = item_type[:-len(INHERIT_SUFFIX)]
+        url = "{0}/{1}".format(parent_url, element.get('id'))
+
+        item = ModelItem(url, item_type, OrderedDict(),
+                         source_path=source_path)
+        self._items[url] = item
+        parent = self._items.get(parent_url)
+        if parent is not None:
+            parent.children.append(url)
+
+        for child in element:
+            if child.get('id') is not None:
+                self._add_element(child, url)
+            elif child.text is not None:
+                item.props[_local_name(child.tag)] = child.text.strip()
+
+    def _resolve_inherit(self, url, resolved):
+        """Merge an inherited item with its source, recursively"""
+        item = self._items[url]
+        if item.source_path is None or url in resolved:
+            return
+        resolved.add(url)
+        source = self._items.get(item.source_path)
+        if source is None:
+            return
+        self._resolve_inherit(source.url, resolved)
+
+        props = OrderedDict(source.props)
+        props.update(item.props)
+        item.props = props
+
+        for source_child_url in source.children:
+            source_child = self._items[source_child_url]
+            child_url = "{0}/{1}".format(
+                url, source_child_url.rsplit('/', 1)[-1])
+            child = self._items.get(child_url)
+            if child is None:
+                child = ModelItem(child_url, source_child.item_type)
+                self._items[child_url] = child
+                item.children.append(child_url)
+            if child.source_path is None:
+                child.source_path = source_child_url
+            self._resolve_inherit(child_url, resolved)
+
+    @property
+    def items(self):
+        """OrderedDict of url -> ModelItem, exported on first access"""
+        if self._items is None:
+            self.refresh()
+        return self._items
+
+    def get(self, url):
+        """
+        Returns:
+            ModelItem or None if the url is not in the snapshot.
+        """
+        return self.items.get(url.rstrip('/'))
+
+    def get_props(self, url, prop=None):
+        """
+        Description:
+            Snapshot equivalent of GenericTest.get_props_from_url.
+        Args:
+            url (str): Item url.
+            prop (str): Only return this property.
+        Returns:
+            dict of all properties, or the value of prop (None if the
+            item or the property does not exist).
+        """
+        item = self.get(url)
+        if prop is None:
+            return dict(item.props) if item is not None else None
+        return item.props.get(prop) if item is not None else None
+
+    def walk(self, path):
+        """
+        Returns:
+            generator. The item at path and its descendants, in the
+            order 'litp show -r' lists them.
+        """
+        start = self.get(path)
+        stack = [start] if start is not None else []
+        while stack:
+            item = stack.pop()
+            yield item
+            stack.extend(self._items[child]
+                         for child in reversed(item.children))
+
+    def find(self, path, item_type, rtn_type_children=True,
+             assert_not_empty=True):
+        """
+        Description:
+            Snapshot equivalent of GenericTest.find.
+        Args:
+            path (str): Url to search under.
+            item_type (str): Item type to look for.
+            rtn_type_children (bool): If False return the collections
+                holding items of item_type instead of the items.
+            assert_not_empty (bool): Fail the test if nothing is found.
+        Returns:
+            list. Matching urls.
+        """
+        found = []
+        for item in self.walk(path):
+            if rtn_type_children:
+                if item.item_type == item_type:
+                    found.append(item.url)
+            elif item.is_collection and any(
+                    is_a(self._items[child].item_type, item_type)
+                    for child in item.children):
+                found.append(item.url)
+
+        if assert_not_empty:
+            self.test.assertNotEqual(
+                [], found, "No item of type '{0}' found under {1}".format(
+                    item_type, path))
+        return found
+
+    def query(self, item_type, path='/deployments', where=None,
+              ancestor=None):
+        """
+        Description:
+            Typed query over the snapshot, e.g. the nodes of the sfha
+            clusters:
+                query('node', ancestor=('vcs-cluster',
+                                        {'cluster_type': 'sfha'}))
+        Args:
+            item_type (str): Type of the items returned; types extending
+                it match too.
+            path (str): Url to search under.
+            where (dict): Property values the items must have.
+            ancestor (tuple): (item type, where dict) of an item the
+                items must be under.
+        Returns:
+            list. Matching urls, in the order 'litp show -r' lists them.
+        """
+        def matches(item, wanted_type, props):
+            """True if item is of wanted_type and has props"""
+            return is_a(item.item_type, wanted_type) and all(
+                item.props.get(name) == value
+                for name, value in (props or {}).items())
+
+        found = []
+        for item in self.walk(path):
+            if not matches(item, item_type, where):
+                continue
+            if ancestor is not None:
+                ancestor_type, ancestor_where = ancestor
+                parent_url = self.parent_url(item.url)
+                while parent_url:
+                    parent = self._items.get(parent_url)
+                    if parent is not None and \
+                            matches(parent, ancestor_type, ancestor_where):
+                        break
+                    parent_url = self.parent_url(parent_url)
+                if not parent_url:
+                    continue
+            found.append(item.url)
+        return found
+
+    def urls_of_type(self, item_type):
+        """
+        Returns:
+            list. Urls of every item of exactly item_type.
+        """
+        if self._by_type is None:
+            self.refresh()
+        return list(self._by_type.get(item_type, []))
+
+    def parent_url(self, url, levels=1):
+        """
+        Returns:
+            str. The url levels above url (2 skips the collection).
+        """
+        return url.rstrip('/').rsplit('/', levels)[0]
@@ -0,0 +1,230 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Network facts of a node read in one round trip: every ifcfg
+            file, the addresses plumbed on each interface and the state
+            of the bonds. Port 22 reachability of any number of
+            addresses is probed from a node in one call, the probes
+            running in parallel on the node.
+"""
+import json
+import re
+
+from bundle_utils import CommandBundle
+
+# Every line of every file, prefixed with the file path
+IFCFG_CMD = "/bin/grep -H '' {0}/ifcfg-*"
+# The json output needs iproute 4.13 or later; older releases fall
+# back to the one line per address output, which parse_ip_addr also
+# understands.
+IP_ADDR_CMD = ("/sbin/ip -j addr show 2>/dev/null || "
+               "/sbin/ip -o addr show")
+BONDING_CMD = "/bin/grep -H '' /proc/net/bonding/* 2>/dev/null"
+
+SSH_PORT = 22
+# One background nc per address; each prints "<ip> <banner>".
+SSH_PROBE_CMD = ('for _ip in {ips}; do ( echo "$_ip $(echo QUIT | '
+                 '/usr/bin/nc -w {timeout} $_ip {port} 2>/dev/null | '
+                 'head -1)" ) & done; wait')
+SSH_BANNER = 'OpenSSH_'
+
+_IP_O_RE = re.compile(r'^\d+:\s+(?P<dev>\S+?)(?:@\S+)?\s+'
+                      r'(?P<family>inet6?)\s+(?P<address>\S+)')
+
+
+def _unquote(value):
+    """Strip the shell quotes around an ifcfg value"""
+    value = value.strip()
+    if len(value) > 1 and value[0] == value[-1] and value[0] in '"\'':
+        return value[1:-1]
+    return value
+
+
+def _split_path_lines(lines):
+    """
+    Returns:
+        generator. (file basename, line) of 'grep -H' output.
+    """
+    for line in lines:
+        path, sep, text = line.partition(':')
+        if sep:
+            yield path.rsplit('/', 1)[-1], text
+
+
+def parse_ifcfg(lines):
+    """
+    Description:
+        Parse the output of IFCFG_CMD.
+    Args:
+        lines (list): Lines printed by IFCFG_CMD.
+    Returns:
+        dict. Device (file suffix) -> dict of the file's settings,
+        values unquoted.
+    """
+    ifcfg = {}
+    for name, text in _split_path_lines(lines):
+        if not name.startswith('ifcfg-'):
+            continue
+        settings = ifcfg.setdefault(name[len('ifcfg-'):], {})
+        text = text.strip()
+        if not text or text.startswith('#') or '=' not in text:
+            continue
+        key, _, value = text.partition('=')
+        settings[key.strip()] = _unquote(value)
+    return ifcfg
+
+
+def parse_ip_addr(lines):
+    """
+    Description:
+        Parse the output of IP_ADDR_CMD, json or one line per address.
+    Args:
+        lines (list): Lines printed by IP_ADDR_CMD.
+    Returns:
+        dict. Device -> list of 'address/prefix' plumbed on it.
+    """
+    addresses = {}
+    text = "\n".join(lines).strip()
+    if text.startswith('['):
+        for link in json.loads(text):
+            plumbed = addresses.setdefault(link['ifname'], [])
+            for info in link.get('addr_info', []):
+                plumbed.append("{0}/{1}".format(info['local'],
+                                                info['prefixlen']))
+        return addresses
+    for line in lines:
+        match = _IP_O_RE.match(line)
+        if match is not None:
+            addresses.setdefault(match.group('dev'), []).append(
+                match.group('address'))
+    return addresses
+
+
+def parse_bonding(lines):
+    """
+    Description:
+        Parse the output of BONDING_CMD.
+    Args:
+        lines (list): Lines printed by BONDING_CMD.
+    Returns:
+        dict. Bond -> dict of its 'mode', 'mii_status' and 'slaves',
+        the slaves being a dict of slave -> MII status.
+    """
+    bonds = {}
+    slave = {}
+    for name, text in _split_path_lines(lines):
+        bond = bonds.setdefault(name, {'mode': None, 'mii_status': None,
+                                       'slaves': {}})
+        key, _, value = text.partition(':')
+        key, value = key.strip(), value.strip()
+        if key == 'Bonding Mode':
+            bond['mode'] = value
+            slave[name] = None
+        elif key == 'Slave Interface':
+            slave[name] = value
+            bond['slaves'][value] = None
+        elif key == 'MII Status':
+            if slave.get(name) is None:
+                bond['mii_status'] = value
+            else:
+                bond['slaves'][slave[name]] = value
+    return bonds
+
+
+class NetworkFacts(object):
+    """
+    ifcfg files, plumbed addresses and bonds of one node.
+
+    Example:
+        facts = NetworkFacts.fetch(self, node, NETWORK_SCRIPTS_DIR)
+        self.assertEqual(ip, facts.ifcfg_value('bondmgmt', 'IPADDR'))
+    """
+
+    def __init__(self, node, ifcfg, addresses, bonds):
+        self.node = node
+        self.ifcfg = ifcfg
+        self.addresses = addresses
+        self.bonds = bonds
+
+    @classmethod
+    def fetch(cls, test, node, scripts_dir):
+        """
+        Description:
+            Read the node's network facts in one run_command call.
+        Args:
+            test (GenericTest): Test case whose run_command is used.
+            node (str): Node filename.
+            scripts_dir (str): Directory of the ifcfg files.
+        Returns:
+            NetworkFacts.
+        """
+        bundle = CommandBundle([IFCFG_CMD.format(scripts_dir),
+                                IP_ADDR_CMD, BONDING_CMD])
+        ifcfg, addresses, bonding = bundle.run(test, node)
+        for cmd, (stdout, stderr, ret) in zip(bundle.cmds[:2],
+                                              (ifcfg, addresses)):
+            test.assertEqual(0, ret, "'{0}' failed on {1}: {2}".format(
+                cmd, node, "\n".join(stderr)))
+            test.assertNotEqual([], stdout)
+        # a node without bonds has no /proc/net/bonding
+        return cls(node, parse_ifcfg(ifcfg[0]), parse_ip_addr(addresses[0]),
+                   parse_bonding(bonding[0]))
+
+    def ifcfg_value(self, device, key):
+        """
+        Returns:
+            str. Setting of the device's ifcfg file, None if the file
+            or the setting does not exist.
+        """
+        return self.ifcfg.get(device, {}).get(key)
+
+    def ips_on(self, device):
+        """
+        Returns:
+            list. Addresses plumbed on device, without their prefix.
+        """
+        return [address.split('/')[0]
+                for address in self.addresses.get(device, [])]
+
+
+def parse_ssh_probe(lines):
+    """
+    Returns:
+        dict. Address -> first line the port answered with, '' if it
+        did not answer.
+    """
+    banners = {}
+    for line in lines:
+        address, _, banner = line.strip().partition(' ')
+        if address:
+            banners[address] = banner.strip()
+    return banners
+
+
+def probe_ssh(test, node, ip_addresses, timeout=5, port=SSH_PORT):
+    """
+    Description:
+        Check from node that an ssh server answers on each address. The
+        probes run in parallel on the node, so the call takes at most
+        about timeout seconds however many addresses are probed.
+    Args:
+        test (GenericTest): Test case whose run_command is used.
+        node (str): Node filename to probe from.
+        ip_addresses (list): Addresses to probe.
+        timeout (int): nc timeout in seconds.
+        port (int): Port to probe.
+    Returns:
+        dict. Address -> True if an OpenSSH banner was received.
+    """
+    stdout, _, _ = test.run_command(node, SSH_PROBE_CMD.format(
+        ips=" ".join(ip_addresses), timeout=timeout, port=port))
+    banners = parse_ssh_probe(stdout)
+    return dict((address, SSH_BANNER in banners.get(address, ''))
+                for address in ip_addresses)
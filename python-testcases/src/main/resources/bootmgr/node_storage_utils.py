@@ -0,0 +1,249 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Snapshot of a node's mount table, logical volumes and
+            partitions read in one round trip. Logical volumes are
+            joined to their mount points through the kernel device
+            number, so nothing is mounted or probed per volume.
+"""
+import json
+import re
+
+from bundle_utils import CommandBundle
+from size_utils import to_mib
+
+MOUNTINFO_CMD = "/bin/cat /proc/self/mountinfo"
+
+LVS_FIELDS = "lv_path,lv_name,vg_name,lv_kernel_major,lv_kernel_minor,lv_size"
+# The json report needs lvm2 2.02.158 or later; older releases fall back
+# to the column report, which parse_lvs also understands.
+LVS_CMD = ("/sbin/lvs --reportformat json --units m -o {0} 2>/dev/null || "
+           "/sbin/lvs --noheadings --separator ';' --units m -o {0}"
+           ).format(LVS_FIELDS)
+
+PARTED_CMD = "/usr/sbin/parted -lm"
+
+_OCTAL_ESCAPE_RE = re.compile(r'\\([0-7]{3})')
+
+
+def _unescape(field):
+    """Undo the octal escaping of spaces etc. in mountinfo fields"""
+    return _OCTAL_ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 8)), field)
+
+
+class Mount(object):
+    """One line of /proc/self/mountinfo"""
+    __slots__ = ('devno', 'mount_point', 'fstype', 'source', 'options')
+
+    def __init__(self, devno, mount_point, fstype, source, options):
+        self.devno = devno
+        self.mount_point = mount_point
+        self.fstype = fstype
+        self.source = source
+        self.options = options
+
+    def __repr__(self):
+        return "<Mount {0} on {1}>".format(self.source, self.mount_point)
+
+
+class LogicalVolume(object):
+    """One logical volume reported by lvs, with its mount if any"""
+    __slots__ = ('path', 'name', 'vg_name', 'devno', 'size', 'mount')
+
+    def __init__(self, path, name, vg_name, devno, size):
+        self.path = path
+        self.name = name
+        self.vg_name = vg_name
+        self.devno = devno
+        self.size = size
+        self.mount = None
+
+    @property
+    def mount_point(self):
+        """Mount point or None if the volume is not mounted"""
+        return self.mount.mount_point if self.mount is not None else None
+
+    def __repr__(self):
+        return "<LogicalVolume {0} {1}MiB on {2}>".format(
+            self.path, self.size, self.mount_point)
+
+
+class Partition(object):
+    """One partition line of 'parted -lm'"""
+    __slots__ = ('device', 'number', 'start', 'end', 'size', 'fstype',
+                 'name', 'flags')
+
+    def __init__(self, device, fields):
+        self.device = device
+        self.number = int(fields[0])
+        self.start, self.end, self.size = fields[1:4]
+        self.fstype = fields[4] if len(fields) > 4 else ''
+        self.name = fields[5] if len(fields) > 5 else ''
+        flags = fields[6] if len(fields) > 6 else ''
+        self.flags = tuple(flag.strip() for flag in flags.split(',')
+                           if flag.strip())
+
+    def __repr__(self):
+        return "<Partition {0}{1} {2} {3}>".format(
+            self.device, self.number, self.size, ",".join(self.flags))
+
+
+def parse_mountinfo(lines):
+    """
+    Description:
+        Parse /proc/self/mountinfo.
+    Args:
+        lines (list): Lines of the file.
+    Returns:
+        list. Mount objects in mount order.
+    """
+    mounts = []
+    for line in lines:
+        fields = line.split()
+        if '-' not in fields[6:]:
+            continue
+        separator = fields.index('-', 6)
+        mounts.append(Mount(fields[2], _unescape(fields[4]),
+                            fields[separator + 1],
+                            _unescape(fields[separator + 2]), fields[5]))
+    return mounts
+
+
+def parse_lvs(lines):
+    """
+    Description:
+        Parse the output of LVS_CMD, json or column report.
+    Args:
+        lines (list): Lines printed by LVS_CMD.
+    Returns:
+        list. LogicalVolume objects.
+    """
+    text = "\n".join(lines).strip()
+    if text.startswith('{'):
+        rows = []
+        for report in json.loads(text)['report']:
+            rows.extend(report.get('lv', []))
+    else:
+        names = LVS_FIELDS.split(',')
+        rows = [dict(zip(names, (field.strip()
+                                 for field in line.split(';'))))
+                for line in lines if line.strip()]
+
+    volumes = []
+    for row in rows:
+        devno = None
+        if row['lv_kernel_major'] not in ('', '-1'):
+            devno = "{0}:{1}".format(row['lv_kernel_major'],
+                                     row['lv_kernel_minor'])
+        volumes.append(LogicalVolume(row['lv_path'], row['lv_name'],
+                                     row['vg_name'], devno,
+                                     to_mib(row['lv_size'])))
+    return volumes
+
+
+def parse_parted(lines):
+    """
+    Description:
+        Parse the machine readable output of 'parted -lm'.
+    Args:
+        lines (list): Lines printed by PARTED_CMD.
+    Returns:
+        list. Partition objects of every disk.
+    """
+    partitions = []
+    device = None
+    for line in lines:
+        line = line.strip().rstrip(';')
+        if not line or line in ('BYT', 'CHS', 'CYL'):
+            device = None
+            continue
+        fields = line.split(':')
+        if device is None:
+            device = fields[0]
+        elif fields[0].isdigit():
+            partitions.append(Partition(device, fields))
+    return partitions
+
+
+class NodeStorage(object):
+    """
+    Mounts, logical volumes and partitions of one node.
+
+    Example:
+        storage = NodeStorage.fetch(self, node)
+        root_size = storage.lv_sizes()['/']
+    """
+
+    def __init__(self, mounts, volumes, partitions):
+        self.mounts = mounts
+        self.volumes = volumes
+        self.partitions = partitions
+        by_devno = {}
+        for mount in mounts:
+            # keep the first mount of a device, not its bind mounts
+            by_devno.setdefault(mount.devno, mount)
+        for volume in volumes:
+            volume.mount = by_devno.get(volume.devno)
+
+    @classmethod
+    def load(cls, mountinfo, lvs, parted):
+        """
+        Returns:
+            NodeStorage. Built from the output of the three commands.
+        """
+        return cls(parse_mountinfo(mountinfo), parse_lvs(lvs),
+                   parse_parted(parted))
+
+    @classmethod
+    def fetch(cls, test, node):
+        """
+        Description:
+            Read the node's mount table, logical volumes and partitions
+            in one run_command call.
+        Args:
+            test (GenericTest): Test case whose run_command is used.
+            node (str): Node filename.
+        Returns:
+            NodeStorage.
+        """
+        bundle = CommandBundle([MOUNTINFO_CMD, LVS_CMD, PARTED_CMD])
+        mountinfo, lvs, parted = bundle.run(test, node, su_root=True)
+        for cmd, (stdout, stderr, ret) in zip(bundle.cmds[:2],
+                                              (mountinfo, lvs)):
+            test.assertEqual(0, ret, "'{0}' failed: {1}".format(
+                cmd, "\n".join(stderr)))
+            test.assertNotEqual([], stdout)
+        # parted exits non-zero if any device has no label, so only its
+        # output is required
+        test.assertNotEqual([], parted[0], "No output from parted")
+        return cls.load(mountinfo[0], lvs[0], parted[0])
+
+    def by_mount_point(self):
+        """
+        Returns:
+            dict. mount point -> LogicalVolume of the mounted volumes.
+        """
+        return dict((volume.mount_point, volume) for volume in self.volumes
+                    if volume.mount is not None)
+
+    def lv_sizes(self):
+        """
+        Returns:
+            dict. mount point -> size in MiB of the mounted volumes.
+        """
+        return dict((mount_point, volume.size) for mount_point, volume
+                    in self.by_mount_point().items())
+
+    def partitions_with_flag(self, flag):
+        """
+        Returns:
+            list. Partitions with the given flag set, e.g. 'boot'.
+        """
+        return [part for part in self.partitions if flag in part.flags]
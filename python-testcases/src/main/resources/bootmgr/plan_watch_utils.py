@@ -0,0 +1,311 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Watches the progress of the LITP plan with a single
+            background poller of 'litp show_plan'. Task state changes
+            are turned into deltas and waiters registered for a task
+            description and state are notified as soon as it is seen,
+            so any number of waiters share one poll of the MS.
+"""
+import fnmatch
+import threading
+import time
+
+from topology_utils import invalidate as invalidate_topology
+
+SHOW_PLAN_CMD = "/usr/bin/litp show_plan"
+
+TASK_INITIAL = 'Initial'
+TASK_RUNNING = 'Running'
+TASK_SUCCESS = 'Success'
+TASK_FAILED = 'Failed'
+TASK_STOPPED = 'Stopped'
+TASK_STATES = (TASK_INITIAL, TASK_RUNNING, TASK_SUCCESS, TASK_FAILED,
+               TASK_STOPPED)
+
+PLAN_RUNNING = 'Running'
+PLAN_SUCCESSFUL = 'Successful'
+PLAN_FAILED = 'Failed'
+PLAN_STOPPED = 'Stopped'
+PLAN_FINISHED = (PLAN_SUCCESSFUL, PLAN_FAILED, PLAN_STOPPED)
+
+_PLAN_STATUS_PREFIX = 'Plan Status:'
+# 'Tasks: 12 | Initial: 3 | Running: 1 | ...', after the last task
+_SUMMARY_PREFIX = 'Tasks:'
+
+
+class PlanTask(object):
+    """One task line of 'litp show_plan'"""
+    __slots__ = ('phase', 'state', 'url', 'description')
+
+    def __init__(self, phase, state, url, description):
+        self.phase = phase
+        self.state = state
+        self.url = url
+        self.description = description
+
+    @property
+    def key(self):
+        """Identifies the task across polls"""
+        return (self.phase, self.url, self.description)
+
+    def __repr__(self):
+        return "<PlanTask {0} {1} {2!r}>".format(self.state, self.url,
+                                                 self.description)
+
+
+def parse_show_plan(lines):
+    """
+    Description:
+        Parse the output of 'litp show_plan'.
+    Args:
+        lines (list): Lines printed by the command.
+    Returns:
+        tuple. (list of PlanTask, plan status or None)
+    """
+    tasks = []
+    status = None
+    phase = None
+    task = None
+    in_summary = False
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith(_PLAN_STATUS_PREFIX):
+            status = stripped[len(_PLAN_STATUS_PREFIX):].strip()
+            task = None
+            continue
+        if stripped.startswith(_SUMMARY_PREFIX):
+            in_summary = True
+        if in_summary or not stripped.strip('-'):
+            # the summary, separators and blank lines are no task's
+            task = None
+            continue
+        if stripped.startswith('Phase '):
+            phase = stripped
+            task = None
+            continue
+        fields = stripped.split(None, 1)
+        if line[:1] not in ('', ' ', '\t') and fields and \
+                fields[0] in TASK_STATES:
+            task = PlanTask(phase, fields[0],
+                            fields[1] if len(fields) > 1 else '', '')
+            tasks.append(task)
+        elif task is not None:
+            task.description = (task.description + ' ' + stripped).strip()
+        else:
+            task = None
+    return tasks, status
+
+
+class PlanWaiter(object):
+    """
+    Handle returned by PlanWatcher.watch_task/watch_plan.
+
+    done is set when the condition is met or can no longer be met
+    because the plan finished; result tells which.
+    """
+
+    def __init__(self, match, description):
+        self.match = match
+        self.description = description
+        self.done = threading.Event()
+        self.result = None
+        self.seen = None
+
+    def resolve(self, result, seen=None):
+        """Record the outcome and wake up whoever waits on the handle"""
+        if not self.done.is_set():
+            self.result = result
+            self.seen = seen
+            self.done.set()
+
+    def wait(self, timeout=None):
+        """
+        Returns:
+            bool. True if the condition was met within timeout seconds.
+        """
+        self.done.wait(timeout)
+        return bool(self.result)
+
+
+class PlanWatcher(object):
+    """
+    Shared poller of the plan state.
+
+    Example:
+        with PlanWatcher(self, self.ms_node) as watcher:
+            snippet = watcher.watch_task('Create * snippet *', 'Success')
+            self.execute_cli_runplan_cmd(self.ms_node)
+            self.assertTrue(snippet.wait(600))
+    """
+
+    def __init__(self, test, ms_node, interval=2):
+        """
+        Args:
+            test (GenericTest): Test case whose run_command is used.
+            ms_node (str): Filename of the MS.
+            interval (float): Seconds between polls.
+        """
+        self.test = test
+        self.ms_node = ms_node
+        self.interval = interval
+        self.tasks = {}
+        self.status = None
+        self.history = []
+        self._waiters = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        """Start the background poller"""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run,
+                                            name='plan-watcher')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        """Stop the poller; pending waiters are resolved as failed"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            waiter.resolve(False)
+
+    def _run(self):
+        """Poll until stopped"""
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as err:  # pylint: disable=broad-except
+                # a failed poll must not kill the shared poller
+                self.test.log('error', "show_plan poll failed: {0}".format(
+                    err))
+            self._stop.wait(self.interval)
+
+    def poll(self):
+        """
+        Description:
+            Read the plan once, record the task state deltas and notify
+            the waiters. Called by the poller; may be called directly.
+        Returns:
+            list. (task, previous state) of the tasks that changed.
+        """
+        stdout, _, ret = self.test.run_command(self.ms_node, SHOW_PLAN_CMD)
+        if ret != 0:
+            # no plan yet or litpd busy; try again next time
+            return []
+        tasks, status = parse_show_plan(stdout)
+        return self.update(tasks, status)
+
+    def update(self, tasks, status):
+        """
+        Description:
+            Apply one parsed show_plan output.
+        Returns:
+            list. (task, previous state) of the tasks that changed.
+        """
+        now = time.time()
+        changed = []
+        with self._lock:
+            finished = status in PLAN_FINISHED and \
+                self.status not in PLAN_FINISHED
+            for task in tasks:
+                previous = self.tasks.get(task.key)
+                if previous is None or previous.state != task.state:
+                    changed.append(
+                        (task, previous.state if previous else None))
+                    self.history.append((now, task.state, task.description))
+                self.tasks[task.key] = task
+            self.status = status
+            waiters = list(self._waiters)
+        if finished:
+            # the plan may have added or removed nodes
+            invalidate_topology(self.ms_node)
+
+        for waiter in waiters:
+            seen = waiter.match(self)
+            if seen is not None:
+                waiter.resolve(True, seen)
+            elif status in PLAN_FINISHED:
+                waiter.resolve(False)
+        with self._lock:
+            self._waiters = [w for w in self._waiters
+                             if not w.done.is_set()]
+        return changed
+
+    def _add(self, waiter):
+        """Register a waiter and start polling if needed"""
+        with self._lock:
+            self._waiters.append(waiter)
+        self.start()
+        return waiter
+
+    def watch_task(self, pattern, state=TASK_SUCCESS):
+        """
+        Description:
+            Register interest in a task reaching a state.
+        Args:
+            pattern (str): fnmatch pattern of the task description, e.g.
+                'Create "RHEL7" partition kickstart snippet for node "*"'
+            state (str): Task state to wait for.
+        Returns:
+            PlanWaiter. Resolved with the matching PlanTask.
+        """
+        def match(watcher):
+            """First task matching pattern in the wanted state"""
+            for task in watcher.tasks.values():
+                if task.state == state and \
+                        fnmatch.fnmatch(task.description, pattern):
+                    return task
+            return None
+        return self._add(PlanWaiter(match, "{0} -> {1}".format(pattern,
+                                                               state)))
+
+    def watch_plan(self, states=PLAN_FINISHED):
+        """
+        Description:
+            Register interest in the plan reaching one of states.
+        Returns:
+            PlanWaiter. Resolved with the plan status.
+        """
+        def match(watcher):
+            """The plan status if it is one of states"""
+            return watcher.status if watcher.status in states else None
+        return self._add(PlanWaiter(match, "plan -> {0}".format(
+            "|".join(states))))
+
+    def wait_for_task(self, pattern, state=TASK_SUCCESS, timeout=600):
+        """
+        Returns:
+            bool. True if a task matching pattern reached state within
+            timeout seconds.
+        """
+        return self.watch_task(pattern, state).wait(timeout)
+
+    def wait_for_plan(self, states=PLAN_FINISHED, timeout=3600):
+        """
+        Returns:
+            str. Plan status once it is one of states, None on timeout.
+        """
+        waiter = self.watch_plan(states)
+        return waiter.seen if waiter.wait(timeout) else None
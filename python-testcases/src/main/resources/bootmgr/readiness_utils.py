@@ -0,0 +1,210 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Readiness checks for the MS and the peer nodes after a
+            reboot, restore or expansion. Liveness is probed with
+            exponential backoff instead of fixed sleeps and the per node
+            checks run concurrently; the passwords are set one node at
+            a time.
+"""
+import time
+
+import test_constants
+from fanout_utils import NodeFanout
+from topology_utils import get_topology
+
+BOOT_ID_CMD = "/bin/cat /proc/sys/kernel/random/boot_id"
+MCO_PING_CMD = "/usr/bin/mco ping"
+# Run on the MS: succeeds once sshd on the host sends its banner, with
+# no log in, which a reinstalled node does not allow before
+# set_pws_new_node.
+SSH_BANNER_CMD = ("/usr/bin/timeout 5 /bin/bash -c "
+                  "'exec 3<>/dev/tcp/{0}/22 && /usr/bin/head -c 4 <&3' "
+                  "| /bin/grep -q SSH-")
+
+
+def wait_with_backoff(probe, timeout, initial=1, factor=2, max_delay=30):
+    """
+    Description:
+        Call probe until it returns a true value or timeout expires,
+        sleeping initial, initial * factor, ... (at most max_delay)
+        seconds between the calls.
+    Args:
+        probe (callable): Takes no arguments.
+        timeout (float): Seconds to keep probing for.
+        initial (float): First delay.
+        factor (float): Delay multiplier.
+        max_delay (float): Longest delay.
+    Returns:
+        The first true value returned by probe, or its last value.
+    """
+    deadline = time.time() + timeout
+    delay = initial
+    while True:
+        result = probe()
+        remaining = deadline - time.time()
+        if result or remaining <= 0:
+            return result
+        time.sleep(min(delay, remaining))
+        delay = min(delay * factor, max_delay)
+
+
+def read_boot_id(test, node):
+    """
+    Returns:
+        str. The node's boot id, None if the node cannot be reached.
+    """
+    try:
+        stdout, _, ret = test.run_command(node, BOOT_ID_CMD)
+    except Exception:  # pylint: disable=broad-except
+        # the connection drops while the node reboots
+        return None
+    return stdout[0] if ret == 0 and stdout else None
+
+
+def wait_for_reboot(test, node, old_boot_id, timeout=600):
+    """
+    Description:
+        Wait until the node answers with a new boot id, i.e. it went
+        down and came back up, without a fixed sleep for the shutdown.
+    Args:
+        test (GenericTest): Test case whose run_command is used.
+        node (str): Node filename.
+        old_boot_id (str): read_boot_id() before the reboot.
+        timeout (float): Seconds to wait.
+    Returns:
+        bool. True if the node came back within timeout.
+    """
+    def rebooted():
+        """True once the boot id changed"""
+        boot_id = read_boot_id(test, node)
+        return boot_id is not None and boot_id != old_boot_id
+    return wait_with_backoff(rebooted, timeout, initial=5)
+
+
+class NodeReadiness(object):
+    """
+    Post reboot/restore recovery of the peer nodes, run for all the
+    nodes at once.
+
+    Example:
+        readiness = NodeReadiness(self, self.ms_node)
+        readiness.forget_host_keys(self.mn_nodes)
+        self.assertEqual([], readiness.wait_for_ssh(self.mn_nodes))
+        readiness.restore_passwords(self.mn_nodes)
+    """
+
+    def __init__(self, test, ms_node, fanout=None):
+        """
+        Args:
+            test (GenericTest): Test case whose run_command is used.
+            ms_node (str): Filename of the MS.
+            fanout (NodeFanout): Pool for the per node steps.
+        """
+        self.test = test
+        self.ms_node = ms_node
+        self.fanout = fanout if fanout is not None else NodeFanout()
+
+    def hostname_of(self, node):
+        """
+        Returns:
+            str. The node's hostname in the model, from the topology
+            cache; the filename itself for a node the model does not
+            have.
+        """
+        info = get_topology(self.test, self.ms_node).by_filename(node)
+        return info.hostname if info is not None else node
+
+    def forget_host_keys(self, nodes):
+        """
+        Description:
+            Remove the known_hosts entries of all the nodes with one sed
+            call, so the reinstalled nodes' new host keys are accepted.
+        """
+        if not nodes:
+            return
+        cmd = "sed -i {0} {1}/known_hosts".format(
+            " ".join("-e '/{0}/d'".format(node) for node in nodes),
+            test_constants.SSH_KEYS_FOLDER)
+        _, _, ret = self.test.run_command(self.ms_node, cmd)
+        self.test.assertEqual(0, ret)
+
+    def _check_login(self, node):
+        """Log in to one node with its default password"""
+        _, _, ret = self.test.run_command(node, 'hostname')
+        self.test.assertEqual(0, ret)
+
+    def restore_passwords(self, nodes):
+        """
+        Description:
+            Set the default passwords on the nodes one at a time, as
+            each set_pws_new_node call drives its node through the
+            same MS session and files, then check in parallel that
+            each node accepts them.
+        """
+        for node in nodes:
+            self.test.assertTrue(
+                self.test.set_pws_new_node(self.ms_node, node),
+                "Failed to set password on node {0}.".format(node))
+        self.fanout.map(self._check_login, nodes)
+
+    def _ssh_ready(self, node, timeout):
+        """Wait for the sshd of one node to answer the MS"""
+        cmd = SSH_BANNER_CMD.format(self.hostname_of(node))
+
+        def probe():
+            """True once sshd answers"""
+            _, _, ret = self.test.run_command(self.ms_node, cmd)
+            return ret == 0
+        return wait_with_backoff(probe, timeout)
+
+    def wait_for_ssh(self, nodes, timeout=600):
+        """
+        Description:
+            Probe the sshd of all the nodes from the MS concurrently,
+            each with its own backoff.
+        Returns:
+            list. Nodes that did not answer within timeout.
+        """
+        ready = self.fanout.map(self._ssh_ready, nodes, timeout)
+        return [node for node, is_ready in ready.items() if not is_ready]
+
+    def mco_replies(self, nodes):
+        """
+        Returns:
+            set. The nodes that answered one 'mco ping' from the MS,
+            which replies with the hostnames of the nodes.
+        """
+        by_hostname = dict((self.hostname_of(node), node)
+                           for node in nodes)
+        cmd = "{0} {1}".format(MCO_PING_CMD, " ".join(
+            "-I {0}".format(hostname) for hostname in by_hostname))
+        stdout, _, _ = self.test.run_command(self.ms_node, cmd)
+        return set(by_hostname[line.split()[0]] for line in stdout
+                   if 'time=' in line and line.split()[0] in by_hostname)
+
+    def wait_for_mco(self, nodes, timeout=300):
+        """
+        Description:
+            Ping all the nodes with one mco call per attempt, backing off
+            until every node replied.
+        Returns:
+            list. Nodes that did not reply within timeout.
+        """
+        nodes = list(nodes)
+        replied = set()
+
+        def all_replied():
+            """True once every node answered a ping"""
+            replied.update(self.mco_replies(
+                [node for node in nodes if node not in replied]))
+            return replied.issuperset(nodes)
+        wait_with_backoff(all_replied, timeout, initial=2)
+        return [node for node in nodes if node not in replied]
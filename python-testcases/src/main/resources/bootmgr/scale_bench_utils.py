@@ -0,0 +1,142 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Measurement of 'litp create_plan' on the MS: latency, plan
+            size and the memory and CPU used by the LITP service, taken
+            in one round trip and stored as JSON records so runs of
+            different releases can be compared.
+"""
+import fnmatch
+import json
+import os
+import time
+from collections import namedtuple
+
+from bundle_utils import CommandBundle
+from plan_watch_utils import SHOW_PLAN_CMD, parse_show_plan
+
+SNIPPET_TASK = 'Create "*" partition kickstart snippet for node "*"'
+
+# Processes serving the LITP REST API and running its plan tasks. The
+# brackets keep pgrep -f from matching the shells that run the probe,
+# whose command lines hold the pattern itself.
+LITP_PROCESS_PATTERN = "[l]itpd|[c]elery"
+
+# Clock ticks and page size first, then one /proc/<pid>/stat line per
+# LITP process.
+PROC_STATS_CMD = ("/usr/bin/getconf CLK_TCK; /usr/bin/getconf PAGESIZE; "
+                  "for _pid in $(/usr/bin/pgrep -f '{0}'); do "
+                  "/bin/cat /proc/$_pid/stat 2>/dev/null; done").format(
+                      LITP_PROCESS_PATTERN)
+
+# Wall time measured on the MS, so the ssh set up is not counted.
+TIMED_CREATE_PLAN_CMD = ("_start=$(date +%s%N); /usr/bin/litp create_plan; "
+                         "_rc=$?; echo \"ELAPSED_NS $(( $(date +%s%N) - "
+                         "_start ))\"; exit $_rc")
+
+PACKAGES_CMD = ("/bin/rpm -qa --qf '%{NAME} %{VERSION}-%{RELEASE}\\n' "
+                "'ERIClitpbootmgr*' 'ERIClitpcore*'")
+
+ProcessStats = namedtuple('ProcessStats',
+                          ['processes', 'rss_kib', 'cpu_seconds'])
+
+
+def parse_proc_stats(lines):
+    """
+    Description:
+        Sum the resident memory and CPU time of the processes printed
+        by PROC_STATS_CMD.
+    Args:
+        lines (list): Lines printed by PROC_STATS_CMD.
+    Returns:
+        ProcessStats. Totals over all the processes.
+    """
+    ticks = int(lines[0])
+    page_kib = int(lines[1]) // 1024
+    processes = rss_kib = cpu_ticks = 0
+    for line in lines[2:]:
+        # the command name is in parentheses and may contain spaces
+        fields = line.rpartition(')')[2].split()
+        if len(fields) < 22:
+            continue
+        processes += 1
+        cpu_ticks += int(fields[11]) + int(fields[12])
+        rss_kib += int(fields[21]) * page_kib
+    return ProcessStats(processes, rss_kib, float(cpu_ticks) / ticks)
+
+
+def measure_create_plan(test, ms_node, task_pattern=SNIPPET_TASK):
+    """
+    Description:
+        Run 'litp create_plan' on the MS between two samples of the
+        LITP processes and read back the plan, in one run_command call.
+    Args:
+        test (GenericTest): Test case whose run_command is used.
+        ms_node (str): Filename of the MS.
+        task_pattern (str): fnmatch pattern of the task descriptions to
+            count.
+    Returns:
+        dict. The measurement, ready to be stored as JSON.
+    """
+    bundle = CommandBundle([PACKAGES_CMD, PROC_STATS_CMD,
+                            TIMED_CREATE_PLAN_CMD, PROC_STATS_CMD,
+                            SHOW_PLAN_CMD])
+    packages, before, create_plan, after, show_plan = bundle.run(
+        test, ms_node)
+
+    plan_out, plan_err, plan_rc = create_plan
+    elapsed_ns = [line.split()[1] for line in plan_out
+                  if line.startswith('ELAPSED_NS ')]
+    before = parse_proc_stats(before[0])
+    after = parse_proc_stats(after[0])
+    tasks, _ = parse_show_plan(show_plan[0]) if plan_rc == 0 else ([], None)
+
+    return {
+        'packages': dict(line.split(None, 1) for line in packages[0]
+                         if ' ' in line),
+        'create_plan_rc': plan_rc,
+        'create_plan_errors': plan_err,
+        'create_plan_seconds': (int(elapsed_ns[0]) / 1e9
+                                if elapsed_ns else None),
+        'phases': len(set(task.phase for task in tasks)),
+        'tasks': len(tasks),
+        'matching_tasks': len([
+            task for task in tasks
+            if fnmatch.fnmatch(task.description, task_pattern)]),
+        'litp_processes': after.processes,
+        'litp_rss_kib_before': before.rss_kib,
+        'litp_rss_kib_after': after.rss_kib,
+        'litp_cpu_seconds': round(after.cpu_seconds - before.cpu_seconds,
+                                  2),
+    }
+
+
+def record_result(path, name, result):
+    """
+    Description:
+        Add a measurement to the JSON results file, creating it if
+        needed. The file holds a list of records, oldest first.
+    Args:
+        path (str): Results file.
+        name (str): Name of the measurement, e.g. 'create_plan_50'.
+        result (dict): Values measured.
+    Returns:
+        dict. The record written.
+    """
+    records = []
+    if os.path.exists(path):
+        with open(path) as results_file:
+            records = json.load(results_file)
+    record = dict(result, name=name, timestamp=time.strftime(
+        "%Y-%m-%dT%H:%M:%S"))
+    records.append(record)
+    with open(path, 'w') as results_file:
+        json.dump(records, results_file, indent=2, sort_keys=True)
+    return record
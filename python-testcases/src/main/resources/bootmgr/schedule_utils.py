@@ -0,0 +1,352 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Runs the test cases of the test sets concurrently where they
+            do not conflict. The resources a test uses come from its
+            @attr tags, read from the source: tests with a destructive
+            tag (RESOURCE_TAGS) hold their resources exclusively, every
+            other test shares all of them. Tests start in the order of
+            ordered_tcs.txt, then in source order. A destructive test
+            never overtakes an earlier test it conflicts with; read-only
+            tests overtake the destructive tests waiting for resources,
+            so they are not held back behind them.
+
+            Without -a the tests tagged 'all' run. Tests tagged 'bench'
+            (OPT_IN_TAGS) are left out unless -a names the tag.
+
+            Each test runs in its own nosetests process; the xunit
+            reports and the call timings (timing_utils) are merged into
+            one nosetests xml and one timing report.
+
+            Usage: python schedule_utils.py [-j jobs] [-a attr]
+                       [-o nosetests.xml] [--dry-run]
+"""
+import ast
+import glob
+import os
+import subprocess
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ElementTree
+
+import timing_utils
+
+MS = 'ms'
+NODES = 'nodes'
+MODEL = 'model'
+PLAN = 'plan'
+ALL_RESOURCES = frozenset([MS, NODES, MODEL, PLAN])
+
+# Tags of tests that change the deployment, and what they change.
+RESOURCE_TAGS = {
+    'ms_reboot': ALL_RESOURCES,
+    'node_repxe': frozenset([NODES, MODEL, PLAN]),
+    'expansion': frozenset([NODES, MODEL, PLAN]),
+    'model_write': frozenset([MS, MODEL, PLAN]),
+}
+
+# Tests run when no attr is given.
+DEFAULT_ATTRS = ('all',)
+# Tags of tests that only run when asked for by name, e.g. the scale
+# benchmarks.
+OPT_IN_TAGS = frozenset(['bench'])
+
+ORDER_FILE = 'ordered_tcs.txt'
+TESTSET_GLOB = 'testset_*.py'
+NOSE_CMD = ['nosetests']
+
+
+class TestJob(object):
+    """One test case and the resources it holds while it runs"""
+
+    def __init__(self, filename, class_name, method, tags):
+        self.filename = filename
+        self.class_name = class_name
+        self.method = method
+        self.tags = frozenset(tags)
+        self.exclusive = frozenset().union(*[
+            RESOURCE_TAGS[tag] for tag in self.tags if tag in RESOURCE_TAGS])
+        # a destructive test still reads what it does not change
+        self.shared = ALL_RESOURCES - self.exclusive
+
+    @property
+    def read_only(self):
+        """True if the job changes nothing it shares with other jobs"""
+        return not self.exclusive
+
+    @property
+    def name(self):
+        """nosetests name of the test, file:Class.method"""
+        return "{0}:{1}.{2}".format(self.filename, self.class_name,
+                                    self.method)
+
+    @property
+    def order_key(self):
+        """file:method, the form used in ordered_tcs.txt"""
+        return "{0}:{1}".format(self.filename, self.method)
+
+    def conflicts(self, holds):
+        """
+        Returns:
+            bool. True if the job cannot run alongside holds.
+        """
+        return bool(self.exclusive & (holds.shared | holds.exclusive) or
+                    self.shared & holds.exclusive)
+
+    def __repr__(self):
+        return "<TestJob {0}>".format(self.name)
+
+
+class Holds(object):
+    """Resources held, or claimed, by a group of jobs"""
+
+    def __init__(self):
+        self.shared = frozenset()
+        self.exclusive = frozenset()
+
+    def add(self, job):
+        """Add the resources of job"""
+        self.shared |= job.shared
+        self.exclusive |= job.exclusive
+
+
+def _literal(node):
+    """The value of a string literal node, None for anything else"""
+    value = getattr(node, 's', getattr(node, 'value', None))
+    return value if isinstance(value, (str, type(u''))) else None
+
+
+def read_tests(path):
+    """
+    Description:
+        Find the test methods of a test set and their @attr tags
+        without importing it.
+    Args:
+        path (str): Test set file.
+    Returns:
+        list. TestJob per test method, in source order.
+    """
+    with open(path) as source_file:
+        tree = ast.parse(source_file.read(), path)
+    jobs = []
+    for cls in tree.body:
+        if not isinstance(cls, ast.ClassDef):
+            continue
+        for func in cls.body:
+            if not isinstance(func, ast.FunctionDef) or \
+                    not func.name.startswith('test'):
+                continue
+            tags = []
+            for decorator in func.decorator_list:
+                if isinstance(decorator, ast.Call) and \
+                        getattr(decorator.func, 'id', None) == 'attr':
+                    tags.extend(tag for tag in map(_literal, decorator.args)
+                                if tag is not None)
+            jobs.append(TestJob(os.path.basename(path), cls.name,
+                                func.name, tags))
+    return jobs
+
+
+def collect(directory='.', attrs=DEFAULT_ATTRS, order_file=ORDER_FILE):
+    """
+    Description:
+        Collect the test cases of the test sets in directory.
+    Args:
+        directory (str): Directory of the test sets.
+        attrs (tuple): Only keep tests tagged with all these attrs;
+            tests with an OPT_IN_TAGS tag not among them are dropped.
+        order_file (str): File listing file:method in the order the
+            tests must start in, relative to directory.
+    Returns:
+        list. TestJob in start order.
+    """
+    excluded = OPT_IN_TAGS.difference(attrs)
+    jobs = []
+    for path in sorted(glob.glob(os.path.join(directory, TESTSET_GLOB))):
+        jobs.extend(job for job in read_tests(path)
+                    if job.tags.issuperset(attrs) and
+                    not job.tags & excluded)
+    order = []
+    order_path = os.path.join(directory, order_file)
+    if os.path.exists(order_path):
+        with open(order_path) as ordered:
+            order = [line.strip() for line in ordered if line.strip()]
+    position = dict((key, index) for index, key in enumerate(order))
+    return sorted(jobs, key=lambda job: position.get(job.order_key,
+                                                     len(order)))
+
+
+def next_jobs(pending, running):
+    """
+    Description:
+        Pick the pending jobs that can start now. A job starts if it
+        does not conflict with the running jobs and, unless it is read
+        only, with an earlier pending job; destructive jobs keep their
+        order while read-only jobs overtake the ones that wait.
+    Args:
+        pending (list): Jobs not started yet, in start order.
+        running (list): Jobs running.
+    Returns:
+        list. Jobs to start.
+    """
+    held = Holds()
+    for job in running:
+        held.add(job)
+    claimed = Holds()
+    startable = []
+    for job in pending:
+        if not job.conflicts(held) and (job.read_only or
+                                        not job.conflicts(claimed)):
+            startable.append(job)
+            held.add(job)
+        else:
+            claimed.add(job)
+    return startable
+
+
+def plan_waves(jobs, max_jobs=4):
+    """
+    Returns:
+        list. The jobs that would run together, wave by wave, if each
+        wave finished before the next started.
+    """
+    pending = list(jobs)
+    waves = []
+    while pending:
+        wave = next_jobs(pending, [])[:max_jobs]
+        waves.append(wave)
+        pending = [job for job in pending if job not in wave]
+    return waves
+
+
+class Scheduler(object):
+    """Runs jobs in nosetests processes, max_jobs at a time"""
+
+    def __init__(self, jobs, max_jobs=4, report_dir='.', nose_cmd=None,
+                 cwd='.'):
+        self.pending = list(jobs)
+        self.running = []
+        self.results = []
+        self.max_jobs = max_jobs
+        self.report_dir = report_dir
+        self.nose_cmd = list(nose_cmd or NOSE_CMD)
+        self.cwd = cwd
+        self._done = threading.Condition()
+
+    def _xunit_file(self, job):
+        """Report of one job"""
+        return os.path.join(os.path.abspath(self.report_dir),
+                            "nosetests_{0}_{1}.xml".format(
+                                job.filename[:-3], job.method))
+
+    def _run(self, job):
+        """Run one job and record (job, rc, seconds); rc is None if
+        nosetests could not be started"""
+        start = time.time()
+        base = self._xunit_file(job)[:-4]
+        env = dict(os.environ)
+        env[timing_utils.TIMINGS_ENV] = base + '_timings'
+        ret = None
+        try:
+            with open(base + '.log', 'w') as log_file:
+                ret = subprocess.call(
+                    self.nose_cmd + ['--with-xunit', '--xunit-file',
+                                     self._xunit_file(job), job.name],
+                    cwd=self.cwd, env=env, stdout=log_file,
+                    stderr=subprocess.STDOUT)
+        finally:
+            # release the job even if it failed to start, or run()
+            # waits for it forever
+            with self._done:
+                self.running.remove(job)
+                self.results.append((job, ret, time.time() - start))
+                self._done.notify()
+
+    def run(self):
+        """
+        Returns:
+            list. (job, rc, seconds) in completion order.
+        """
+        with self._done:
+            while self.pending or self.running:
+                free = self.max_jobs - len(self.running)
+                for job in next_jobs(self.pending, self.running)[:free]:
+                    self.pending.remove(job)
+                    self.running.append(job)
+                    thread = threading.Thread(target=self._run, args=(job,))
+                    thread.daemon = True
+                    thread.start()
+                if self.running:
+                    self._done.wait()
+        return self.results
+
+    def merge_reports(self, output):
+        """
+        Description:
+            Merge the jobs' xunit reports into one testsuite, and their
+            timing reports into one next to it.
+        Args:
+            output (str): Merged report path.
+        """
+        suite = ElementTree.Element('testsuite', name='nosetests')
+        totals = dict.fromkeys(('tests', 'errors', 'failures', 'skip'), 0)
+        for job, _, _ in self.results:
+            path = self._xunit_file(job)
+            if not os.path.exists(path):
+                continue
+            root = ElementTree.parse(path).getroot()
+            for name in totals:
+                totals[name] += int(root.get(name, 0))
+            for case in root:
+                suite.append(case)
+        for name, value in totals.items():
+            suite.set(name, str(value))
+        ElementTree.ElementTree(suite).write(output, encoding='UTF-8',
+                                             xml_declaration=True)
+        timing_utils.merge_reports(
+            [self._xunit_file(job)[:-4] + '_timings.json'
+             for job, _, _ in self.results],
+            os.path.join(os.path.dirname(output), timing_utils.REPORT_NAME))
+
+
+def main(argv):
+    """Entry point"""
+    args = argv[1:]
+    options = {'-j': '4', '-o': 'nosetests.xml'}
+    attrs = []
+    dry_run = '--dry-run' in args
+    if dry_run:
+        args.remove('--dry-run')
+    while args:
+        flag, value = args.pop(0), args.pop(0)
+        if flag == '-a':
+            attrs.append(value)
+        else:
+            options[flag] = value
+    max_jobs = int(options['-j'])
+    jobs = collect('.', attrs or DEFAULT_ATTRS)
+    if dry_run:
+        for number, wave in enumerate(plan_waves(jobs, max_jobs), 1):
+            sys.stdout.write("{0}: {1}\n".format(
+                number, " ".join(job.name for job in wave)))
+        return 0
+    output = os.path.abspath(options['-o'])
+    scheduler = Scheduler(jobs, max_jobs, os.path.dirname(output))
+    results = scheduler.run()
+    scheduler.merge_reports(output)
+    for job, ret, seconds in results:
+        sys.stdout.write("{0:8.1f}s rc={1} {2}\n".format(seconds, ret,
+                                                         job.name))
+    return 1 if any(ret != 0 for _, ret, _ in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,141 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Normalises the storage sizes found in the model ('16G'),
+            lvscan/lvs ('16.00 GiB'), parted ('1049MB') and kickstart
+            snippets (--size=16384) to integer MiB and compares whole
+            model vs node tables in one pass.
+"""
+from collections import namedtuple
+import re
+
+MIB = 1024 * 1024
+
+# LVM rounds logical volumes up to a whole physical extent
+LVM_EXTENT_MIB = 4
+
+_SIZE_RE = re.compile(
+    r'^\s*<?\s*(?P<value>\d+(?:\.\d+)?)\s*'
+    r'(?P<unit>[kKmMgGtTpP]?)(?P<suffix>i?[bB])?\s*$')
+
+_POWERS = {'': 0, 'K': 1, 'M': 2, 'G': 3, 'T': 4, 'P': 5}
+
+SizeMismatch = namedtuple('SizeMismatch',
+                          ['key', 'expected', 'actual', 'reason'])
+
+
+def to_mib(size, default_unit='M'):
+    """
+    Description:
+        Convert a size to whole MiB.
+
+        A unit letter alone ('16G', '16.00g') or followed by 'iB'
+        ('16.00 GiB') is binary, a unit letter followed by 'B' alone
+        ('1049MB', '500kB') is decimal, as parted prints it. A bare
+        number is in default_unit, e.g. MiB for kickstart --size.
+    Args:
+        size (str|int|float): Size to convert.
+        default_unit (str): Binary unit of bare numbers.
+    Returns:
+        int. The size in MiB, rounded to the nearest MiB.
+    Raises:
+        ValueError if size is not a recognised size.
+    """
+    if isinstance(size, (int, float)) and not isinstance(size, bool):
+        value, unit, suffix = float(size), default_unit, None
+    else:
+        match = _SIZE_RE.match(str(size))
+        if match is None:
+            raise ValueError("Unrecognised size {0!r}".format(size))
+        value = float(match.group('value'))
+        unit = match.group('unit').upper()
+        suffix = match.group('suffix')
+        if not unit and not suffix:
+            unit = default_unit
+
+    power = _POWERS.get(unit.upper())
+    if power is None:
+        raise ValueError("Unrecognised unit in size {0!r}".format(size))
+    if suffix is not None and suffix.upper() == 'B':
+        size_bytes = value * 1000 ** power if unit else value
+    else:
+        size_bytes = value * 1024 ** power
+    return int(round(size_bytes / MIB))
+
+
+def sizes_match(expected, actual, tolerance_mib=0, tolerance_pct=0):
+    """
+    Description:
+        Compare two sizes in any of the forms to_mib accepts.
+    Args:
+        expected: Expected size.
+        actual: Actual size.
+        tolerance_mib (int): Absolute difference allowed, in MiB.
+        tolerance_pct (float): Difference allowed, as a percentage of
+            expected; the larger of the two tolerances applies.
+    Returns:
+        bool. True if the sizes are equal within the tolerance.
+    """
+    expected_mib = to_mib(expected)
+    allowed = max(tolerance_mib, expected_mib * tolerance_pct / 100.0)
+    return abs(to_mib(actual) - expected_mib) <= allowed
+
+
+def compare_tables(expected, actual, tolerance_mib=0, tolerance_pct=0,
+                   missing_ok=False, extra_ok=False):
+    """
+    Description:
+        Compare two tables of sizes in one pass, e.g. model file systems
+        against the logical volumes of a node, both keyed by mount point.
+    Args:
+        expected (dict): key -> size.
+        actual (dict): key -> size.
+        tolerance_mib (int): See sizes_match.
+        tolerance_pct (float): See sizes_match.
+        missing_ok (bool): Accept keys of expected missing from actual.
+        extra_ok (bool): Accept keys of actual missing from expected.
+    Returns:
+        list. SizeMismatch for every key that does not match, reason is
+        'missing', 'extra', 'size' or 'invalid' (unrecognised size).
+        Empty if the tables match.
+    """
+    mismatches = []
+    for key in sorted(set(expected) | set(actual)):
+        if key not in actual:
+            if not missing_ok:
+                mismatches.append(
+                    SizeMismatch(key, expected[key], None, 'missing'))
+            continue
+        if key not in expected:
+            if not extra_ok:
+                mismatches.append(
+                    SizeMismatch(key, None, actual[key], 'extra'))
+            continue
+        try:
+            matched = sizes_match(expected[key], actual[key],
+                                  tolerance_mib, tolerance_pct)
+        except ValueError:
+            mismatches.append(
+                SizeMismatch(key, expected[key], actual[key], 'invalid'))
+            continue
+        if not matched:
+            mismatches.append(
+                SizeMismatch(key, expected[key], actual[key], 'size'))
+    return mismatches
+
+
+def format_mismatches(mismatches):
+    """
+    Returns:
+        str. One line per mismatch, for assertion messages.
+    """
+    return "\n".join(
+        "{0}: expected {1}, found {2} ({3})".format(*mismatch)
+        for mismatch in mismatches)
@@ -0,0 +1,877 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Multiplexed SSH transport with the run_command contract. One
+            connection is kept per node and commands run as exec
+            channels on it, at most max_channels at a time per node
+            (sshd's MaxSessions is 10 by default). A single event loop
+            thread drives every channel of every node with select(), so
+            a test can have commands outstanding on 100 nodes without
+            one worker thread per node.
+
+            su_root commands run in a root shell per node, opened once
+            with 'su -' on a pty of the node's connection, as the
+            framework's run_command does it (the peers give the
+            connection user no sudo). They are written to the shell
+            back to back, each framed as a one command CommandBundle,
+            and complete as their output comes back.
+
+            submit() returns a CommandFuture at once; the *_async
+            helpers are the future returning variants of the
+            GenericTest helpers the test sets use, and gather() waits
+            for a list of futures:
+
+                mux = SSHMux(connect_from_test(self),
+                             root_password_from_test(self))
+                futures = [mux.get_file_contents_async(node, path)
+                           for node in nodes]
+                contents = gather(futures)
+"""
+import os
+import select
+import socket
+import threading
+import time
+import uuid
+from collections import deque
+from multiprocessing.pool import ThreadPool
+
+import paramiko
+
+from bundle_utils import CommandBundle
+
+DEFAULT_MAX_CHANNELS = 8
+DEFAULT_CONNECT_WORKERS = 8
+DEFAULT_TIMEOUT = 600
+SSH_PORT = 22
+CONNECT_TIMEOUT = 30
+
+SU_CMD = 'su -'
+# Once root: no echo, CR/LF translation or signal characters on the
+# pty, and no line editing, history, '!' expansion, job control or
+# prompts in the shell, so its output is exactly what the commands
+# print.
+SHELL_INIT = ("stty raw -echo; set +o emacs +o vi 2>/dev/null; "
+              "set +H 2>/dev/null; set +m; "
+              "unset HISTFILE PROMPT_COMMAND TMOUT 2>/dev/null; "
+              "PS1=''; PS2=''")
+
+_READ_SIZE = 32768
+# Channels are polled at least this often, for stderr and exit status
+# which do not wake select() up.
+_POLL_INTERVAL = 0.05
+_PROMPT_TIMEOUT = 10
+_POKE_INTERVAL = 0.2
+
+
+class SSHMuxError(Exception):
+    """Raised by a future whose command failed in the transport"""
+
+
+class SSHMuxTimeout(SSHMuxError):
+    """Raised by a future whose command or wait timed out"""
+
+
+class SSHMuxConnectError(SSHMuxError):
+    """Raised by a future whose node could not be connected to, or
+    whose root shell could not be opened; the command did not run"""
+
+
+class CommandFuture(object):
+    """
+    Result of a command that may not have completed yet; a minimal
+    concurrent.futures.Future, which Python 2 does not ship.
+    """
+
+    def __init__(self, description=None):
+        self.description = description
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+
+    def done(self):
+        """
+        Returns:
+            bool. True once the result or exception is set.
+        """
+        return self._done.is_set()
+
+    def _set(self, result, exception):
+        """Complete the future and run its callbacks"""
+        with self._lock:
+            if self._done.is_set():
+                return
+            self._result = result
+            self._exception = exception
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def set_result(self, result):
+        """Complete the future with a result"""
+        self._set(result, None)
+
+    def set_exception(self, exception):
+        """Complete the future with an exception"""
+        self._set(None, exception)
+
+    def add_done_callback(self, callback):
+        """Call callback(future) once done, at once if already done"""
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def result(self, timeout=None):
+        """
+        Description:
+            Wait for the future.
+        Args:
+            timeout (float): Seconds to wait, forever if None.
+        Returns:
+            The result.
+        Raises:
+            The exception the future completed with, SSHMuxTimeout if
+            it did not complete in time.
+        """
+        if not self._done.wait(timeout):
+            raise SSHMuxTimeout("Timed out waiting for {0}".format(
+                self.description))
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def then(self, func):
+        """
+        Returns:
+            CommandFuture. Completed with func(result) once this future
+            is done, or with the exception of either.
+        """
+        chained = CommandFuture(self.description)
+
+        def callback(future):
+            """Apply func to the result"""
+            try:
+                chained.set_result(func(future.result(0)))
+            except Exception as err:  # pylint: disable=broad-except
+                chained.set_exception(err)
+        self.add_done_callback(callback)
+        return chained
+
+
+def gather(futures, timeout=None):
+    """
+    Description:
+        Wait for every future.
+    Args:
+        futures (list): CommandFuture objects.
+        timeout (float): Seconds to wait for all of them.
+    Returns:
+        list. Their results, in order.
+    """
+    deadline = None if timeout is None else time.time() + timeout
+    return [future.result(None if deadline is None else
+                          max(0, deadline - time.time()))
+            for future in futures]
+
+
+def _recv_until(channel, done, timeout, poke=None):
+    """
+    Description:
+        Read from a channel until done(received) is true.
+    Args:
+        channel (paramiko.Channel): Channel to read.
+        done (callable): done(bytes received so far) -> bool.
+        timeout (float): Seconds to wait.
+        poke (callable): Called at once and then every _POKE_INTERVAL
+            while nothing satisfies done.
+    Returns:
+        bytes. Everything received.
+    Raises:
+        SSHMuxError if the channel closes or the time runs out first.
+    """
+    received = b''
+    deadline = time.time() + timeout
+    next_poke = 0
+    while not done(received):
+        if poke is not None and time.time() >= next_poke:
+            poke()
+            next_poke = time.time() + _POKE_INTERVAL
+        if channel.recv_ready():
+            received += channel.recv(_READ_SIZE)
+            continue
+        if channel.closed or channel.exit_status_ready():
+            raise SSHMuxError("Channel closed: {0!r}".format(
+                received[-200:]))
+        if time.time() > deadline:
+            raise SSHMuxError("Timed out, last received: {0!r}".format(
+                received[-200:]))
+        select.select([channel], [], [], _POLL_INTERVAL)
+    return received
+
+
+class RootShell(object):
+    """
+    Root shell on a pty of one connection. Thread safe: commands are
+    written in the order submit() is called and run in that order;
+    any thread may wait for any of them, or an event loop may poll()
+    the shell and collect the result() of each.
+
+    Example:
+        shell = RootShell.open(transport, root_password)
+        uid = shell.submit("id -u")
+        umask = shell.submit("umask")
+        (uid_out, _, _), (umask_out, _, _) = shell.wait(uid), \\
+            shell.wait(umask)
+    """
+
+    def __init__(self, channel):
+        self.channel = channel
+        self._write_lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        self._pending = []
+        self._results = {}
+        self._lines = []
+        self._partial = b''
+        self.broken = None
+
+    @classmethod
+    def open(cls, transport, root_password, timeout=_PROMPT_TIMEOUT,
+             su_cmd=SU_CMD):
+        """
+        Description:
+            Become root with su on a new pty of the connection.
+        Args:
+            transport (paramiko.Transport): Connection of a user that
+                may su.
+            root_password (str): Password su asks for.
+            timeout (float): Seconds to wait for each step.
+            su_cmd (str): Command that prompts for the password.
+        Returns:
+            RootShell. Ready for commands.
+        Raises:
+            SSHMuxError if su fails.
+        """
+        channel = transport.open_session()
+        try:
+            channel.get_pty()
+            channel.exec_command(su_cmd)
+            _recv_until(channel, lambda data: b'assword' in data, timeout)
+            channel.sendall((root_password + '\n').encode('utf-8'))
+            ready = "@@ROOT_{0}".format(uuid.uuid4().hex)
+            # split, so that the echo of this line does not match
+            init = "{0}; printf '%s%s\\n' {1} {2}\n".format(
+                SHELL_INIT, ready[:8], ready[8:]).encode('utf-8')
+            expected = ready.encode('utf-8')
+            # su discards what is typed before the shell starts, so the
+            # line is sent again until the shell answers
+            _recv_until(channel, lambda data: expected in [
+                line.strip() for line in data.splitlines()], timeout,
+                        poke=lambda: channel.sendall(init))
+        except Exception:
+            channel.close()
+            raise
+        return cls(channel)
+
+    def submit(self, cmd):
+        """
+        Description:
+            Write a command to the shell without waiting for it.
+        Returns:
+            CommandBundle. Handle to pass to wait() or result().
+        """
+        bundle = CommandBundle([cmd])
+        with self._write_lock:
+            if self.broken is not None:
+                raise SSHMuxError(self.broken)
+            self._pending.append(bundle)
+            try:
+                self.channel.sendall(
+                    (bundle.get_cmd() + '\n').encode('utf-8'))
+            except Exception as err:  # pylint: disable=broad-except
+                self.abort("Write failed: {0}".format(err))
+                raise SSHMuxError(self.broken)
+        return bundle
+
+    def wait(self, bundle, timeout=DEFAULT_TIMEOUT):
+        """
+        Description:
+            Read the shell's output until the command's result is in.
+        Returns:
+            tuple. (stdout lines, stderr lines, rc), as run_command.
+        Raises:
+            SSHMuxError if the shell dies, SSHMuxTimeout if the command
+            times out, after which the shell is not used again.
+        """
+        deadline = time.time() + timeout
+        with self._read_lock:
+            while True:
+                self._poll()
+                if bundle.token in self._results:
+                    return self._results.pop(bundle.token)
+                if self.broken is not None:
+                    raise SSHMuxError(self.broken)
+                if time.time() > deadline:
+                    self.abort("'{0}' timed out after {1}s".format(
+                        bundle.cmds[0], timeout))
+                    raise SSHMuxTimeout(self.broken)
+                select.select([self.channel], [], [], _POLL_INTERVAL)
+
+    def poll(self):
+        """
+        Description:
+            Read what the shell has printed so far, without waiting.
+        Returns:
+            bool. False once the shell is broken or has exited.
+        """
+        with self._read_lock:
+            self._poll()
+        return self.broken is None
+
+    def result(self, bundle):
+        """
+        Returns:
+            tuple. (stdout lines, stderr lines, rc) of a submitted
+            command, None if poll() has not read all of it yet.
+        """
+        with self._read_lock:
+            return self._results.pop(bundle.token, None)
+
+    def _poll(self):
+        """Feed the received data; mark the shell broken if it exited"""
+        while self.broken is None and self.channel.recv_ready():
+            self._feed(self.channel.recv(_READ_SIZE))
+        if self.broken is None and not self.channel.recv_ready() and \
+                (self.channel.closed or self.channel.exit_status_ready()):
+            self.abort("Root shell exited")
+
+    def run(self, cmd, timeout=DEFAULT_TIMEOUT):
+        """
+        Returns:
+            tuple. (stdout lines, stderr lines, rc) of cmd run as root.
+        """
+        return self.wait(self.submit(cmd), timeout)
+
+    def run_many(self, cmds, timeout=DEFAULT_TIMEOUT):
+        """
+        Description:
+            Pipeline commands: write them all, then read the results.
+        Returns:
+            list. (stdout lines, stderr lines, rc) per command.
+        """
+        bundles = [self.submit(cmd) for cmd in cmds]
+        return [self.wait(bundle, timeout) for bundle in bundles]
+
+    def _feed(self, data):
+        """Split received data into lines and complete the commands
+        whose framing has ended"""
+        lines = (self._partial + data).split(b'\n')
+        self._partial = lines.pop()
+        with self._write_lock:
+            pending = list(self._pending)
+        for raw in lines:
+            line = raw.decode('utf-8', 'replace')
+            if not pending:
+                continue
+            self._lines.append(line)
+            bundle = pending[0]
+            if line.startswith(bundle.token + " 0 RC "):
+                self._results[bundle.token] = bundle.parse(self._lines)[0]
+                self._lines = []
+                pending.pop(0)
+                with self._write_lock:
+                    self._pending.remove(bundle)
+
+    @property
+    def usable(self):
+        """True until the shell breaks or exits, e.g. on TMOUT"""
+        return self.broken is None and not self.channel.closed and \
+            not self.channel.exit_status_ready()
+
+    def abort(self, reason):
+        """Mark the shell unusable and close it; commands not complete
+        yet fail with reason"""
+        self.broken = reason
+        self.channel.close()
+
+    def close(self):
+        """Exit the shell"""
+        if self.broken is None:
+            self.abort("Root shell closed")
+
+
+class _Command(object):
+    """A submitted command and, once started, its channel or, run as
+    root, its shell and the bundle framing it there"""
+    __slots__ = ('node', 'cmd', 'su_root', 'future', 'timeout', 'channel',
+                 'shell', 'bundle', 'deadline', 'stdout', 'stderr')
+
+    def __init__(self, node, cmd, su_root, future, timeout):
+        self.node = node
+        self.cmd = cmd
+        self.su_root = su_root
+        self.future = future
+        self.timeout = timeout
+        self.channel = None
+        self.shell = None
+        self.bundle = None
+        self.deadline = None
+        self.stdout = []
+        self.stderr = []
+
+
+class _Host(object):
+    """Connection, root shell, queued and running commands of one node"""
+    __slots__ = ('transport', 'connecting', 'queue', 'running', 'shell',
+                 'opening_shell', 'root_queue')
+
+    def __init__(self):
+        self.transport = None
+        self.connecting = False
+        self.queue = deque()
+        self.running = 0
+        self.shell = None
+        self.opening_shell = False
+        self.root_queue = deque()
+
+
+def _lines(chunks):
+    """Output chunks as run_command style lines"""
+    return b''.join(chunks).decode('utf-8', 'replace').splitlines()
+
+
+class SSHMux(object):
+    """
+    Runs commands on nodes over one multiplexed connection per node.
+    Thread safe: any thread may submit; results are delivered by the
+    event loop thread. A connection that drops, e.g. when its node
+    reboots, is opened again for the next command.
+    """
+
+    def __init__(self, connect, root_password=None,
+                 max_channels=DEFAULT_MAX_CHANNELS,
+                 connect_workers=DEFAULT_CONNECT_WORKERS):
+        """
+        Args:
+            connect (callable): connect(node) -> authenticated
+                paramiko.Transport, e.g. connect_from_test(test).
+            root_password (callable): root_password(node) -> password
+                'su -' asks for, e.g. root_password_from_test(test);
+                su_root commands fail without it.
+            max_channels (int): Commands run at once per node; the
+                others queue. Root commands share the one root shell.
+            connect_workers (int): Connections and root shells set up
+                at once.
+        """
+        self.connect = connect
+        self.root_password = root_password
+        self.max_channels = max(1, int(max_channels))
+        self._hosts = {}
+        self._running = []
+        self._root_running = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake_r, self._wake_w = os.pipe()
+        self._connector = ThreadPool(max(1, int(connect_workers)))
+        self._thread = threading.Thread(target=self._loop, name='ssh-mux')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Stop the loop, fail what is left and close the connections"""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._wake()
+        self._thread.join()
+        self._connector.close()
+        self._connector.join()
+        with self._lock:
+            hosts, self._hosts = self._hosts, {}
+        for host in hosts.values():
+            for command in list(host.queue) + list(host.root_queue):
+                command.future.set_exception(SSHMuxTimeout("SSHMux closed"))
+            if host.shell is not None:
+                host.shell.close()
+            if host.transport is not None:
+                host.transport.close()
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+
+    def _wake(self):
+        """Interrupt the select() of the loop"""
+        try:
+            os.write(self._wake_w, b'x')
+        except OSError:
+            pass
+
+    def submit(self, node, cmd, su_root=False, timeout=DEFAULT_TIMEOUT):
+        """
+        Description:
+            Queue a command on a node.
+        Args:
+            node (str): Node filename.
+            cmd (str): Shell command.
+            su_root (bool): Run the command as root, in the node's root
+                shell.
+            timeout (float): Seconds the command may run.
+        Returns:
+            CommandFuture. Of (stdout lines, stderr lines, rc).
+        """
+        future = CommandFuture("'{0}' on {1}{2}".format(
+            cmd, node, " as root" if su_root else ""))
+        if self._stop.is_set():
+            future.set_exception(SSHMuxTimeout("SSHMux closed"))
+            return future
+        if su_root and self.root_password is None:
+            future.set_exception(SSHMuxConnectError(
+                "No root password to su with on {0}".format(node)))
+            return future
+        command = _Command(node, cmd, su_root, future, timeout)
+        with self._lock:
+            host = self._hosts.setdefault(node, _Host())
+            if su_root:
+                host.root_queue.append(command)
+            else:
+                host.queue.append(command)
+        self._wake()
+        return future
+
+    def run_command(self, node, cmd, su_root=False, timeout=DEFAULT_TIMEOUT,
+                    **kwargs):
+        """
+        Same contract as GenericTest.run_command: returns a tuple of
+        (stdout lines, stderr lines, return code).
+        """
+        # pylint: disable=unused-argument
+        return self.submit(node, cmd, su_root, timeout).result()
+
+    def _fail_queued(self, node, queue_name, error):
+        """Fail the commands queued on a node that cannot run"""
+        with self._lock:
+            host = self._hosts.get(node)
+            if host is None:
+                return
+            queue = getattr(host, queue_name)
+            commands = list(queue)
+            queue.clear()
+        for command in commands:
+            command.future.set_exception(error)
+
+    def _connect(self, node):
+        """Set up the connection of a node, in a connector thread"""
+        try:
+            transport = self.connect(node)
+        except Exception as err:  # pylint: disable=broad-except
+            error = SSHMuxConnectError("Cannot connect to {0}: {1}".format(
+                node, err))
+            self._fail_queued(node, 'queue', error)
+            self._fail_queued(node, 'root_queue', error)
+            with self._lock:
+                host = self._hosts.get(node)
+                if host is not None:
+                    host.connecting = False
+            return
+        with self._lock:
+            host = self._hosts.get(node)
+            if host is None:
+                transport.close()
+                return
+            host.transport = transport
+            host.connecting = False
+        self._wake()
+
+    def _open_shell(self, node, transport):
+        """Open the root shell of a node, in a connector thread"""
+        try:
+            shell = RootShell.open(transport, self.root_password(node))
+        except Exception as err:  # pylint: disable=broad-except
+            self._fail_queued(node, 'root_queue', SSHMuxConnectError(
+                "Cannot su to root on {0}: {1}".format(node, err)))
+            with self._lock:
+                host = self._hosts.get(node)
+                if host is not None:
+                    host.opening_shell = False
+            return
+        with self._lock:
+            host = self._hosts.get(node)
+            if host is None:
+                shell.close()
+                return
+            host.shell = shell
+            host.opening_shell = False
+        self._wake()
+
+    def _start_queued(self):
+        """Connect the nodes and open the root shells queued commands
+        need, then start the commands while the nodes have room"""
+        connecting, opening, starting, root_starting = [], [], [], []
+        with self._lock:
+            for node, host in self._hosts.items():
+                if host.transport is not None and \
+                        not host.transport.is_active():
+                    # dropped, e.g. the node rebooted
+                    host.transport = None
+                    host.shell = None
+                if host.transport is None:
+                    if (host.queue or host.root_queue) and \
+                            not host.connecting:
+                        host.connecting = True
+                        connecting.append(node)
+                    continue
+                while host.queue and host.running < self.max_channels:
+                    host.running += 1
+                    starting.append((host, host.queue.popleft()))
+                if not host.root_queue:
+                    continue
+                if host.shell is not None and host.shell.usable:
+                    while host.root_queue:
+                        root_starting.append((host.shell,
+                                              host.root_queue.popleft()))
+                elif not host.opening_shell:
+                    host.opening_shell = True
+                    opening.append((node, host.transport))
+        for node in connecting:
+            self._connector.apply_async(self._connect, (node,))
+        for node, transport in opening:
+            self._connector.apply_async(self._open_shell, (node, transport))
+        for host, command in starting:
+            try:
+                command.channel = host.transport.open_session()
+                command.channel.setblocking(0)
+                command.channel.exec_command(command.cmd)
+            except Exception as err:  # pylint: disable=broad-except
+                self._finish(command, exception=err)
+                continue
+            command.deadline = time.time() + command.timeout
+            self._running.append(command)
+        for shell, command in root_starting:
+            try:
+                command.bundle = shell.submit(command.cmd)
+            except Exception as err:  # pylint: disable=broad-except
+                self._finish(command, exception=err)
+                continue
+            command.shell = shell
+            command.deadline = time.time() + command.timeout
+            self._root_running.append(command)
+
+    def _finish(self, command, result=None, exception=None):
+        """Release the command's channel and complete its future"""
+        if command.channel is not None:
+            command.channel.close()
+        if not command.su_root:
+            with self._lock:
+                host = self._hosts.get(command.node)
+                if host is not None:
+                    host.running -= 1
+        if exception is not None:
+            command.future.set_exception(exception)
+        else:
+            command.future.set_result(result)
+
+    @staticmethod
+    def _read(command):
+        """
+        Returns:
+            bool. True once the command has exited and its output has
+            been read.
+        Raises:
+            SSHMuxError if the channel closed without an exit status.
+        """
+        channel = command.channel
+        while channel.recv_ready():
+            command.stdout.append(channel.recv(_READ_SIZE))
+        while channel.recv_stderr_ready():
+            command.stderr.append(channel.recv_stderr(_READ_SIZE))
+        if channel.exit_status_ready():
+            return (channel.eof_received or channel.closed) and \
+                not channel.recv_ready() and \
+                not channel.recv_stderr_ready()
+        if channel.closed:
+            raise SSHMuxError("{0}: connection lost".format(
+                command.future.description))
+        return False
+
+    def _poll_running(self, now):
+        """Complete the exec commands that have exited or timed out"""
+        still_running = []
+        for command in self._running:
+            try:
+                exited = self._read(command)
+            except Exception as err:  # pylint: disable=broad-except
+                self._finish(command, exception=err)
+                continue
+            if exited:
+                self._finish(command, (_lines(command.stdout),
+                                       _lines(command.stderr),
+                                       command.channel.recv_exit_status()))
+            elif now > command.deadline:
+                self._finish(command, exception=SSHMuxTimeout(
+                    "{0} timed out after {1}s".format(
+                        command.future.description, command.timeout)))
+            else:
+                still_running.append(command)
+        self._running = still_running
+
+    def _poll_root_running(self, now):
+        """Complete the root commands whose results are in, and fail
+        those of broken shells"""
+        for shell in set(command.shell for command in self._root_running):
+            shell.poll()
+        still_running = []
+        for command in self._root_running:
+            result = command.shell.result(command.bundle)
+            if result is not None:
+                self._finish(command, result)
+            elif command.shell.broken is not None:
+                self._finish(command,
+                             exception=SSHMuxError(command.shell.broken))
+            elif now > command.deadline:
+                # what the shell prints next cannot be told apart from
+                # the late output of this command: drop the shell
+                command.shell.abort("{0} timed out after {1}s".format(
+                    command.future.description, command.timeout))
+                self._finish(command,
+                             exception=SSHMuxTimeout(command.shell.broken))
+            else:
+                still_running.append(command)
+        self._root_running = still_running
+
+    def _loop(self):
+        """The event loop: start, poll and complete the commands"""
+        while not self._stop.is_set():
+            self._start_queued()
+            readable = [self._wake_r] + \
+                [command.channel for command in self._running] + \
+                list(set(command.shell.channel
+                         for command in self._root_running))
+            try:
+                ready, _, _ = select.select(readable, [], [],
+                                            _POLL_INTERVAL)
+            except (select.error, ValueError):
+                # a channel closed under us; the poll below handles it
+                ready = []
+            if self._wake_r in ready:
+                os.read(self._wake_r, 4096)
+            now = time.time()
+            self._poll_running(now)
+            self._poll_root_running(now)
+        for command in self._running + self._root_running:
+            self._finish(command, exception=SSHMuxTimeout("SSHMux closed"))
+        self._running = []
+        self._root_running = []
+
+    def run_command_async(self, node, cmd, su_root=False,
+                          timeout=DEFAULT_TIMEOUT):
+        """
+        Returns:
+            CommandFuture. Of run_command's (stdout, stderr, rc).
+        """
+        return self.submit(node, cmd, su_root, timeout)
+
+    def run_bundle_async(self, node, bundle, su_root=False,
+                         timeout=DEFAULT_TIMEOUT):
+        """
+        Returns:
+            CommandFuture. Of CommandBundle.run's per command results.
+        """
+        return self.submit(node, bundle.get_cmd(), su_root, timeout).then(
+            lambda result: bundle.parse(result[0]))
+
+    def get_file_contents_async(self, node, path, su_root=False):
+        """
+        Returns:
+            CommandFuture. Of the lines of the file, failing with
+            AssertionError if it cannot be read, as
+            GenericTest.get_file_contents does.
+        """
+        def contents(result):
+            """The file's lines"""
+            stdout, stderr, ret = result
+            if ret != 0 or stderr:
+                raise AssertionError("Cannot read {0} on {1}: {2}".format(
+                    path, node, "\n".join(stderr)))
+            return stdout
+        return self.submit(node, "/bin/cat {0}".format(path),
+                           su_root).then(contents)
+
+    def remote_path_exists_async(self, node, path, expect_file=True,
+                                 su_root=False):
+        """
+        Returns:
+            CommandFuture. Of True if path exists on node and is a file
+            (a directory if expect_file is False).
+        """
+        test_flag = '-f' if expect_file else '-d'
+        return self.submit(node, "[ {0} {1} ]".format(test_flag, path),
+                           su_root).then(lambda result: result[2] == 0)
+
+
+def connect_node(address, user, password, port=SSH_PORT,
+                 timeout=CONNECT_TIMEOUT):
+    """
+    Returns:
+        paramiko.Transport. Authenticated connection to address.
+    """
+    sock = socket.create_connection((address, port), timeout)
+    # root shell commands are small writes each waiting for an answer
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    transport = paramiko.Transport(sock)
+    try:
+        transport.connect(username=user, password=password)
+    except Exception:
+        transport.close()
+        raise
+    return transport
+
+
+def connect_from_test(test, port=SSH_PORT, timeout=CONNECT_TIMEOUT):
+    """
+    Returns:
+        callable. connect(node) opening a connection with the address
+        and credentials of the test's connection data.
+    """
+    def connect(node):
+        """Connect and authenticate to node"""
+        return connect_node(test.get_node_att(node, 'ipv4'),
+                            test.get_node_att(node, 'username'),
+                            test.get_node_att(node, 'password'),
+                            port, timeout)
+    return connect
+
+
+def root_password_from_test(test):
+    """
+    Returns:
+        callable. root_password(node) from the test's connection data.
+    """
+    return lambda node: test.get_node_att(node, 'rootpw')
+
+
+def run_bundles(mux, nodes, bundle, su_root=False):
+    """
+    Description:
+        Run the same bundle on every node at once.
+    Returns:
+        dict. node -> per command results.
+    """
+    futures = [mux.run_bundle_async(node, CommandBundle(bundle.cmds),
+                                    su_root) for node in nodes]
+    return dict(zip(nodes, gather(futures)))
@@ -0,0 +1,126 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Routes a test's run_command calls through one SSHMux shared
+            by the test session: a connection per node and a root
+            shell per node, each opened on first use and kept until
+            the interpreter exits, so su_root commands cost neither a
+            connection, a pty nor a password exchange.
+
+            The pool is off unless BOOTMGR_SSH_POOL=on. Turned on,
+            install() replaces the run_command of Story588 and
+            Story4016 in their setUp, so their commands do not go
+            through the framework's transport at all, and its
+            run_command logging, cleanup and connection handling
+            (including the host key check) do not apply to them. Calls
+            the pool cannot make (other arguments, e.g. another
+            username or add_to_cleanup) and nodes it cannot reach (e.g.
+            in a fake MS run) still go to the framework's
+            run_command.
+"""
+import atexit
+import os
+import threading
+
+from ssh_mux_utils import SSHMux, SSHMuxConnectError, connect_from_test, \
+    root_password_from_test
+
+POOL_ENV = 'BOOTMGR_SSH_POOL'
+
+# run_command keyword arguments the pool handles itself.
+POOLED_KWARGS = ('su_root', 'default_asserts', 'logging')
+
+_POOL = []
+_POOL_LOCK = threading.Lock()
+
+
+def get_pool(test):
+    """
+    Returns:
+        SSHMux. The mux shared by the test session, connecting with
+        the connection data of the first test, closed when the
+        interpreter exits.
+    """
+    with _POOL_LOCK:
+        if not _POOL:
+            _POOL.append(SSHMux(connect_from_test(test),
+                                root_password_from_test(test)))
+            atexit.register(_POOL[0].close)
+        return _POOL[0]
+
+
+class PooledRunCommand(object):
+    """run_command of a test, through the pool where it can be"""
+
+    def __init__(self, test, pool, run_command):
+        self.test = test
+        self.pool = pool
+        self.fallback = run_command
+        self._unreachable = set()
+
+    def _pooled(self, node, cmd, su_root):
+        """
+        Returns:
+            tuple. (stdout, stderr, rc) from the pool, None if the pool
+            cannot reach the node.
+        """
+        key = (node, bool(su_root))
+        if key in self._unreachable:
+            return None
+        try:
+            self.test.get_node_att(node, 'ipv4')
+        except Exception:  # pylint: disable=broad-except
+            # not a node of the connection data, e.g. in a fake MS run
+            return None
+        try:
+            return self.pool.run_command(node, cmd, su_root=su_root)
+        except SSHMuxConnectError as err:
+            self._unreachable.add(key)
+            self.test.log('info', "SSH pool cannot reach {0}{1} ({2}), "
+                          "using run_command".format(
+                              node, " as root" if su_root else "", err))
+            return None
+
+    def __call__(self, node, cmd, *args, **kwargs):
+        if args or set(kwargs) - set(POOLED_KWARGS):
+            return self.fallback(node, cmd, *args, **kwargs)
+        result = self._pooled(node, cmd, kwargs.get('su_root', False))
+        if result is None:
+            return self.fallback(node, cmd, **kwargs)
+        if kwargs.get('logging', True):
+            self.test.log('debug', "[{0}{1}] {2} -> rc {3}".format(
+                'root@' if kwargs.get('su_root') else '', node, cmd,
+                result[2]))
+        if kwargs.get('default_asserts'):
+            self.test.assertEqual([], result[1])
+            self.test.assertEqual(0, result[2])
+        return result
+
+
+def install(test, setting=None):
+    """
+    Description:
+        Route the test's run_command calls through the session's SSH
+        pool if BOOTMGR_SSH_POOL is 'on'. Call in setUp, after the
+        super class setUp and before instrumenting the test.
+    Args:
+        test (GenericTest): Test case to route.
+        setting (str): 'on' or 'off'; read from the environment by
+            default, 'off' if it is not set.
+    Returns:
+        SSHMux or None.
+    """
+    if setting is None:
+        setting = os.environ.get(POOL_ENV, 'off')
+    if setting.lower() not in ('on', '1', 'true', 'yes'):
+        return None
+    pool = get_pool(test)
+    test.run_command = PooledRunCommand(test, pool, test.run_command)
+    return pool
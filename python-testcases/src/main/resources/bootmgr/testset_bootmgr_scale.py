@@ -0,0 +1,214 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Scale benchmark of the bootmgr plan generation: create_plan
+            for 1, 10, 50 and 200 synthetic PXE booted nodes, recording
+            its latency, the number of kickstart snippet tasks and the
+            memory and CPU used by LITP on the MS.
+
+            The results are appended to the JSON file named by the
+            BOOTMGR_SCALE_RESULTS environment variable, by default
+            bootmgr_scale_results.json in the working directory.
+"""
+import os
+
+from litp_generic_test import GenericTest, attr
+from timing_utils import instrument as instrument_timing
+from model_snapshot_utils import ModelSnapshot
+from expansion_utils import ClusterSpec, SyntheticClusterSpec, \
+    ExpansionBuilder, Topology, generate_expansion
+from scale_bench_utils import measure_create_plan, record_result
+
+CLUSTER_SPEC_FILE = '192.168.0.42_4node.sh'
+RESULTS_FILE = os.environ.get('BOOTMGR_SCALE_RESULTS',
+                              'bootmgr_scale_results.json')
+# VCS clusters are kept well below the 64 node limit.
+NODES_PER_CLUSTER = 16
+CLUSTER_PREFIX = 'scale_c'
+NO_PLAN_ERROR = 'Plan does not exist'
+
+
+class BootmgrScale(GenericTest):
+    """
+    Measure how create_plan behaves as the number of nodes to PXE boot
+    grows, so regressions in the bootmgr task generation show up between
+    releases. The plans are created only, never run.
+    """
+
+    def setUp(self):
+        """
+        Description:
+            Runs before every single test
+        """
+        super(BootmgrScale, self).setUp()
+        instrument_timing(self)
+        self.test_ms = self.get_management_node_filename()
+        self.model = ModelSnapshot(self, self.test_ms)
+
+    def tearDown(self):
+        """
+        Description:
+            Runs after every single test; drops the plan and the
+            synthetic nodes, which were never applied.
+        """
+        _, stderr, ret = self.run_command(self.test_ms,
+                                          "/usr/bin/litp remove_plan")
+        # the test may have failed before create_plan
+        if ret != 0:
+            self.assertTrue(
+                any(NO_PLAN_ERROR in line for line in stderr),
+                "remove_plan failed: {0}".format("\n".join(stderr)))
+        _, stderr, ret = self.run_command(self.test_ms,
+                                          "/usr/bin/litp restore_model")
+        self.assertEqual(0, ret, "restore_model failed, the synthetic "
+                         "nodes are left in the model: {0}".format(
+                             "\n".join(stderr)))
+        super(BootmgrScale, self).tearDown()
+
+    def _create_nodes(self, node_count):
+        """
+        Description:
+            Load node_count synthetic nodes, each with its system,
+            storage profile and PXE boot interface, into new clusters
+            of at most NODES_PER_CLUSTER nodes.
+        Returns:
+            list. Urls of the new nodes.
+        """
+        spec = ClusterSpec.fetch(self, self.test_ms, CLUSTER_SPEC_FILE)
+        # start after the nodes the spec file describes, which are used
+        # by the expansion test sets
+        first_index = max(max(elements) for elements in
+                          spec.arrays.values() if elements) + 1
+        cluster_count = -(-node_count // NODES_PER_CLUSTER)
+        deployment_url = self.model.find('/deployments', 'deployment')[0]
+
+        builder = ExpansionBuilder(self.model)
+        node_urls = generate_expansion(
+            builder, SyntheticClusterSpec(spec.arrays),
+            Topology.spread(node_count, cluster_count,
+                            prefix=CLUSTER_PREFIX),
+            deployment_url=deployment_url, first_index=first_index)
+        builder.load(self, self.test_ms)
+        self.model.invalidate()
+        return node_urls
+
+    def _benchmark_create_plan(self, node_count):
+        """
+        Description:
+            Create the nodes, measure create_plan and record the result
+            before checking it, so failed runs are recorded too.
+        """
+        node_urls = self._create_nodes(node_count)
+        result = measure_create_plan(self, self.test_ms)
+        record = record_result(RESULTS_FILE,
+                               'create_plan_{0}'.format(node_count),
+                               dict(result, nodes=len(node_urls)))
+        self.log('info', "create_plan for {0} nodes: {1}s, {2} tasks, "
+                 "{3} snippet tasks, {4}s LITP CPU, {5} KiB LITP RSS".format(
+                     node_count, record['create_plan_seconds'],
+                     record['tasks'], record['matching_tasks'],
+                     record['litp_cpu_seconds'],
+                     record['litp_rss_kib_after']))
+
+        self.assertEqual(0, result['create_plan_rc'],
+                         "\n".join(result['create_plan_errors']))
+        self.assertEqual(node_count, result['matching_tasks'])
+
+    @attr('bench', 'bootmgr_scale', 'bootmgr_scale_tc01',
+          'model_write')
+    def test_01_p_create_plan_1_node(self):
+        """
+        @tms_id: bootmgr_scale_tc01
+        @tms_requirements_id: NA
+        @tms_title: create_plan scale benchmark for 1 node
+        @tms_description:
+            Measure create_plan for 1 new PXE booted node.
+        @tms_test_steps:
+            @step: Load 1 synthetic node with a storage profile and a PXE
+            boot interface
+            @result: Node added to the model
+            @step: create_plan, sampling the LITP processes before and
+            after it
+            @result: Plan created with one kickstart snippet task per node
+            @step: Append the measurement to the JSON results file
+            @result: Results recorded
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        self._benchmark_create_plan(1)
+
+    @attr('bench', 'bootmgr_scale', 'bootmgr_scale_tc02',
+          'model_write')
+    def test_02_p_create_plan_10_nodes(self):
+        """
+        @tms_id: bootmgr_scale_tc02
+        @tms_requirements_id: NA
+        @tms_title: create_plan scale benchmark for 10 nodes
+        @tms_description:
+            Measure create_plan for 10 new PXE booted nodes.
+        @tms_test_steps:
+            @step: Load 10 synthetic nodes with storage profiles and PXE
+            boot interfaces
+            @result: Nodes added to the model
+            @step: create_plan, sampling the LITP processes before and
+            after it
+            @result: Plan created with one kickstart snippet task per node
+            @step: Append the measurement to the JSON results file
+            @result: Results recorded
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        self._benchmark_create_plan(10)
+
+    @attr('bench', 'bootmgr_scale', 'bootmgr_scale_tc03',
+          'model_write')
+    def test_03_p_create_plan_50_nodes(self):
+        """
+        @tms_id: bootmgr_scale_tc03
+        @tms_requirements_id: NA
+        @tms_title: create_plan scale benchmark for 50 nodes
+        @tms_description:
+            Measure create_plan for 50 new PXE booted nodes.
+        @tms_test_steps:
+            @step: Load 50 synthetic nodes with storage profiles and PXE
+            boot interfaces
+            @result: Nodes added to the model
+            @step: create_plan, sampling the LITP processes before and
+            after it
+            @result: Plan created with one kickstart snippet task per node
+            @step: Append the measurement to the JSON results file
+            @result: Results recorded
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        self._benchmark_create_plan(50)
+
+    @attr('bench', 'bootmgr_scale', 'bootmgr_scale_tc04',
+          'model_write')
+    def test_04_p_create_plan_200_nodes(self):
+        """
+        @tms_id: bootmgr_scale_tc04
+        @tms_requirements_id: NA
+        @tms_title: create_plan scale benchmark for 200 nodes
+        @tms_description:
+            Measure create_plan for 200 new PXE booted nodes.
+        @tms_test_steps:
+            @step: Load 200 synthetic nodes with storage profiles and PXE
+            boot interfaces
+            @result: Nodes added to the model
+            @step: create_plan, sampling the LITP processes before and
+            after it
+            @result: Plan created with one kickstart snippet task per node
+            @step: Append the measurement to the JSON results file
+            @result: Results recorded
+        @tms_test_precondition: NA
+        @tms_execution_type: Automated
+        """
+        self._benchmark_create_plan(200)
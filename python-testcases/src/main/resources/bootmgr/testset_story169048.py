@@ -11,10 +11,22 @@ program(s) have been supplied.
 @summary:   Integration Tests
             Agile: TORF-169048
 """
+from collections import OrderedDict
+
 import test_constants
 from litp_generic_test import GenericTest, attr
+from timing_utils import instrument as instrument_timing
 from vcs_utils import VCSUtils
 from xml_utils import XMLUtils
+from readiness_utils import NodeReadiness
+from model_snapshot_utils import ModelSnapshot
+from expansion_utils import ClusterSpec, ExpansionBuilder, Topology, \
+    generate_expansion
+from transcript_utils import install as install_transcript
+from fanout_utils import NodeFanout
+from network_facts_utils import NetworkFacts, probe_ssh
+from topology_utils import attach as attach_topology, get_topology
+from vcs_state_utils import VcsState
 from lxml import etree
 PXE_BOOT_DEV = "eth1"
 LITP_PXE_BOOT_IF = "if1"
@@ -40,9 +52,12 @@ class Story169048(GenericTest):
 
     def setUp(self):
         super(Story169048, self).setUp()
-        self.test_ms = self.get_management_node_filename()
+        instrument_timing(self)
+        self.test_ms = attach_topology(self).ms_node
         self.vcs = VCSUtils()
         self.xml = XMLUtils()
+        self.fanout = NodeFanout()
+        install_transcript(self)
 
     def tearDown(self):
         super(Story169048, self).tearDown()
@@ -74,67 +89,83 @@ class Story169048(GenericTest):
         self.assertEqual([], root.xpath(".//*[@id='{0}']/ipaddress/text()".
                                         format(LITP_PXE_BOOT_IF)))
 
-    def chk_intf_ip_conf_on_node(self, node_to_check, dev_name, ipaddr):
+    def get_network_facts(self, node):
+        """
+        Description:
+            Read the ifcfg files, addresses and bonds of a node in one
+            call.
+        Args:
+            node (str): Hostname of node to be read.
+        Returns:
+            NetworkFacts.
+        """
+        return NetworkFacts.fetch(self, node,
+                                  test_constants.NETWORK_SCRIPTS_DIR)
+
+    def chk_intf_ip_conf_on_node(self, facts, dev_name, ipaddr):
         """
         Description:
             Function to query the multicast options values which is set
             in the ifcfg file of the specified Network Interface.
             Verify IPADDR applied from ifcfg file only for mgmt bond interface.
         Args:
-            node_to_check (str): Hostname of node to be verified.
+            facts (NetworkFacts): Network facts of the node to be verified.
             dev_name (str): suffix file name of the ifcfg file.
             ipaddr (str): IP address value to be searched for.
         """
-        filepath = test_constants.NETWORK_SCRIPTS_DIR + \
-            '/ifcfg-{0}'.format(dev_name)
-        stdout = self.get_file_contents(node_to_check, filepath)
-        ip_line = 'IPADDR="{0}"'.format(ipaddr)
+        self.assertTrue(dev_name in facts.ifcfg,
+                        'ifcfg-{0} not found on {1}'.format(dev_name,
+                                                          facts.node))
         if dev_name == MGMT_BOND_NAME:
-            self.assertTrue(self.is_text_in_list(ip_line, stdout),
-                            'IPADDR property should be present.')
+            self.assertEqual(ipaddr, facts.ifcfg_value(dev_name, 'IPADDR'),
+                             'IPADDR property should be present.')
         else:
-            self.assertFalse(self.is_text_in_list(ip_line, stdout),
-                             'IPADDR property should not be present.')
+            self.assertNotEqual(ipaddr,
+                                facts.ifcfg_value(dev_name, 'IPADDR'),
+                                'IPADDR property should not be present.')
 
-    def check_mii_state(self, node, exp_state):
+    def check_mii_state(self, nodes, exp_state):
         """
-        Method to run vcs command on node and check state of Mii attribute
+        Method to read the vcs resource states of the clusters of the
+        nodes, one call per cluster, and check state of Mii attribute
         Args:
-            node (str): Specifies the location of the Service Group to
-                perform Mii check on.
+            nodes (list): Hostnames of the nodes whose pxe boot device
+              Service Group resources to perform Mii check on.
             exp_state (str): 1 or 0 state of Mii attribute for service group
               resources
         """
-        if node == 'node2':
-            cmd = self.vcs.get_hagrp_resource_list_cmd('Grp_NIC_' +
-                                                       FIRST_CLUSTER_ID +
-                                                       '_' + PXE_BOOT_DEV)
-        else:
-            cmd = self.vcs.get_hagrp_resource_list_cmd('Grp_NIC_' +
-                                                       SECOND_CLUSTER_ID +
-                                                       '_' + PXE_BOOT_DEV)
-
-        stdout = self.run_command(node, cmd, su_root=True,
-                                  default_asserts=True)
-
-        cmd = self.vcs.get_hares_cmd('-value {0} Mii'
-                                     .format(stdout[0][0]))
+        topology = get_topology(self, self.test_ms)
+        by_cluster = OrderedDict()
+        for node in nodes:
+            cluster_id = topology.by_hostname(node).cluster_url.rsplit(
+                '/', 1)[-1]
+            by_cluster.setdefault(cluster_id, []).append(node)
 
-        stdout = self.run_command(node, cmd, su_root=True,
-                                  default_asserts=True)
-        self.assertEqual(stdout[0][0], exp_state)
+        for cluster_id, cluster_nodes in by_cluster.items():
+            state = VcsState.fetch(self, cluster_nodes[0], vcs=self.vcs)
+            group = 'Grp_NIC_' + cluster_id + '_' + PXE_BOOT_DEV
+            self.assertNotEqual([], state.resources_of(group),
+                                'No resources found in {0}'.format(group))
+            for node in cluster_nodes:
+                mii = state.group_values(group, 'Mii', node)
+                self.assertEqual(dict.fromkeys(mii, exp_state), mii,
+                                 'Unexpected Mii state on {0}'.format(node))
 
-    def check_ssh_connectivity(self, node, ip_to_check):
+    def check_ssh_connectivity(self, ips_by_node):
         """
         Function to test TCP/IP layer 4 connectivity using ssh port.
+        All the nodes are checked at once, each in a single call.
         Args:
-            node (str): Hostname of node from where the check is executed.
-            ip_to_check (str): IP address assigned to the bond.
+            ips_by_node (dict): Hostname of node from where the check is
+                executed -> IP addresses to check from it.
         """
-        stdout = self.run_command(node, 'echo "QUIT" | nc -w 5 {0} 22'.
-                                  format(ip_to_check), default_asserts=True)
-        self.assertTrue(self.is_text_in_list('OpenSSH_', stdout[0]),
-                        'The IP address is not reachable')
+        def check_node(node):
+            """Probe the addresses of one node"""
+            reachable = probe_ssh(self, node, ips_by_node[node])
+            self.assertEqual([], sorted(ip for ip, is_up
+                                        in reachable.items() if not is_up),
+                             'The IP address is not reachable')
+        self.fanout.map(check_node, ips_by_node)
 
     def check_nodes_mco(self, nodes):
         """
@@ -142,10 +173,9 @@ class Story169048(GenericTest):
         Args:
             nodes(list): Hostname of node to be verified.
         """
-        for node in nodes:
-            stdout, _, _ = self.run_command(self.test_ms,
-                                            '/usr/bin/mco ping -I ' + node)
-            self.assertTrue(self.is_text_in_list('1 replies max:', stdout))
+        missing = NodeReadiness(self, self.test_ms).wait_for_mco(nodes)
+        self.assertEqual([], missing,
+                         "No mco ping reply from {0}".format(missing))
 
     def setup_default_passwds(self, nodes):
         """
@@ -153,11 +183,10 @@ class Story169048(GenericTest):
         Args:
             nodes(list): Hostname of node to be setup.
         """
-        for node in nodes:
-            self.assertTrue(self.set_pws_new_node(self.test_ms, node),
-                            'Failed to set password')
+        NodeReadiness(self, self.test_ms).restore_passwords(nodes)
 
-    @attr('all', 'revert', 'torf169048', 'torf169048_tc12', 'expansion')
+    @attr('all', 'revert', 'torf169048', 'torf169048_tc12', 'expansion',
+          'node_repxe')
     def test_12_p_litp_expansion_install(self):
         """
         @tms_id:
@@ -227,18 +256,20 @@ class Story169048(GenericTest):
         self.execute_cli_create_cmd(self.test_ms, cluster_collect + '/' +
                                     SECOND_CLUSTER_ID, 'vcs-cluster', props,
                                     add_to_cleanup=False)
-        # Execute the expand script for expanding cluster 2 with
-        # node3 and node4 and adds node2 to cluster 1
+        # Build the items the expand_cloud_c1_mn2/c2_mn3/c2_mn4 scripts
+        # create (node2 in cluster 1, node3 and node4 in cluster 2) and
+        # load them in one go.
         # Note this does not create or run the plan.
-        self.execute_expand_script(self.test_ms,
-                                   'expand_cloud_c1_mn2_pxe.sh',
-                                   cluster_filename='192.168.0.42_4node.sh')
-        self.execute_expand_script(self.test_ms,
-                                   'expand_cloud_c2_mn3_pxe.sh',
-                                   cluster_filename='192.168.0.42_4node.sh')
-        self.execute_expand_script(self.test_ms,
-                                   'expand_cloud_c2_mn4_pxe.sh',
-                                   cluster_filename='192.168.0.42_4node.sh')
+        spec = ClusterSpec.fetch(self, self.test_ms, '192.168.0.42_4node.sh')
+        builder = ExpansionBuilder(ModelSnapshot(self, self.test_ms))
+        generate_expansion(builder, spec,
+                           Topology([(FIRST_CLUSTER_ID, 1),
+                                     (SECOND_CLUSTER_ID, 2)]),
+                           deployment_url=cluster_collect.rsplit('/', 1)[0])
+        self.execute_cli_update_cmd(self.test_ms, cluster_collect + '/' +
+                                    FIRST_CLUSTER_ID,
+                                    NETSTAT_NIC_MONITOR_STRATEGY)
+        builder.load(self, self.test_ms)
         # Run plan and wait for it to complete the expansion.
         timeout_mins = 60
         self.run_and_check_plan(self.test_ms,
@@ -277,17 +308,18 @@ class Story169048(GenericTest):
                 # Check nodes without bonds are not including expanded nodes
                 self.assertFalse(self.is_text_in_list(node_hostname,
                                                       nodes_to_expand))
-        for host, ip4 in hosts_ip.iteritems():
-            self.chk_intf_ip_conf_on_node(host, MGMT_BOND_NAME, ip4)
-            self.check_ssh_connectivity(host, ip4)
-            self.chk_intf_ip_conf_on_node(host, MGMT_BOND_SLAVE_1, ip4)
-            self.chk_intf_ip_conf_on_node(host, MGMT_BOND_SLAVE_2, ip4)
-            self.chk_intf_ip_conf_on_node(host, PXE_BOOT_DEV, ip4)
+        network_facts = self.fanout.map(self.get_network_facts, hosts_ip)
+        self.check_ssh_connectivity(dict((host, [ip4]) for host, ip4
+                                         in hosts_ip.items()))
+        for host, ip4 in hosts_ip.items():
+            facts = network_facts[host]
+            self.chk_intf_ip_conf_on_node(facts, MGMT_BOND_NAME, ip4)
+            self.chk_intf_ip_conf_on_node(facts, MGMT_BOND_SLAVE_1, ip4)
+            self.chk_intf_ip_conf_on_node(facts, MGMT_BOND_SLAVE_2, ip4)
+            self.chk_intf_ip_conf_on_node(facts, PXE_BOOT_DEV, ip4)
         self.log('info', '# 4. Ensure vcs clusters pxe boot device mii value'
                  ' is correct.')
-        self.check_mii_state('node2', exp_state='1')
-        self.check_mii_state('node3', exp_state='1')
-        self.check_mii_state('node4', exp_state='1')
+        self.check_mii_state(['node2', 'node3', 'node4'], exp_state='1')
         self.log('info', '# 5. Update vcs cluster c1 default_nic_monitor to '
                  'mii, and vcs cluster c2 default_nic_monitor to netstat.')
         self.execute_cli_update_cmd(self.test_ms, cluster_collect + '/' +
@@ -300,9 +332,7 @@ class Story169048(GenericTest):
                                 timeout_mins, add_to_cleanup=False)
         self.log('info', '# 6. Ensure vcs clusters pxe boot device mii value'
                  ' is correct.')
-        self.check_mii_state('node2', exp_state='1')
-        self.check_mii_state('node3', exp_state='1')
-        self.check_mii_state('node4', exp_state='1')
+        self.check_mii_state(['node2', 'node3', 'node4'], exp_state='1')
         self.log('info', '# 7. Update pxe_boot_only to false, and assign an '
                  'IP address, network and vcs_network_host to all of '
                  'pxe_boot_only interfaces per cluster.')
@@ -343,11 +373,11 @@ class Story169048(GenericTest):
                                 timeout_mins, add_to_cleanup=False)
         self.log('info', '# 8. Ensure vcs cluster c1 pxe boot device mii value'
                  ' is correct.')
-        self.check_mii_state('node2', exp_state='0')
+        self.check_mii_state(['node2'], exp_state='0')
         self.log('info', '# 9. Ensure vcs cluster c2 pxe boot device mii value'
                  ' is correct.')
-        self.check_mii_state('node3', exp_state='0')
-        self.check_mii_state('node4', exp_state='0')
+        self.check_mii_state(['node3', 'node4'], exp_state='0')
         self.log('info', '# 10. Ensure the connectivity on TCP/IP layer 4.')
-        for node, ip_addr in zip(nodes_to_expand, ips_to_check):
-            self.check_ssh_connectivity(node, '10.10.10.' + str(ip_addr))
+        self.check_ssh_connectivity(dict(
+            (node, ['10.10.10.' + str(ip_addr)])
+            for node, ip_addr in zip(nodes_to_expand, ips_to_check)))
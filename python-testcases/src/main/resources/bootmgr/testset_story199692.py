@@ -12,10 +12,30 @@ program(s) have been supplied.
             Optimise puppet timer configuration to improve performance on
             larger systems and minimise occurrence of 'execution expired'
 """
-
 from litp_generic_test import GenericTest, attr
+from timing_utils import instrument as instrument_timing
 import test_constants as const
-from redhat_cmd_utils import RHCmdUtils
+from kickstart_lint_utils import KickstartFile, lint, diff_nodes, \
+    format_diff, expect_puppet, expect_command, expect_line
+from kickstart_cache_utils import KickstartCache, StateDiff
+
+# 'runinterval = 1800' and 'configtimeout = 1720' should be in the
+# kickstart template and in the kickstart file of every node
+PUPPET_TIMER_EXPECTATIONS = (
+    expect_puppet('runinterval', '1800'),
+    expect_puppet('configtimeout', '1720'),
+)
+NODE_KICKSTART_EXPECTATIONS = PUPPET_TIMER_EXPECTATIONS + (
+    expect_command('bootloader', '--append'),
+    expect_line('partition snippet included',
+                r'(\$SNIPPET\(|%include\s).*'
+                r'(?<![\w.-]){name}\.ks\.partition\.snippet'),
+    expect_line('network stanza',
+                r'^\s*network\s|network_config'),
+)
+# State of the files at the end of the last run, only used to log
+# which files changed since; every file is checked on every run.
+LAST_STATE = 'story199692_tc07'
 
 
 class Story199692(GenericTest):
@@ -27,8 +47,7 @@ class Story199692(GenericTest):
     def setUp(self):
         """ Runs before every single test """
         super(Story199692, self).setUp()
-
-        self.rhcmd = RHCmdUtils()
+        instrument_timing(self)
 
         self.ms_node = self.get_management_node_filename()
         self.mn_nodes = self.get_managed_node_filenames()
@@ -52,72 +71,59 @@ class Story199692(GenericTest):
                 and the kickstart file for each node also has the correct
                 values for these parameters.
             @tms_test_steps:
-                @step: Grep the kickstart.erb file on the MS for 'runinterval'
-                    and 'configtimeout' parameters. Assert that the
-                    parameters are set to the correct values
+                @step: Fetch the kickstart.erb file and the kickstart file
+                    of each node from the MS
+                @result: A kickstart file exists for each node
+                @step: Check the kickstart.erb file on the MS for
+                    'runinterval' and 'configtimeout' parameters. Assert that
+                    the parameters are set to the correct values
                 @result: Parameters are set to correct values
-                @step: Grep the kickstart file for each node for 'runinterval'
-                    and 'configtimeout' parameters. Assert that the parameters
-                    are set to the correct values
+                @step: Check the kickstart file for each node for
+                    'runinterval' and 'configtimeout' parameters, the
+                    partition snippet, bootloader and network stanzas.
+                    Assert that they are as expected
                 @result: Parameters are set to correct values
             @tms_test_precondition: None
             @tms_execution_type: Automated
         """
-        # 'runinterval = 1800' should be in the kickstart file
-        run_interval = "runinterval"
-        run_interval_value = '1800'
-        run_interval_expected = "{0} = {1}".format(
-            run_interval, run_interval_value)
-
-        # 'configtimeout = 1720' should be in the kickstart file
-        config_timeout = "configtimeout"
-        config_timeout_value = '1720'
-        config_timeout_expected = "{0} = {1}".format(
-            config_timeout, config_timeout_value)
-
-        # Create grep command to find values in file
-        cmd = self.rhcmd.get_grep_file_cmd(
-            self.kickstart_erb, [run_interval, config_timeout])
-
-        self.log('info', "1. Grep the kickstart.erb file on the MS "
-                         "for 'runinterval' and 'configtimeout' parameters. "
+        self.log('info', "1. Read the state of the kickstart.erb file and "
+                         "of the kickstart file of every node on the MS, "
+                         "fetching the contents not cached yet.")
+        cache = KickstartCache()
+        state = cache.snapshot(self, self.ms_node, [self.kickstart_erb] + [
+            self.cobbler_ks_path + "{0}.ks".format(node)
+            for node in self.mn_nodes])
+        self.assertTrue(self.kickstart_erb in state,
+                        "{0} not found on {1}".format(self.kickstart_erb,
+                                                      self.ms_node))
+        files = dict((path, KickstartFile.from_text(
+            path, cache.get(digest))) for path, digest in state.items())
+        template = files.pop(self.kickstart_erb)
+        kickstarts = sorted(files.values(),
+                            key=lambda kickstart: kickstart.name)
+        self.assertEqual([], sorted(set(self.mn_nodes) - set(
+            kickstart.name for kickstart in kickstarts)),
+                         "Nodes without a kickstart file in {0}".format(
+                             self.cobbler_ks_path))
+        diff = StateDiff(cache.load_state(self.ms_node, LAST_STATE) or {},
+                         state)
+        cache.save_state(self.ms_node, LAST_STATE, state)
+        self.log('info', "Files changed since the last run: {0}".format(
+            sorted(diff.added + diff.changed)))
+
+        self.log('info', "2. Check the kickstart.erb file on the MS for "
+                         "'runinterval' and 'configtimeout' parameters. "
                          "Assert that the parameters are set to "
                          "the correct values.")
-        std_out, std_err, rc = self.run_command(
-            self.ms_node, cmd, su_root=True)
-        self.assertEqual(0, rc)
-        self.assertEqual([], std_err)
-
-        self.assertTrue(any(run_interval_expected in s for s in std_out),
-                        "Expected '{0}' not found in {1} on {2}".format(
-                            run_interval_expected,
-                            self.kickstart_erb, self.ms_node))
-
-        self.assertTrue(any(config_timeout_expected in s for s in std_out),
-                        "Expected '{0}' not found in {1} on {2}".format(
-                            config_timeout_expected,
-                            self.kickstart_erb, self.ms_node))
-
-        self.log('info', "2. Grep the kickstart file for each node "
-                         "for 'runinterval' and 'configtimeout' parameters. "
-                         "Assert that the parameters are set to "
-                         "the correct values.")
-        for node in self.mn_nodes:
-            # Find the node's kickstart file on the MS
-            node_ks_file = self.cobbler_ks_path + "{0}.ks".format(node)
-            # Create grep command to find values in file
-            cmd = self.rhcmd.get_grep_file_cmd(
-                node_ks_file, [run_interval, config_timeout])
-
-            std_out, std_err, rc = self.run_command(
-                self.ms_node, cmd, su_root=True)
-            self.assertEqual(0, rc)
-            self.assertEqual([], std_err)
-
-            self.assertTrue(any(run_interval_expected in s for s in std_out),
-                            "Expected '{0}' not found in {1} on MS".format(
-                                run_interval_expected, node_ks_file))
-
-            self.assertTrue(any(config_timeout_expected in s for s in std_out),
-                            "Expected '{0}' not found in {1} on MS".format(
-                                config_timeout_expected, node_ks_file))
+        self.assertEqual([], lint([template], PUPPET_TIMER_EXPECTATIONS))
+
+        self.log('info', "3. Check the kickstart file of each node for "
+                         "'runinterval' and 'configtimeout' parameters, "
+                         "the partition snippet, bootloader and network "
+                         "stanzas. Assert that they are as expected.")
+        self.assertEqual([], lint(kickstarts, NODE_KICKSTART_EXPECTATIONS))
+
+        differences = diff_nodes(kickstarts)
+        if differences:
+            self.log('info', "Kickstart files differ between nodes:\n"
+                     "{0}".format(format_diff(differences)))
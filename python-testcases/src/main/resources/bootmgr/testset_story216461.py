@@ -15,8 +15,10 @@ program(s) have been supplied.
 from re import findall, MULTILINE
 
 from litp_generic_test import GenericTest, attr
+from timing_utils import instrument as instrument_timing
+from fanout_utils import NodeFanout
+from readiness_utils import NodeReadiness, read_boot_id, wait_for_reboot
 import test_constants as const
-import time
 
 
 class Story216461(GenericTest):
@@ -30,9 +32,11 @@ class Story216461(GenericTest):
     def setUp(self):
         """ Runs before every single test """
         super(Story216461, self).setUp()
+        instrument_timing(self)
 
         self.ms_node = self.get_management_node_filename()
         self.mn_nodes = self.get_managed_node_filenames()
+        self.fanout = NodeFanout()
 
     def tearDown(self):
         """ Runs after every single test """
@@ -43,32 +47,39 @@ class Story216461(GenericTest):
          Verify 1 udev net rule is generated on each node and the rule is
           defined with the correct mac address.
         """
-        for node in self.find(self.ms_node, "/deployments", "node"):
-            hostname = self.get_node_filename_from_url(self.ms_node, node)
-            rules, _, _ = self.run_command(
-                    hostname, "cat {0}".format(Story216461.UDEV_NET_RULES),
-                    default_asserts=True)
-            self.assertNotEqual([], rules,
-                                msg='Expected output from command, got none!')
-
-            rules = '\n'.join(rules)
-            found = findall(r'^SUBSYSTEM.*(ATTR\{address\}==\".*?\").*',
-                            rules, flags=MULTILINE)
-            # only one SUBSYSTEM rule should be found
-            self.assertEqual(
-                    1, len(found), msg='Expected 1 SUBSYSTEM entry in {0} on '
-                                       'node {1}, got {2}'.format(
-                            Story216461.UDEV_NET_RULES, hostname, len(found)))
-
-            nets = self.get_node_network_devices(self.ms_node, node)
-            udev_mac = nets['eth0']['macaddress']
-            # verify the udev rule on the node is usng the correct macaddress
-            self.assertEqual('ATTR{{address}}=="{0}"'.format(udev_mac),
-                             found[0], msg='Expected MAC address {0}, '
-                                           'found {1}'.format(udev_mac,
-                                                              found[0]))
-
-    @attr('all', 'revert', 'story216461', 'story216461_tc01', 'TORF-294553')
+        self.fanout.map(self._assert_node_udev_rules,
+                        self.find(self.ms_node, "/deployments", "node"))
+
+    def _assert_node_udev_rules(self, node):
+        """
+         Verify the udev net rule of the node at the given model url.
+        """
+        hostname = self.get_node_filename_from_url(self.ms_node, node)
+        rules, _, _ = self.run_command(
+                hostname, "cat {0}".format(Story216461.UDEV_NET_RULES),
+                default_asserts=True)
+        self.assertNotEqual([], rules,
+                            msg='Expected output from command, got none!')
+
+        rules = '\n'.join(rules)
+        found = findall(r'^SUBSYSTEM.*(ATTR\{address\}==\".*?\").*',
+                        rules, flags=MULTILINE)
+        # only one SUBSYSTEM rule should be found
+        self.assertEqual(
+                1, len(found), msg='Expected 1 SUBSYSTEM entry in {0} on '
+                                   'node {1}, got {2}'.format(
+                        Story216461.UDEV_NET_RULES, hostname, len(found)))
+
+        nets = self.get_node_network_devices(self.ms_node, node)
+        udev_mac = nets['eth0']['macaddress']
+        # verify the udev rule on the node is usng the correct macaddress
+        self.assertEqual('ATTR{{address}}=="{0}"'.format(udev_mac),
+                         found[0], msg='Expected MAC address {0}, '
+                                       'found {1}'.format(udev_mac,
+                                                          found[0]))
+
+    @attr('all', 'revert', 'story216461', 'story216461_tc01', 'TORF-294553',
+          'ms_reboot')
     def test_01_p_prepare_restore(self):
         """
             @tms_id: torf_216461_tc01
@@ -115,27 +126,24 @@ class Story216461(GenericTest):
 
         self.log('info', "4. Reboot the MS and ensure "
                          "that xinedt isn't running.")
+        boot_id = read_boot_id(self, self.ms_node)
+        self.assertNotEqual(None, boot_id)
         cmd = const.REBOOT_PATH
         self.run_command(self.ms_node, cmd, su_root=True)
-        time.sleep(30)
+        self.assertTrue(wait_for_reboot(self, self.ms_node, boot_id),
+                        "MS did not come back after the reboot")
         self.wait_for_node_up(self.ms_node, timeout_mins=5, wait_for_litp=True)
         _, _, rc = self.get_service_status(self.ms_node, 'xinetd',
                                            assert_running=False)
         self.assertNotEqual(0, rc)
 
         # Set passwords on rebooted nodes
-        for node in self.mn_nodes:
-            cmd = "sed -i '/{0}/d' {1}/known_hosts".format(
-                node, const.SSH_KEYS_FOLDER)
-            _, _, rc = self.run_command(self.ms_node, cmd)
-            self.assertEqual(0, rc)
-
-            self.assertTrue(self.set_pws_new_node(self.ms_node, node),
-                            "Failed to set password on node {0}.".format(node))
-
-            # Run command on node to ensure correct password has been set
-            _, _, rc = self.run_command(node, 'hostname')
-            self.assertEqual(0, rc)
+        readiness = NodeReadiness(self, self.ms_node, self.fanout)
+        readiness.forget_host_keys(self.mn_nodes)
+        unreachable = readiness.wait_for_ssh(self.mn_nodes)
+        self.assertEqual([], unreachable,
+                         "No SSH on {0} after the reboot".format(unreachable))
+        readiness.restore_passwords(self.mn_nodes)
 
         self.log('info', "5. Checking nic udev rules.")
         self.assert_udev_rules()
@@ -13,12 +13,20 @@ program(s) have been supplied.
 '''
 
 from litp_generic_test import GenericTest, attr
+from timing_utils import instrument as instrument_timing
 from litp_cli_utils import CLIUtils
 from redhat_cmd_utils import RHCmdUtils
-from storage_utils import StorageUtils
+from fanout_utils import NodeFanout
+from model_snapshot_utils import ModelSnapshot
+from kickstart_snippet_utils import SnippetIndex
+from size_utils import compare_tables, format_mismatches, \
+    LVM_EXTENT_MIB
+from node_storage_utils import NodeStorage
+from file_audit_utils import audit_files, PermissionRule
+from transcript_utils import install as install_transcript
 
-import os
 import test_constants
+import os
 
 
 class Story295(GenericTest):
@@ -30,11 +38,14 @@ class Story295(GenericTest):
     def setUp(self):
         """init each testcase"""
         super(Story295, self).setUp()
+        instrument_timing(self)
         self.cli = CLIUtils()
-        self.storage = StorageUtils()
         self.rhcmd = RHCmdUtils()
+        self.fanout = NodeFanout()
         self.ms_node = self.get_management_node_filename()
         self.mn_nodes = self.get_managed_node_filenames()
+        self.model = ModelSnapshot(self, self.ms_node)
+        install_transcript(self)
 
     def tearDown(self):
         """cleanup after each testcase"""
@@ -42,16 +53,16 @@ class Story295(GenericTest):
 
     def get_storage_urls(self):
         """get system storage url"""
-        storage_urls = self.find(
-            self.ms_node, "/infrastructure", "storage-profile"
+        storage_urls = self.model.find(
+            "/infrastructure", "storage-profile"
         )
         self.assertNotEqual([], storage_urls)
         return storage_urls
 
     def get_node_urls(self):
         """get system node urls"""
-        node_urls = self.find(
-            self.ms_node, "/deployments", "node"
+        node_urls = self.model.find(
+            "/deployments", "node"
         )
         self.assertNotEqual([], node_urls)
         return node_urls
@@ -61,13 +72,13 @@ class Story295(GenericTest):
         mounts = []
 
         # grab system urls
-        fsys_urls = self.find(self.ms_node, url, "file-system", True)
+        fsys_urls = self.model.find(url, "file-system", True)
 
         # get mounts points and sizes
         for fsys_url in fsys_urls:
             mount_info = {}
             # get all props under url
-            props = self.get_props_from_url(self.ms_node, fsys_url)
+            props = self.model.get_props(fsys_url)
 
             mount_info['fs_url'] = url
             mount_info['origin'] = props['mount_point']
@@ -89,56 +100,58 @@ class Story295(GenericTest):
         self.assertNotEqual([], mount_points_list)
         return mount_points_list
 
-    def _get_info_from_snippet(self, snip_file, snip_file_dir):
-        """Given a partition snippet file and it's directory, return
-           'name' and 'size' of partitions that contain the line
-            '--name' in 'snip_file'"""
-        # setup grep params
-        grep_file = os.path.join(snip_file_dir, snip_file)
-        grep_name = r"\--name="
-
-        # execute grep command
-        cmd = RHCmdUtils().get_grep_file_cmd(grep_file, grep_name)
-        std_out, std_err, exit_code = self.run_command(self.ms_node, cmd)
-        self.assertNotEqual([], std_out)
-        self.assertEqual([], std_err)
-        self.assertEqual(0, exit_code)
-
-        partition_info = []
-        for line in std_out:
-            part_dict = {}
-            # check for dynamic disk partitioning:
-            split_index = 8 if '--grow' in line else 6
-            ##Splits out the volume name and volume size values
-            ##from the puppet snippet files
-            part_dict['name'] = line.split()[4].split('=')[-1]
-            part_dict['size'] = \
-                line.split()[split_index].split('=')[-1].strip('"')
-            part_dict['mount_point'] = line.split()[2]
-
-            partition_info.append(part_dict)
-
-        return partition_info
-
-    def _get_device_mount_point(self, node, lv_path):
+    def _root_vg_mount_points(self, node_url):
+        """
+        Mount points of the file systems of the node's root volume
+        group, the one holding '/': the partition snippet creates
+        these and no others.
         """
-            Return the mount point of a file system
-            Ret value 32 means known but already mounted
+        vg_urls = self.model.find(node_url + "/storage_profile",
+                                  "volume-group", True)
+        for vg_url in vg_urls:
+            mount_points = set(
+                self.model.get_props(fsys_url, "mount_point")
+                for fsys_url in self.model.find(vg_url, "file-system",
+                                                True))
+            if '/' in mount_points:
+                return mount_points
+        self.fail("No volume group with '/' under {0}".format(node_url))
+
+    def _check_node_mount_points(self, node_url):
         """
-        cmd = "/bin/mount " + lv_path
-        out, err, ret_code = self.run_command(node, cmd, su_root=True)
+        Compare the mount points and sizes of one node with the model
+        and check its /boot partition size
+        """
+        node = self.get_node_filename_from_url(self.ms_node, node_url)
+
+        # get model_mount_points info for current node
+        model_mount_points = self._match_mount_points(node_url)
 
-        self.assertNotEqual([], out)
-        self.assertEqual([], err)
-        if ret_code == 32:
-            if self.is_text_in_list('already', out):
-                mount_point = out[-1].split()[-1]
-                self.log("info", "Returning mount point '{0}'"
-                         .format(mount_point))
-                return mount_point
+        # 3. read the mount table, logical volumes and partitions
+        storage = NodeStorage.fetch(self, node)
 
-        self.log("info", "Mount error")
-        return None
+        # 4. compare the mounted logical volumes with the model
+        model_sizes = dict((mount['origin'], mount['size'])
+                           for mount in model_mount_points
+                           if mount['origin'] != 'swap')
+
+        # LVs missing from the model (e.g. swap) are not checked
+        mismatches = compare_tables(model_sizes, storage.lv_sizes(),
+                                    tolerance_mib=LVM_EXTENT_MIB,
+                                    extra_ok=True)
+        self.assertEqual([], mismatches,
+                         "Mount mismatch on {0}:\n{1}".format(
+                             node, format_mismatches(mismatches)))
+
+        # 5. get /boot partition size from the 'parted' output
+        boot_sizes = [part.size for part in
+                      storage.partitions_with_flag('boot')]
+        self.assertNotEqual([], boot_sizes,
+                            "No boot partition on {0}".format(node))
+
+        # assert /boot partition size is 1GB
+        self.assertEquals("1049MB", boot_sizes[0],
+                          "/boot partition size is {0}".format(boot_sizes))
 
     @attr('all', 'revert', 'story295', '295_01',
           'story487446', 'story487446_tc01')
@@ -166,98 +179,10 @@ class Story295(GenericTest):
         @tms_execution_type: Automated
         """
         # 1. get all node urls
-        node_urls = self.find(self.ms_node, "/deployments", "node", "True")
+        node_urls = self.model.find("/deployments", "node", True)
 
         # 2. For each node, ie. iterate through node urls
-        for node_url in node_urls:
-            node = self.get_node_filename_from_url(self.ms_node, node_url)
-
-            # get model_mount_points info for current node
-            model_mount_points = self._match_mount_points(node_url)
-
-            # 3. get node filename via node_url
-            node_fname = self.get_node_filename_from_url(
-                self.ms_node, node_url
-            )
-
-            # 4. get lvscan output
-            lv_out, std_err, return_code = self.run_command(
-                node_fname, "/sbin/lvscan", su_root=True
-            )
-            self.assertNotEqual([], lv_out)
-            self.assertEqual([], std_err)
-            self.assertEqual(0, return_code)
-
-            # 5. compare lvscan output from managed node and
-            # info stored in model
-
-            # get lvscan output ( list containing dict(s) )
-            lv_out_list = self.storage.parse_lvscan_stdout(lv_out)
-
-            for lv_dict in lv_out_list:
-                lv_dict['mnt_pt'] = self._get_device_mount_point(
-                    node, lv_dict['origin']
-                )
-
-            for model_mount_dict in model_mount_points:
-                if model_mount_dict['origin'] != 'swap':
-                    mount_found = False
-                    mount_size_found = False
-                    for lv_dict in lv_out_list:
-
-                        lv_mount = lv_dict['mnt_pt']
-
-                        if model_mount_dict['origin'] == lv_mount:
-                            mount_found = True
-
-                            # Get size firstly from model
-                            # Then from lvscan output
-                            model_size = model_mount_dict['size']
-                            lv_size = lv_dict[self.storage.vol_size]
-
-                            # mount sizes are in gigabytes
-                            if 'G' in model_size and 'GiB' in lv_size:
-                                mount_size = \
-                                    model_mount_dict['size'].split('G')[0]
-                                model_size = lv_dict[
-                                    self.storage.vol_size
-                                ].split('G')[0]
-
-                            # mount sizes are in megabytes
-                            if 'M' in model_size and 'MiB' in lv_size:
-                                mount_size = \
-                                    model_mount_dict['size'].split('M')[0]
-                                model_size = lv_dict[
-                                    self.storage.vol_size
-                                ].split('M')[0]
-
-                            try:
-                                # example - '16' in '16.00' || '2' in '2.00'
-                                if mount_size in model_size:
-                                    mount_size_found = True
-
-                            except UnboundLocalError:
-                                # unable to match sizes
-                                self.log(
-                                    "error",
-                                    "Mount point sizes could not be matched"
-                                )
-
-                    # assert we got matches
-                    self.assertTrue(mount_found,
-                                    "Mount mismatch No match for {0}"
-                                    .format(lv_mount))
-
-                    self.assertTrue(mount_size_found, "Mount size mismatch")
-
-            # 6. get /boot partition size from 'parted' command output
-            cmd = "/usr/sbin/parted -l | awk '$NF==\"boot\"{print $4}'"
-            boot_size, _, _ = self.run_command(node_fname, cmd, su_root=True,
-                                               default_asserts=True)
-
-            # assert /boot partition size is 1GB
-            self.assertEquals("1049MB", boot_size[0],
-                              "/boot partition size is {0}".format(boot_size))
+        self.fanout.map(self._check_node_mount_points, node_urls)
 
     @attr('all', 'revert', 'story295', '295_02')
     def test_02_p_kickstart_snippets(self):
@@ -284,108 +209,62 @@ class Story295(GenericTest):
         @tms_test_precondition: NA
         @tms_execution_type: Automated
         """
+        # 1. Fetch the partition snippets of every node in one go
+        snippets = SnippetIndex.fetch(self, self.ms_node)
+
         for node_url in self.get_node_urls():
             # 2. Get mount point info for current node
-            mount_points = self._match_mount_points(node_url)
+            mount_points = dict((mount['origin'], mount) for mount in
+                                self._match_mount_points(node_url))
 
             # 3. Get node hostname via node_url
-            node_name = self.get_props_from_url(
-                self.ms_node, node_url, "hostname"
-            )
+            node_name = self.model.get_props(node_url, "hostname")
             self.assertTrue(
-                node_name is not "",
+                node_name,
                 """Expected a node hostname,
                    but got the empty string!"""
             )
 
             # 4. Check existence of snippet file,
-            grep_snippet = node_name + ".ks.partition.snippet"
-            grep_dir = test_constants.COBBLER_SNIPPETS_DIR
-            cmd = RHCmdUtils().get_grep_file_cmd(
-                grep_dir, [grep_snippet], file_access_cmd="ls"
+            self.assertTrue(
+                node_name in snippets,
+                "No {0}.ks.partition.snippet in {1}".format(
+                    node_name, test_constants.COBBLER_SNIPPETS_DIR)
             )
 
-            std_out, std_err, exit_code = self.run_command(
-                self.ms_node, cmd
-            )
-            # Verify that snippet file exists
-            self.assertNotEqual([], std_out)
-            self.assertEqual([], std_err)
-            self.assertEqual(0, exit_code)
-
-            # 5. Got snippet file for current node, now get dict
-            # of info from grepping the snippet file
-            snippet_file = std_out[0]
-            snippet_list = self._get_info_from_snippet(
-                snippet_file, grep_dir
-            )
+            # 5. Got snippet file for current node, get the logical
+            # volumes it creates
+            snippet_list = snippets[node_name].logvols
+            self.assertNotEqual([], snippet_list)
 
             # 6. compare information in mount_points (model)
-            # with information found in snippet_dict (snippet file)
-            for mount_dict, snippet_dict in zip(mount_points, snippet_list):
-                point_found = False
-                size_match_found = False
-
-                # match points
-                if mount_dict['origin'] == snippet_dict['mount_point']:
-                    self.log("info", "Model FS mount {0} = Snippet file FS {1}"
-                             .format(mount_dict['origin'],
-                             snippet_dict['mount_point']))
-                    point_found = True
-
-                    ##This checks that the same units are used for both lvscan
-                    ##and as stated in the tree
-                    if 'G' in mount_dict['size']:
-                        # grab size in gigabytes
-                        mount_size = mount_dict['size'].split('G')[0]
-
-                        # assert that snippet_dict size is in Gigabytes
-                        self.assertTrue(
-                            len(snippet_dict['size']) >= 4,
-                            "Size mismatch from snippet file"
-                        )
-
-                    elif 'M' in mount_dict['size']:
-                        # grab size in megabytes
-                        mount_size = mount_dict['size'].split('M')[0]
-
-                        # assert that snippet_dict size is in Megabytes
-                        self.assertTrue(
-                            len(snippet_dict['size']) <= 3,
-                            "Size mismatch from snippet file"
-                        )
-
-                    # assert we parsed it correctly
-                    self.assertNotEqual("", mount_size)
-
-                    if mount_size in snippet_dict['size']:
-                        # matched size
-                        size_match_found = True
-                else:
-                    self.log("info", "{0} != {1}".format(
-                        mount_dict['origin'],
-                        snippet_dict['mount_point']))
-
-                # assert we got matches
-                self.assertTrue(point_found, "Failed to match points for {0}"
-                                .format(mount_dict['origin']))
-                self.assertTrue(size_match_found, "Failed to match sizes")
+            # with information found in the snippet file; file systems
+            # outside the root volume group are created after the
+            # install, not by the snippet
+            root_vg_mounts = self._root_vg_mount_points(node_url)
+            model_sizes = dict((origin, mount['size'])
+                               for origin, mount in mount_points.items()
+                               if origin in root_vg_mounts)
+            snippet_sizes = dict((snippet_lv.target, snippet_lv.size)
+                                 for snippet_lv in snippet_list)
+            mismatches = compare_tables(model_sizes, snippet_sizes,
+                                        tolerance_mib=LVM_EXTENT_MIB)
+            self.assertEqual([], mismatches,
+                             "Snippet mismatch for {0}:\n{1}".format(
+                                 node_name, format_mismatches(mismatches)))
 
         # LITPCDS-13441
         # Verify kickstart snippets have right permissions '644'
-        cmd_permissions = "/usr/bin/stat -c \"%a %n\" {0}/*".format(
-                                        test_constants.COBBLER_SNIPPETS_DIR)
-
-        permissions, _, _ = self.run_command(self.ms_node, cmd_permissions,
-                                             default_asserts=True)
-        wrong_permissions = list()
-        for permission in permissions:
-            if "644" not in permission:
-                wrong_permissions.append(permission)
-        for snippet in wrong_permissions:
-            permmission, snippet_file = snippet.split(" ")
+        rules = [PermissionRule(
+            os.path.join(test_constants.COBBLER_SNIPPETS_DIR, '*'),
+            mode='644')]
+        checked, violations = audit_files(
+            self, self.ms_node, [test_constants.COBBLER_SNIPPETS_DIR], rules)
+        self.assertNotEqual(0, checked, "No snippet file in {0}".format(
+            test_constants.COBBLER_SNIPPETS_DIR))
+        for path, attribute, expected, actual in violations:
             self.log('error',
-                    "Snippet '{0}'' with wrong permissions '{1}'".format(
-                                                    snippet_file, permmission))
+                     "'{0}' has {1} '{2}', expected '{3}'".format(
+                         path, attribute, actual, expected))
 
-        self.assertTrue([] == wrong_permissions)
+        self.assertEqual([], violations)
@@ -13,13 +13,15 @@ program(s) have been supplied.
 '''
 
 import os.path
-import re
 
 from litp_generic_test import GenericTest, attr
+from timing_utils import instrument as instrument_timing
 from litp_cli_utils import CLIUtils
 from redhat_cmd_utils import RHCmdUtils
 from storage_utils import StorageUtils
-from test_constants import COBBLER_SNIPPETS_DIR, PLAN_TASKS_SUCCESS
+from model_snapshot_utils import ModelSnapshot
+from kickstart_snippet_utils import SnippetIndex
+from plan_watch_utils import PlanWatcher, TASK_SUCCESS
 
 
 class Story3169(GenericTest):
@@ -44,10 +46,12 @@ class Story3169(GenericTest):
         """
         # 1. Call super class setup
         super(Story3169, self).setUp()
+        instrument_timing(self)
         self.test_ms = self.get_management_node_filename()
         self.cli = CLIUtils()
         self.rhcmd = RHCmdUtils()
         self.storage = StorageUtils()
+        self.model = ModelSnapshot(self, self.test_ms)
 
     def tearDown(self):
         """
@@ -66,64 +70,11 @@ class Story3169(GenericTest):
         """Extract mount points that are used in snippet files for
         creating root volume group.
         """
-        snippet_vgs = set([sn['volume_group'] for sn in snippet_lines])
+        snippet_vgs = set([sn.volume_group for sn in snippet_lines])
         mount_points = [mp for mp in mount_points
                          if mp['volume_group'] in snippet_vgs]
         return mount_points
 
-    @staticmethod
-    def _size_in_mbytes(size_string):
-        """Extract size in megabytes from various human readable
-        forms.
-
-        Examples: size_string can be 200M or 300.00 GiB
-        """
-        pattern = r'^\s*(?P<size>[1-9][.0-9]*)\s*(?P<unit>[MGT](iB)?)\s*$'
-        regexp = re.compile(pattern)
-        match = regexp.search(size_string)
-        if match:
-            parts = match.groupdict()
-            if parts:
-                if 'size' in parts.keys() and 'unit' in parts.keys():
-                    size = int(float(parts['size']))
-                    unit = parts['unit'][0]
-                    if unit == 'M':
-                        pass  # no change
-                    elif unit == 'G':
-                        size *= 1024
-                    elif unit == 'T':
-                        size *= 1024 * 1024
-
-        return size
-
-    def get_info_from_snippet(self, snip_file, snip_file_dir):
-        """Given a partition snippet file and it's directory, return
-        'name' and 'size' of partitions that contain the line
-            '--name' in 'snip_file'"""
-        # setup grep params
-        grep_file = os.path.join(snip_file_dir, snip_file)
-        grep_name = r"\--name="
-
-        # execute grep command
-        cmd = RHCmdUtils().get_grep_file_cmd(grep_file, grep_name)
-        std_out, std_err, exit_code = self.run_command(self.test_ms, cmd)
-        self.assertNotEqual([], std_out)
-        self.assertEqual([], std_err)
-        self.assertEqual(0, exit_code)
-
-        partition_info = []
-        for line in std_out:
-            part_dict = {}
-            # Splits out the volume name and volume size values
-            # from the puppet snippet files
-            part_dict['name'] = line.split()[4].split('=')[-1]
-            part_dict['size'] = line.split()[6].split('"')[0].split('=')[-1]
-            part_dict['volume_group'] = line.split()[5].split('=')[1]
-
-            partition_info.append(part_dict)
-
-        return partition_info
-
     def match_mount_points(self, node_url):
         """given a url of a node, match it's storage profile to a
         profile in the model. If the profile exists in the model
@@ -132,8 +83,7 @@ class Story3169(GenericTest):
 
         # get storage profile names from node urls
         node_storage_url = node_url + "/storage_profile"
-        prof_url = self.execute_show_data_cmd(self.test_ms, node_storage_url,
-            "inherited from")
+        prof_url = self.model.get(node_storage_url).source_path
 
         mount_points_list = self.build_mount_points(prof_url)
         self.assertNotEqual([], mount_points_list)
@@ -145,18 +95,18 @@ class Story3169(GenericTest):
         mounts = []
 
         # grab system urls
-        fsys_urls = self.find(self.test_ms, url, "file-system", True)
+        fsys_urls = self.model.find(url, "file-system", True)
 
         # get mounts points and sizes
         for fsys_url in fsys_urls:
             mount_info = {}
 
             # get all props under url
-            props = self.get_props_from_url(self.test_ms, fsys_url)
+            props = self.model.get_props(fsys_url)
 
             # get parent volume_group
             vg_url = "/".join(fsys_url.split("/")[:-2])
-            vg_props = self.get_props_from_url(self.test_ms, vg_url)
+            vg_props = self.model.get_props(vg_url)
 
             # store in dicts
 
@@ -171,10 +121,10 @@ class Story3169(GenericTest):
 
     def get_node_urls(self):
         """get system node urls"""
-        node_urls = self.find(self.test_ms, "/deployments", "node")
+        node_urls = self.model.find("/deployments", "node")
         return node_urls
 
-    @attr('all', 'revert', 'story3169', '3169_01')
+    @attr('all', 'revert', 'story3169', '3169_01', 'model_write')
     def test_01_p_check_root_vg_used(self):
         """
         @tms_id: litpcds_3169_tc01
@@ -204,7 +154,7 @@ class Story3169(GenericTest):
         @tms_test_precondition: NA
         @tms_execution_type: Automated
         """
-        storage_profiles = self.find(self.test_ms, "/infrastructure",
+        storage_profiles = self.model.find("/infrastructure",
                 "storage-profile-base", rtn_type_children=False)[0]
 
         # 1. Create a storage profile with 2 VGs
@@ -243,14 +193,14 @@ class Story3169(GenericTest):
         root_pd = os.path.join(vg_b, "physical_devices", "app_pd")
         self.execute_cli_create_cmd(self.test_ms, root_pd, "physical-device",
                 "device_name=hd_test1")
+        self.model.invalidate()
 
         # 3. Reuse an existing item of type system (or whose type *extends*
         #  system) in a brand new node definition
         test_node_name = "node" + self.story + "_1"
-        systems_url = self.find(self.test_ms,
-                                "/infrastructure",
-                                "system",
-                                False)[0]
+        systems_url = self.model.find("/infrastructure",
+                                      "system",
+                                      False)[0]
         system_url = systems_url + "/system_" + self.story
 
         test_node_hostname = self.story.replace("_", "-")
@@ -261,6 +211,7 @@ class Story3169(GenericTest):
                 system_type="system", create_system=True)
         result = self.run_commands(self.test_ms, cmds)
         self.assertEqual([], self.get_stderr(result))
+        self.model.invalidate()
 
         # 4. Make sure the node's system has disk items with names that match
         # its storage profile
@@ -269,7 +220,7 @@ class Story3169(GenericTest):
                 test_system = self.cli.get_command_url(cmd)
                 break
 
-        extant_disk = self.find(self.test_ms, test_system, "disk")[0]
+        extant_disk = self.model.find(test_system, "disk")[0]
         self.execute_cli_update_cmd(self.test_ms, extant_disk,
                 props='name=hd_test0')
 
@@ -278,9 +229,10 @@ class Story3169(GenericTest):
         second_disk_props = "name=hd_test1 size=40G uuid=2nd"
         self.execute_cli_create_cmd(self.test_ms, second_disk,
                                     "disk", second_disk_props)
+        self.model.invalidate()
 
         testnode_url = None
-        nodes_path = self.find(self.test_ms, "/deployments", "node")
+        nodes_path = self.model.find("/deployments", "node")
         for node in nodes_path:
             if test_node_name == node.split("/")[-1]:
                 testnode_url = node
@@ -297,26 +249,26 @@ class Story3169(GenericTest):
         self.execute_cli_createplan_cmd(self.test_ms)
 
         # 6. Run plan until task is finished
-        self.execute_cli_runplan_cmd(self.test_ms)
-
         task_desc = 'Create "RHEL7" partition kickstart snippet for node "*"'
-        task_success = self.wait_for_task_state(self.test_ms, task_desc,
-            PLAN_TASKS_SUCCESS)
+        with PlanWatcher(self, self.test_ms) as watcher:
+            snippet_task = watcher.watch_task(task_desc, TASK_SUCCESS)
+            self.execute_cli_runplan_cmd(self.test_ms)
+            task_success = snippet_task.wait(timeout=600)
         self.assertTrue(task_success, "The task {0} did not succeed".format(
             task_desc))
 
         self.stop_plan_if_running(self.test_ms)
+        self.model.invalidate()
 
         # 7. Inspect snippet
-        snip_file = test_node_hostname + ".ks.partition.snippet"
-        partition_info = self.get_info_from_snippet(snip_file,
-            COBBLER_SNIPPETS_DIR)
+        snippet = SnippetIndex.fetch(self, self.test_ms,
+            hostnames=[test_node_hostname])[test_node_hostname]
         mounts = self.match_mount_points(testnode_url)
 
         # 8. Find root vg in the model
         root_vg = set([mount['volume_group'] for mount in mounts
                        if mount['origin'] == 'root'])
         # 9. Find vg used in snippet
-        snippet_vg = set([sn['volume_group'] for sn in partition_info])
+        snippet_vg = snippet.volume_groups
 
         self.assertEqual(root_vg, snippet_vg)
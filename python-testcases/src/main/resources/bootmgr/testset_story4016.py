@@ -12,7 +12,12 @@ program(s) have been supplied.
             LITPCDS-4016
 """
 from litp_generic_test import GenericTest, attr
+from timing_utils import instrument as instrument_timing
 from redhat_cmd_utils import RHCmdUtils
+from fanout_utils import NodeFanout
+from bundle_utils import CommandBundle
+from topology_utils import attach as attach_topology
+from ssh_pool_utils import install as install_ssh_pool
 
 
 class Story4016(GenericTest):
@@ -25,56 +30,89 @@ class Story4016(GenericTest):
     def setUp(self):
         """Run before every test """
         super(Story4016, self).setUp()
-        self.ms_node = self.get_management_node_filename()
+        install_ssh_pool(self)
+        instrument_timing(self)
+        self.topology = attach_topology(self)
+        self.ms_node = self.topology.ms_node
         self.rhc = RHCmdUtils()
-
-    def _get_all_vcs_clusters(self):
-        """Get urls of all items of type vcs-cluster
-        Returns:
-        list
-        """
-        return self.find(self.ms_node, '/deployments', 'vcs-cluster')
-
-    def _get_sfha_clusters(self):
-        """Get only clusters of type vcs_cluster and
-        property: cluster_type=sfha
-        Returns:
-        list
-        """
-        sfha_clusters_urls = []
-
-        for url in self._get_all_vcs_clusters():
-            cl_type = self.get_props_from_url(self.ms_node, url,
-                                              'cluster_type')
-            if cl_type == 'sfha':
-                sfha_clusters_urls.append(url)
-        return sfha_clusters_urls
-
-    def _get_sfha_nodes_urls(self):
-        """Get urls of all nodes in all sfha clusters
-        Returns:
-        list
-        """
-        nodes_urls = []
-        for cl_url in self._get_sfha_clusters():
-            nodes_urls.extend(self.find(self.ms_node, cl_url, "node"))
-        return nodes_urls
+        self.fanout = NodeFanout()
 
     def _get_sfha_nodes_filenames(self):
-        """Get all filenames of all nodes in all sfha clusters
+        """Get all filenames of all nodes in all sfha clusters, from
+        the session's model snapshot
         Returns
         list
         """
-        nodes_filenames = []
-        for url in self._get_sfha_nodes_urls():
-            filename = self.get_node_filename_from_url(self.ms_node, url)
-            nodes_filenames.append(filename)
-        return nodes_filenames
+        node_urls = self.topology.model.query(
+            'node', ancestor=('vcs-cluster', {'cluster_type': 'sfha'}))
+        if not node_urls:
+            self.skipTest("No node in an sfha cluster")
+        filenames = self.topology.filenames_of(node_urls)
+        self.assertEqual([], [url for url, filename
+                              in zip(node_urls, filenames)
+                              if filename is None],
+                         "sfha nodes without a connection file")
+        return filenames
 
     def tearDown(self):
         """Run after every test"""
         super(Story4016, self).tearDown()
 
+    def _check_no_multipath(self, node):
+        """Verify multipath is neither running, installed nor loaded
+        on one node. The three probes share one root session, the
+        node's pooled root shell when BOOTMGR_SSH_POOL=on.
+        """
+        packages = ['device-mapper-multipath', 'device-mapper-multipath-libs']
+        bundle = CommandBundle([
+            self.rhc.get_systemctl_is_active_cmd("multipathd"),
+            self.rhc.check_pkg_installed(packages),
+            '/sbin/lsmod | grep multipath',
+        ])
+        service, pkgs, mods = bundle.run(self, node, su_root=True)
+
+        # 1a) verify that multipathd service is not running,
+        out, err, r_code = service
+        self.assertEqual([], err)
+        self.assertEqual(3, r_code)
+        self.assertEqual(['unknown'], out, "multipathd is not unknown as "
+                                           "expected on {0}".format(node))
+
+        # 1b) multipath rpms are not installed
+        out, err, r_code = pkgs
+        self.assertEqual([], err)
+        self.assertEqual(1, r_code)
+        self.assertEqual([], out)
+
+        # 1c) also the multipath kernel module is not loaded
+        out, err, r_code = mods
+        self.assertEqual([], err)
+        self.assertEqual(1, r_code)
+        self.assertEqual([], out)
+
+    def _check_dmp_devices(self, node):
+        """Verify that dmp devices exist on one node"""
+        dmp_devices_cmd = '/sbin/pvs --noheadings' \
+                          ' | grep /dev/vx/dmp/'
+        dmp_devices, err, r_code = self.run_command(node, dmp_devices_cmd,
+                                                    su_root=True)
+        self.assertEqual([], err)
+        self.assertEqual(0, r_code)
+        self.assertTrue(dmp_devices)
+
+    def _check_no_other_devices(self, node):
+        """Verify that there are no lvm devices other than dmp on
+        one node
+        """
+        other_devices_cmd_ = '/sbin/pvs --noheadings' \
+                             ' | grep -v /dev/vx/dmp/'
+        other_devices, err, r_code = self.run_command(node,
+                                                      other_devices_cmd_,
+                                                      su_root=True)
+        self.assertEqual([], err)
+        self.assertEqual(1, r_code)
+        self.assertFalse(other_devices)
+
     @attr('all', 'revert', 'story4016', 'story4016_tc01')
     def test_01_p_validate_multipath(self):
         """
@@ -93,34 +131,8 @@ class Story4016(GenericTest):
         @tms_test_precondition: NA
         @tms_execution_type: Automated
         """
-        # 1.
-        service_cmd = self.rhc.get_systemctl_is_active_cmd("multipathd")
-        packages = ['device-mapper-multipath', 'device-mapper-multipath-libs']
-
-        for node in self._get_sfha_nodes_filenames():
-            # 1a) verify that multipathd service is not running,
-            out, err, r_code = self.run_command(node, service_cmd,
-                                                su_root=True)
-            self.assertEqual([], err)
-            self.assertEqual(3, r_code)
-            self.assertEqual(['unknown'], out, "multipathd is not unknown as "
-                                               "expected on {0}".format(node))
-
-            # 1b) multipath rpms are not installed
-            pkg_cmd = self.rhc.check_pkg_installed(packages)
-            out, err, r_code = self.run_command(node, pkg_cmd,
-                                                su_root=True)
-            self.assertEqual([], err)
-            self.assertEqual(1, r_code)
-            self.assertEqual([], out)
-
-            # 1c) also the multipath kernel module is not loaded
-            mod_cmd = '/sbin/lsmod | grep multipath'
-            out, err, r_code = self.run_command(node, mod_cmd,
-                                                su_root=True)
-            self.assertEqual([], err)
-            self.assertEqual(1, r_code)
-            self.assertEqual([], out)
+        self.fanout.map(self._check_no_multipath,
+                        self._get_sfha_nodes_filenames())
 
     @attr('all', 'revert', 'story4016', 'story4016_tc02')
     def test_02_p_validate_devices_under_dmp(self):
@@ -138,25 +150,10 @@ class Story4016(GenericTest):
         @tms_test_precondition: NA
         @tms_execution_type: Automated
         """
-        # 1. Run  pvs command and get all devices matching /dev/vx/dmp/
-        dmp_devices_cmd = '/sbin/pvs --noheadings' \
-                          ' | grep /dev/vx/dmp/'
+        sfha_nodes = self._get_sfha_nodes_filenames()
 
-        for node in self._get_sfha_nodes_filenames():
-            dmp_devices, err, r_code = self.run_command(node, dmp_devices_cmd,
-                                                        su_root=True)
-            self.assertEqual([], err)
-            self.assertEqual(0, r_code)
-            self.assertTrue(dmp_devices)
+        # 1. Run  pvs command and get all devices matching /dev/vx/dmp/
+        self.fanout.map(self._check_dmp_devices, sfha_nodes)
 
         # 2. Verify that there are no other lvm devices
-        other_devices_cmd_ = '/sbin/pvs --noheadings' \
-                             ' | grep -v /dev/vx/dmp/'
-
-        for node in self._get_sfha_nodes_filenames():
-            other_devices, err, r_code = self.run_command(node,
-                                                          other_devices_cmd_,
-                                                          su_root=True)
-            self.assertEqual([], err)
-            self.assertEqual(1, r_code)
-            self.assertFalse(other_devices)
+        self.fanout.map(self._check_no_other_devices, sfha_nodes)
@@ -14,8 +14,10 @@ program(s) have been supplied.
 '''
 import re
 from litp_generic_test import GenericTest, attr
+from timing_utils import instrument as instrument_timing
 from test_constants import NETSTAT_PATH, GREP_PATH
 from redhat_cmd_utils import RHCmdUtils
+from fanout_utils import NodeFanout
 
 
 class Story489029(GenericTest):
@@ -37,8 +39,10 @@ class Story489029(GenericTest):
             common to all tests are available.
         """
         super(Story489029, self).setUp()
+        instrument_timing(self)
         self.managed_nodes = self.get_managed_node_filenames()
         self.rhcmd = RHCmdUtils()
+        self.fanout = NodeFanout()
 
     def tearDown(self):
         """
@@ -53,6 +57,37 @@ class Story489029(GenericTest):
         """
         super(Story489029, self).tearDown()
 
+    def _check_vxrsyncd_port(self, node):
+        """
+        Verify vxrsyncd is running on port 8999 and not 8989 on one node
+        """
+        service_status = self.rhcmd.get_systemctl_status_cmd('vxrsyncd')
+        service_stat, _, _ = self.run_command(
+            node, service_status, default_asserts=True)
+        self.assertNotEqual(None, re.search(
+            r".active.\(running\)", str(service_stat)))
+        self.log('info', '2. assert that vxrsyncd '
+                         'service is not running on the port 8989')
+        service_port = "{0} -nplt | {1} 8989".format(
+            NETSTAT_PATH, GREP_PATH)
+        service_in_port, std_err, return_code = self.run_command(
+            node, service_port, su_root=True)
+        self.assertEqual([], service_in_port)
+        self.assertEqual([], std_err)
+        self.assertEqual(1, return_code)
+
+        self.log('info', '3. assert that vxrsyncd '
+                         'service is running on the port 8999')
+        service_port = "{0} -nplt | {1} 8999".format(
+            NETSTAT_PATH, GREP_PATH)
+        service_in_port, _, _ = self.run_command(
+            node, service_port, su_root=True, default_asserts=True)
+        self.assertTrue(
+            self.is_text_in_list_regex(
+                r".\.vxrsyncd$",
+                service_in_port),
+            "vxryncd service is not running on node")
+
     @attr('all', 'revert', 'story489029', 'story489029_tc01')
     def test_01_p_validate_service_on_different_port(self):
         """
@@ -73,31 +108,4 @@ class Story489029(GenericTest):
         @tms_execution_type: Automated
         """
         self.log('info', '1. Check that vxryncd service is running on nodes')
-        for node in self.managed_nodes:
-
-            service_status = self.rhcmd.get_systemctl_status_cmd('vxrsyncd')
-            service_stat, _, _ = self.run_command(
-                node, service_status, default_asserts=True)
-            self.assertNotEqual(None, re.search(
-                r".active.\(running\)", str(service_stat)))
-            self.log('info', '2. assert that vxrsyncd '
-                             'service is not running on the port 8989')
-            service_port = "{0} -nplt | {1} 8989".format(
-                NETSTAT_PATH, GREP_PATH)
-            service_in_port, std_err, return_code = self.run_command(
-                node, service_port, su_root=True)
-            self.assertEqual([], service_in_port)
-            self.assertEqual([], std_err)
-            self.assertEqual(1, return_code)
-
-            self.log('info', '3. assert that vxrsyncd '
-                             'service is running on the port 8999')
-            service_port = "{0} -nplt | {1} 8999".format(
-                NETSTAT_PATH, GREP_PATH)
-            service_in_port, _, _ = self.run_command(
-                node, service_port, su_root=True, default_asserts=True)
-            self.assertTrue(
-                self.is_text_in_list_regex(
-                    r".\.vxrsyncd$",
-                    service_in_port),
-                "vxryncd service is not running on node")
+        self.fanout.map(self._check_vxrsyncd_port, self.managed_nodes)
@@ -14,6 +14,11 @@ program(s) have been supplied.
 """
 import test_constants
 from litp_generic_test import GenericTest, attr
+from timing_utils import instrument as instrument_timing
+from digest_utils import fetch_manifests, diff_manifests
+from topology_utils import attach as attach_topology
+from kickstart_cache_utils import KickstartCache, StateDiff, \
+    kickstart_paths
 
 
 class Story569334(GenericTest):
@@ -29,9 +34,10 @@ class Story569334(GenericTest):
 
     def setUp(self):
         super(Story569334, self).setUp()
-        self.ms_node = self.get_management_node_filename()
-        self.node_paths = self.find(self.ms_node, "/deployments",
-                                    "node")
+        instrument_timing(self)
+        self.topology = attach_topology(self)
+        self.ms_node = self.topology.ms_node
+        self.node_paths = self.topology.urls
 
     def tearDown(self):
         super(Story569334, self).tearDown()
@@ -76,9 +82,7 @@ class Story569334(GenericTest):
         peer_nodes = self.get_managed_node_filenames()
         cobbler_dir = "/var/log/cobbler/anamon/"
         cobbler_backup_dir = "/var/log/cobbler/anamon.backup/"
-        awk_cmd = " | awk '{print $9}'"
-        list_cobbler_logs_cmd = "{0} -lh {1}{2}/ {3}"
-        list_backup_logs_cmd = "{0} -lh {1}{2}*/{2} {3}"
+        backup_logs_dir = "{0}{1}*/{1}"
         tmp_dir = "/tmp/cobbler_logs/"
 
         self.log("info", "#1. Verify that no backup exists")
@@ -114,6 +118,9 @@ class Story569334(GenericTest):
 
         self.log('info', "#4. Execute prepare_restore on node1 and node3 "
                          "followed by create_plan/run_plan.")
+        ks_cache = KickstartCache()
+        ks_paths = kickstart_paths(test_constants.COBBLER_SNIPPETS_DIR)
+        ks_before = ks_cache.snapshot(self, self.ms_node, ks_paths)
         self.execute_cli_prepare_restore_cmd(self.ms_node, " -p {0}".format(
             self.node_paths[0]))
         self.execute_cli_prepare_restore_cmd(self.ms_node, " -p {0}".format(
@@ -121,9 +128,14 @@ class Story569334(GenericTest):
         self.run_and_check_plan(self.ms_node, test_constants.PLAN_COMPLETE,
                                 plan_timeout_mins=60)
         self.log("info", "run plan complete")
+        ks_diff = StateDiff(ks_before, ks_cache.snapshot(
+            self, self.ms_node, ks_paths))
+        self.log("info", "Kickstarts changed by the plan on {0}:\n"
+                 "{1}".format(ks_diff.nodes(), ks_cache.format_diff(ks_diff)))
 
         self.log("info", "#5. Verify backup folders exist for node1 and node3 "
                          "and do not exist for node2 and node4")
+        backed_up_nodes = []
         for node in peer_nodes:
             backup_exists = self.remote_path_exists(self.ms_node, "{0}{1}*/"
                                                     .format(cobbler_backup_dir,
@@ -132,26 +144,28 @@ class Story569334(GenericTest):
 
             if peer_nodes[0] in node or peer_nodes[2] in node:
                 self.assertTrue(backup_exists)
-                self.log("info", "#6. Verify backup folders contain the same "
-                                 "logs as cobbler folder")
-                list_cobbler_logs = self.run_command(self.ms_node,
-                                         list_cobbler_logs_cmd.format(
-                                             test_constants.LS_PATH,
-                                                cobbler_dir, node, awk_cmd),
-                                             su_root=True,
-                                             default_asserts=True)
-                list_backup_logs = self.run_command(self.ms_node,
-                                            list_backup_logs_cmd.format(
-                                                test_constants.LS_PATH,
-                                                cobbler_backup_dir, node,
-                                                awk_cmd),
-                                            su_root=True,
-                                            default_asserts=True)
-                self.assertEqual(list_cobbler_logs, list_backup_logs,
-                         "All files were not copied on '{0}'".format(node))
+                backed_up_nodes.append(node)
             else:
                 self.assertFalse(backup_exists)
 
+        self.log("info", "#6. Verify backup folders contain the same "
+                         "logs as cobbler folder")
+        # one round trip digests the live and backup logs of every
+        # backed up node plus the copy taken in step 3
+        roots = [tmp_dir]
+        for node in backed_up_nodes:
+            roots.append(cobbler_dir + node)
+            roots.append(backup_logs_dir.format(cobbler_backup_dir, node))
+        manifests = fetch_manifests(self, self.ms_node, roots)
+        backups = {}
+        for index, node in enumerate(backed_up_nodes):
+            live, backup = manifests[1 + 2 * index:3 + 2 * index]
+            backups[node] = backup
+            diff = diff_manifests(live, backup)
+            self.assertTrue(diff.names_match,
+                            "All files were not copied on '{0}': {1}".format(
+                                node, diff))
+
         self.log("info", "#7. Verify dummy backup folder doesn't exist")
         grep_cmd = "{0} {1} | {2} dummy".format(test_constants.LS_PATH,
                                                 cobbler_backup_dir,
@@ -161,14 +175,7 @@ class Story569334(GenericTest):
                             "dummy backup folder was found")
 
         self.log("info", "#8. Verify file contents are the same")
-        list_of_logs = self.run_command(self.ms_node, list_backup_logs_cmd.
-                                        format(test_constants.LS_PATH,
-                                   cobbler_backup_dir, peer_nodes[0], awk_cmd),
-                                        su_root=True)
-        for log in list_of_logs[0]:
-            cmp_cmd = "cmp {0}{1}*/{1}/{2} {3}{2}".format(cobbler_backup_dir,
-                                                  peer_nodes[0], log, tmp_dir)
-            cmp_out = self.run_command(self.ms_node, cmp_cmd, su_root=True)
-            self.assertEqual([], cmp_out[0],
-                             "Log file '{0}' is not the same as expected"
-                             .format(log))
+        diff = diff_manifests(backups[peer_nodes[0]], manifests[0])
+        self.assertEqual([], diff.removed + diff.changed,
+                         "Log files are not the same as expected: "
+                         "{0}".format(diff))
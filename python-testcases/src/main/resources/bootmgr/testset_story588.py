@@ -18,6 +18,10 @@ program(s) have been supplied.
 '''
 
 from litp_generic_test import GenericTest, attr
+from timing_utils import instrument as instrument_timing
+from fanout_utils import NodeFanout
+from bundle_utils import CommandBundle
+from ssh_pool_utils import install as install_ssh_pool
 import re
 
 
@@ -34,7 +38,10 @@ class Story588(GenericTest):
     def setUp(self):
         """init each testcase"""
         super(Story588, self).setUp()
+        install_ssh_pool(self)
+        instrument_timing(self)
         self.litp_default_user = "litp-admin"
+        self.fanout = NodeFanout()
         self.all_nodes = ([self.get_management_node_filename()] +
                            self.get_managed_node_filenames())
 
@@ -42,21 +49,144 @@ class Story588(GenericTest):
         """cleanup after each testcase"""
         super(Story588, self).tearDown()
 
-    def get_user_groups(self, node):
+    @staticmethod
+    def _parse_user_groups(stdout):
         """
         Description:
-            Get the list of groups a user belongs to
+            Parse the output of the 'groups' command
         Args:
-            node (str): The node to run the command on
+            stdout (list): output of '/usr/bin/groups'
         Returns:
             lst. of groups the user belongs to
         """
-        cmd = '/usr/bin/groups'
-        stdout = self.run_command(node, cmd,
-                                  default_asserts=True)[0][0]
-        user_groups = ((stdout.split(': '))[0]).split(' ')
+        return ((stdout[0].split(': '))[0]).split(' ')
 
-        return user_groups
+    def _check_admin_user(self, node):
+        """
+        Verify the litp-admin user deployment on one node.
+
+        The litp-admin and root probes are sent as one bundle each so
+        every node costs three round trips (the sudo probe needs its own
+        session) instead of nine. With the SSH pool on
+        (BOOTMGR_SSH_POOL=on) the litp-admin bundle reuses the node's
+        connection and the root bundle its root shell.
+        """
+        litp_path = "/home/litp-admin"
+        admin_bundle = CommandBundle()
+        groups_idx = admin_bundle.add('/usr/bin/groups')
+        home_idx = admin_bundle.add('[ -d {0} ]'.format(litp_path))
+        admin_uid_idx = admin_bundle.add("id -u")
+        admin_umask_idx = admin_bundle.add("umask")
+        ls_root_idx = admin_bundle.add("ls /root")
+        admin_results = admin_bundle.run(self, node)
+
+        root_bundle = CommandBundle()
+        root_uid_idx = root_bundle.add("id -u")
+        root_umask_idx = root_bundle.add("umask")
+        root_results = root_bundle.run(self, node, su_root=True)
+
+        # 1. run 'groups' command as 'litp_user'
+        std_out, std_err, return_code = admin_results[groups_idx]
+        self.assertNotEqual([], std_out)
+        self.assertEqual([], std_err)
+        self.assertEqual(0, return_code)
+        groups = self._parse_user_groups(std_out)
+
+        # 2. assert that 'litp-admin' is in two groups only on the MS
+        # and one group only on the MNs
+
+        expected_group_len = 1
+
+        if node is self.all_nodes[0]:
+            expected_group_len = 3
+
+        group_len = len(groups)
+
+        self.assertTrue(
+            group_len == expected_group_len,
+            "found incorrect number of groups - %s" % group_len
+        )
+
+        # 3. assert that 'litp-admin' is in 'litp-admin' group
+        self.assertTrue(
+            self.litp_default_user in groups,
+            "expected group 'litp-admin', got %s" % groups[0]
+        )
+
+        # 4. assert that the 'litp-admin' home dir is present
+        self.assertEqual(
+            0, admin_results[home_idx][2],
+            "/home/litp-admin does not exist!"
+        )
+
+        # 5. assert that litp-admin does not have sudo access
+        sudo_cmd = "sudo pvdisplay"
+        expected_out = "litp-admin is not in the sudoers file"
+        std_out, std_err, exit_code = self.run_command(
+            node, sudo_cmd, sudo="True"
+        )
+        # assert expected values
+        self.assertNotEqual([], std_out)
+        self.assertTrue(
+            self.is_text_in_list(expected_out, std_out),
+            "litp-admin has sudo access!"
+        )
+        self.assertEqual([], std_err)
+        self.assertEqual(1, exit_code)
+
+        # 6. assert that litp-admin does not have root uid
+
+        # get root uid
+        root_uid, std_err, return_code = root_results[root_uid_idx]
+        self.assertNotEqual([], root_uid)
+        self.assertEqual([], std_err)
+        self.assertEqual(0, return_code)
+
+        # get litp-admin uid
+        litp_admin_uid, std_err, return_code = admin_results[admin_uid_idx]
+        self.assertNotEqual([], litp_admin_uid)
+        self.assertEqual([], std_err)
+        self.assertEqual(0, return_code)
+
+        # assert uids are not equal
+        self.assertNotEqual(litp_admin_uid, root_uid)
+
+        # 7. assert litp-admin does not have root umask
+        # assert that root umask is not the same as litp-admin umask
+
+        # get litp-admin umask
+        litp_admin_umask, std_err, return_code = \
+            admin_results[admin_umask_idx]
+        self.assertNotEqual([], litp_admin_umask)
+        self.assertEqual([], std_err)
+        self.assertEqual(0, return_code)
+
+        root_umask, std_err, return_code = root_results[root_umask_idx]
+        self.assertNotEqual([], root_umask)
+        self.assertEqual([], std_err)
+        self.assertEqual(0, return_code)
+
+        # assert umask is not equal to root's
+        self.assertNotEqual(litp_admin_umask, root_umask)
+
+        # 8. assert default access privileges by running 'ls /root'
+        std_out, std_err, return_code = admin_results[ls_root_idx]
+        self.assertEqual([], std_out)
+        self.assertNotEqual([], std_err)
+        self.assertNotEqual(0, return_code)
+
+    def _check_home_access(self, node):
+        """
+        Verify litp-admin can list its home directory on one node
+        """
+        _, std_err, return_code = self.run_command(node, "ls $HOME")
+
+        # in case the litp-admin home directory is not empty
+        # we don't assert that standard out is not empty, as
+        # long as we get a valid return code and no error
+        # we know we have default privileges
+        self.assertEqual([], std_err)
+        self.assertEqual(0, return_code)
 
     @attr('all', 'revert', 'story588', 'story588_tc01', 'cdb_priority1')
     def test_01_n_admin_user_deployment(self):
@@ -85,107 +215,7 @@ class Story588(GenericTest):
         @tms_test_precondition: NA
         @tms_execution_type: Automated
         """
-
-        for node in self.all_nodes:
-
-            # 1. run 'groups' command as 'litp_user'
-            groups = self.get_user_groups(node)
-
-            # 2. assert that 'litp-admin' is in two groups only on the MS
-            # and one group only on the MNs
-
-            expected_group_len = 1
-
-            if node is self.all_nodes[0]:
-                expected_group_len = 3
-
-            group_len = len(groups)
-
-            self.assertTrue(
-                group_len == expected_group_len,
-                "found incorrect number of groups - %s" % group_len
-            )
-
-            # 3. assert that 'litp-admin' is in 'litp-admin' group
-            self.assertTrue(
-                self.litp_default_user in groups,
-                "expected group 'litp-admin', got %s" % groups[0]
-            )
-
-            # 4. assert that the 'litp-admin' home dir is present
-            litp_path = "/home/litp-admin"
-            self.assertTrue(
-                self.remote_path_exists(node, litp_path, expect_file=False),
-                "/home/litp-admin does not exist!"
-            )
-
-            # 5. assert that litp-admin does not have sudo access
-            sudo_cmd = "sudo pvdisplay"
-            expected_out = "litp-admin is not in the sudoers file"
-            std_out, std_err, exit_code = self.run_command(
-                node, sudo_cmd, sudo="True"
-            )
-            # assert expected values
-            self.assertNotEqual([], std_out)
-            self.assertTrue(
-                self.is_text_in_list(expected_out, std_out),
-                "litp-admin has sudo access!"
-            )
-            self.assertEqual([], std_err)
-            self.assertEqual(1, exit_code)
-
-            # 6. assert that litp-admin does not have root uid
-            # assert that litp-admin does not have root uid
-            uid_cmd = "id -u"
-
-            # get root uid
-            root_uid, std_err, return_code = self.run_command(
-                node, uid_cmd, su_root=True
-            )
-            self.assertNotEqual([], root_uid)
-            self.assertEqual([], std_err)
-            self.assertEqual(0, return_code)
-
-            # get litp-admin uid
-            litp_admin_uid, std_err, return_code = self.run_command(
-                node, uid_cmd
-            )
-            self.assertNotEqual([], litp_admin_uid)
-            self.assertEqual([], std_err)
-            self.assertEqual(0, return_code)
-
-            # assert uids are not equal
-            self.assertNotEqual(litp_admin_uid, root_uid)
-
-            # 7. assert litp-admin does not have root umask
-            # assert that root umask is not the same as litp-admin umask
-            umask_cmd = "umask"
-
-            # get litp-admin umask
-            litp_admin_umask, std_err, return_code = self.run_command(
-                node, umask_cmd
-            )
-            self.assertNotEqual([], litp_admin_uid)
-            self.assertEqual([], std_err)
-            self.assertEqual(0, return_code)
-
-            root_umask, std_err, return_code = self.run_command(
-                node, "umask", su_root=True
-            )
-            self.assertNotEqual([], root_umask)
-            self.assertEqual([], std_err)
-            self.assertEqual(0, return_code)
-
-            # assert umask is not equal to root's
-            self.assertNotEqual(litp_admin_umask, root_umask)
-
-            # 8. assert default access privileges by running 'ls /root'
-            std_out, std_err, return_code = self.run_command(
-                node, "ls /root"
-            )
-            self.assertEqual([], std_out)
-            self.assertNotEqual([], std_err)
-            self.assertNotEqual(0, return_code)
+        self.fanout.map(self._check_admin_user, self.all_nodes)
 
     @attr('all', 'revert', 'story588', 'story588_tc03', 'cdb_priority1')
     def test_03_p_default_access_allowed(self):
@@ -203,15 +233,7 @@ class Story588(GenericTest):
         @tms_execution_type: Automated
         """
         # 1. run 'ls' command
-        for node in self.all_nodes:
-            _, std_err, return_code = self.run_command(node, "ls $HOME")
-
-            # in case the litp-admin home directory is not empty
-            # we don't assert that standard out is not empty, as
-            # long as we get a valid return code and no error
-            # we know we have default privileges
-            self.assertEqual([], std_err)
-            self.assertEqual(0, return_code)
+        self.fanout.map(self._check_home_access, self.all_nodes)
 
     @attr('all', 'revert', 'story588', 'story588_tc04')
     def test_04_p_password_expiry(self):
@@ -0,0 +1,246 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Times the remote calls of the test sets (run_command,
+            execute_cli_*, find, get_props_from_url, run_and_check_plan)
+            per test, node and test step, the step being taken from the
+            "N. ..." step markers the calling thread logged (or the
+            test's own thread, for fan-out workers that log none). When
+            the run ends the calls are ranked by total and 95th
+            percentile time in bootmgr_timings.txt and .json, written
+            next to the nosetests xml report (NOSE_XUNIT_FILE,
+            nosetests.xml by default) or to the BOOTMGR_TIMINGS path
+            when it is set.
+"""
+import atexit
+import functools
+import json
+import math
+import os
+import re
+import threading
+import time
+
+from transcript_utils import key_of_test
+
+TIMED_CALLS = ('run_command', 'find', 'get_props_from_url',
+               'run_and_check_plan')
+TIMED_PREFIXES = ('execute_cli_',)
+
+REPORT_NAME = 'bootmgr_timings'
+TIMINGS_ENV = 'BOOTMGR_TIMINGS'
+
+# Step markers such as "# 2. Ensure ..." or "2. Grep ..."
+_STEP_RE = re.compile(r'^\s*#?\s*(\d+)\.\s')
+
+_LOCK = threading.Lock()
+_CALLS = []
+_LOCAL = threading.local()
+_REGISTERED = []
+
+
+def _nesting():
+    """Depth of timed calls on this thread, e.g. 1 in the run_command
+    made by an execute_cli_* helper"""
+    return getattr(_LOCAL, 'depth', 0)
+
+
+def _current_step(state):
+    """The step of the calling thread; fan-out workers that have not
+    logged a step marker are at the step of the test's thread"""
+    return getattr(state['local'], 'step', state['step'])
+
+
+def _timed(method, call, state):
+    """
+    Returns:
+        function. method, adding one record per call to _CALLS.
+    """
+    @functools.wraps(method)
+    def timed(*args, **kwargs):
+        """The wrapped call, timed"""
+        depth = _nesting()
+        _LOCAL.depth = depth + 1
+        start = time.time()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            _LOCAL.depth = depth
+            record = {'call': call, 'test': state['test'],
+                      'step': _current_step(state),
+                      'node': args[0] if args else kwargs.get('node'),
+                      'nested': depth > 0,
+                      'seconds': time.time() - start}
+            with _LOCK:
+                _CALLS.append(record)
+    return timed
+
+
+def instrument(test):
+    """
+    Description:
+        Time the remote calls of a test. Call in setUp, after the super
+        class setUp; the report is written when the interpreter exits.
+    Args:
+        test (GenericTest): Test case to instrument.
+    """
+    state = {'test': key_of_test(test), 'step': None,
+             'thread': threading.current_thread(),
+             'local': threading.local()}
+    for name in dir(test):
+        if name in TIMED_CALLS or name.startswith(TIMED_PREFIXES):
+            method = getattr(test, name)
+            if callable(method):
+                setattr(test, name, _timed(method, name, state))
+
+    log = test.log
+
+    def log_step(level, msg, *args, **kwargs):
+        """test.log, following the step markers"""
+        match = _STEP_RE.match(msg) if isinstance(
+            msg, (str, type(u''))) else None
+        if match is not None:
+            if threading.current_thread() is state['thread']:
+                state['step'] = int(match.group(1))
+            else:
+                state['local'].step = int(match.group(1))
+        return log(level, msg, *args, **kwargs)
+    test.log = log_step
+
+    with _LOCK:
+        if not _REGISTERED:
+            atexit.register(write_report)
+            _REGISTERED.append(write_report)
+
+
+def percentile(values, fraction):
+    """
+    Returns:
+        float. The nearest rank percentile of values.
+    """
+    ordered = sorted(values)
+    return ordered[max(int(math.ceil(fraction * len(ordered))) - 1, 0)]
+
+
+def rank(calls, key):
+    """
+    Description:
+        Group calls and rank the groups by their total time.
+    Args:
+        calls (list): Records of timed calls.
+        key (callable): Group of a record.
+    Returns:
+        list. Dicts of name, calls, total, p95 and max, slowest first.
+    """
+    groups = {}
+    for record in calls:
+        groups.setdefault(key(record), []).append(record['seconds'])
+    ranked = [{'name': name, 'calls': len(seconds),
+               'total': round(sum(seconds), 3),
+               'p95': round(percentile(seconds, 0.95), 3),
+               'max': round(max(seconds), 3)}
+              for name, seconds in groups.items()]
+    return sorted(ranked, key=lambda group: group['total'], reverse=True)
+
+
+def build_report(calls):
+    """
+    Returns:
+        dict. Rankings by call type (every call), and by node and by
+        test step (outermost calls only, so a helper and the
+        run_command it makes are counted once).
+    """
+    outer = [record for record in calls if not record['nested']]
+    return {
+        'calls': len(calls),
+        'total': round(sum(record['seconds'] for record in outer), 3),
+        'by_call': rank(calls, lambda record: record['call']),
+        'by_node': rank(outer, lambda record: str(record['node'])),
+        'by_step': rank(outer, lambda record: "{0} step {1}".format(
+            record['test'], record['step'] if record['step'] is not None
+            else '-')),
+    }
+
+
+def format_report(report, top=20):
+    """
+    Returns:
+        str. The rankings as text tables.
+    """
+    lines = ["{0} timed calls, {1:.1f}s in remote calls".format(
+        report['calls'], report['total'])]
+    for title, section in (('call', 'by_call'), ('node', 'by_node'),
+                           ('step', 'by_step')):
+        lines.extend(['', "By {0}:".format(title),
+                      "{0:>10} {1:>6} {2:>8} {3:>8}  {4}".format(
+                          'total', 'calls', 'p95', 'max', title)])
+        lines.extend("{total:>9.2f}s {calls:>6d} {p95:>7.2f}s "
+                     "{max:>7.2f}s  {name}".format(**group)
+                     for group in report[section][:top])
+    return "\n".join(lines) + "\n"
+
+
+def report_base():
+    """
+    Returns:
+        str. Path of the report without its extension.
+    """
+    if os.environ.get(TIMINGS_ENV):
+        return os.environ[TIMINGS_ENV]
+    return os.path.join(os.path.dirname(os.path.abspath(
+        os.environ.get('NOSE_XUNIT_FILE', 'nosetests.xml'))), REPORT_NAME)
+
+
+def _write(calls, base):
+    """Write the report of calls to base.json and base.txt"""
+    report = build_report(calls)
+    with open(base + '.txt', 'w') as text_file:
+        text_file.write(format_report(report))
+    # the records let reports of separate runs be merged
+    report['records'] = calls
+    with open(base + '.json', 'w') as json_file:
+        json.dump(report, json_file, indent=2, sort_keys=True)
+    return base + '.txt'
+
+
+def write_report(base=None):
+    """
+    Description:
+        Write the rankings of the calls timed so far.
+    Args:
+        base (str): Report path without extension, report_base() by
+            default.
+    Returns:
+        str. Path of the text report, None if nothing was timed.
+    """
+    with _LOCK:
+        calls = list(_CALLS)
+    if not calls:
+        return None
+    return _write(calls, base or report_base())
+
+
+def merge_reports(paths, base):
+    """
+    Description:
+        Rank the calls of several json reports together, e.g. of test
+        cases run in separate processes.
+    Args:
+        paths (list): json reports written by write_report.
+        base (str): Merged report path without extension.
+    Returns:
+        str. Path of the text report, None if there was nothing to merge.
+    """
+    calls = []
+    for path in paths:
+        if os.path.exists(path):
+            with open(path) as json_file:
+                calls.extend(json.load(json_file).get('records', []))
+    return _write(calls, base) if calls else None
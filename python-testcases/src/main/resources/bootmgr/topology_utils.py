@@ -0,0 +1,255 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Session wide cache of the deployment topology: for every peer
+            node its filename, url, hostname, cluster, cluster type and
+            NIC MAC addresses, built from one model export and shared by
+            the setUp of every test set in the run.
+
+            The cache is dropped when a test tagged 'expansion' starts
+            and ends, and whenever a plan completes (run_and_check_plan,
+            wait_for_plan_state or a PlanWatcher seeing a finished plan),
+            since plans add and remove nodes.
+"""
+import functools
+import threading
+from collections import OrderedDict
+
+from model_snapshot_utils import ModelSnapshot, is_a
+
+# Tags of tests that change the set of nodes.
+INVALIDATING_TAGS = ('expansion',)
+# GenericTest calls that return once a plan has completed.
+PLAN_COMPLETION_CALLS = ('run_and_check_plan', 'wait_for_plan_state')
+
+_LOCK = threading.Lock()
+_CACHE = {}
+
+
+class NodeInfo(object):
+    """What the model and the connection data say about one peer node"""
+    __slots__ = ('filename', 'url', 'hostname', 'cluster_url',
+                 'cluster_type', 'macs')
+
+    def __init__(self, filename, url, hostname, cluster_url=None,
+                 cluster_type=None, macs=None):
+        self.filename = filename
+        self.url = url
+        self.hostname = hostname
+        self.cluster_url = cluster_url
+        self.cluster_type = cluster_type
+        # device_name -> macaddress
+        self.macs = macs if macs is not None else OrderedDict()
+
+    def __repr__(self):
+        return "<NodeInfo {0} {1}>".format(self.filename, self.url)
+
+
+class NodeTopology(object):
+    """
+    The peer nodes of a deployment, looked up by filename, url or
+    hostname. Built once per MS by get_topology().
+    """
+
+    def __init__(self, ms_node, nodes, model=None):
+        """
+        Args:
+            ms_node (str): Filename of the MS.
+            nodes (list): NodeInfo per node, in model order.
+            model (ModelSnapshot): Snapshot the topology was read from,
+                kept for queries (ModelSnapshot.query) of the same
+                session.
+        """
+        self.ms_node = ms_node
+        self.model = model
+        self.nodes = list(nodes)
+        self._by_filename = dict((node.filename, node) for node in nodes
+                                 if node.filename is not None)
+        self._by_url = dict((node.url, node) for node in nodes)
+        self._by_hostname = dict((node.hostname, node) for node in nodes)
+
+    @classmethod
+    def build(cls, test, ms_node, model=None):
+        """
+        Description:
+            Read the topology from the model. Nodes are matched to their
+            connection files by hostname; get_node_filename_from_url is
+            only asked about nodes whose hostname is not a filename.
+        Args:
+            test (GenericTest): Test case whose calls are used.
+            ms_node (str): Filename of the MS.
+            model (ModelSnapshot): Snapshot to read, exported if None.
+        Returns:
+            NodeTopology.
+        """
+        if model is None:
+            model = ModelSnapshot(test, ms_node)
+        filenames = set(test.get_managed_node_filenames())
+        nodes = []
+        for url in model.urls_of_type('node'):
+            hostname = model.get_props(url, 'hostname')
+            if hostname in filenames:
+                filename = hostname
+            else:
+                filename = test.get_node_filename_from_url(ms_node, url)
+            cluster_url = model.parent_url(url, 2)
+            cluster = model.get(cluster_url)
+            if cluster is None or not is_a(cluster.item_type, 'cluster'):
+                cluster_url = None
+            macs = OrderedDict()
+            for item in model.walk(url + '/network_interfaces'):
+                if item.props.get('macaddress'):
+                    macs[item.props.get('device_name')] = \
+                        item.props['macaddress']
+            nodes.append(NodeInfo(
+                filename, url, hostname, cluster_url,
+                model.get_props(cluster_url, 'cluster_type')
+                if cluster_url else None, macs))
+        return cls(ms_node, nodes, model)
+
+    @property
+    def filenames(self):
+        """Filenames of the nodes with connection data, in model order"""
+        return [node.filename for node in self.nodes
+                if node.filename is not None]
+
+    @property
+    def urls(self):
+        """Urls of the nodes, in model order"""
+        return [node.url for node in self.nodes]
+
+    def by_filename(self, filename):
+        """
+        Returns:
+            NodeInfo or None.
+        """
+        return self._by_filename.get(filename)
+
+    def by_url(self, url):
+        """
+        Returns:
+            NodeInfo or None.
+        """
+        return self._by_url.get(url.rstrip('/'))
+
+    def by_hostname(self, hostname):
+        """
+        Returns:
+            NodeInfo or None.
+        """
+        return self._by_hostname.get(hostname)
+
+    def filenames_of(self, urls):
+        """
+        Returns:
+            list. Filename of the node at each url, None for a node
+            without one.
+        """
+        return [self.filename_of(url) for url in urls]
+
+    def filename_of(self, url):
+        """
+        Returns:
+            str. Filename of the node at url, None if it has none.
+        """
+        node = self.by_url(url)
+        return node.filename if node is not None else None
+
+    def in_clusters(self, cluster_type=None):
+        """
+        Returns:
+            list. NodeInfo of the cluster nodes, only of clusters of
+            cluster_type if given.
+        """
+        return [node for node in self.nodes
+                if node.cluster_url is not None and
+                cluster_type in (None, node.cluster_type)]
+
+    def clusters(self):
+        """
+        Returns:
+            OrderedDict. cluster url -> NodeInfo of its nodes.
+        """
+        clusters = OrderedDict()
+        for node in self.in_clusters():
+            clusters.setdefault(node.cluster_url, []).append(node)
+        return clusters
+
+
+def invalidate(ms_node=None):
+    """
+    Description:
+        Drop the cached topology of ms_node, of every MS if None.
+    """
+    with _LOCK:
+        if ms_node is None:
+            _CACHE.clear()
+        else:
+            _CACHE.pop(ms_node, None)
+
+
+def get_topology(test, ms_node=None):
+    """
+    Description:
+        The cached topology of the deployment, built on first use.
+    Args:
+        test (GenericTest): Test case whose calls build the topology.
+        ms_node (str): Filename of the MS, from the test by default.
+    Returns:
+        NodeTopology.
+    """
+    if ms_node is None:
+        ms_node = test.get_management_node_filename()
+    with _LOCK:
+        topology = _CACHE.get(ms_node)
+    if topology is None:
+        topology = NodeTopology.build(test, ms_node)
+        with _LOCK:
+            topology = _CACHE.setdefault(ms_node, topology)
+    return topology
+
+
+def _invalidating(method):
+    """
+    Returns:
+        function. method, dropping the cache once it returns or fails.
+    """
+    @functools.wraps(method)
+    def invalidating(*args, **kwargs):
+        """The wrapped call, invalidating the topology"""
+        try:
+            return method(*args, **kwargs)
+        finally:
+            invalidate()
+    return invalidating
+
+
+def attach(test):
+    """
+    Description:
+        Keep the cache in step with what the test does to the
+        deployment: drop it around a test tagged 'expansion' and after
+        each plan completion. Call in setUp, after the super class
+        setUp.
+    Args:
+        test (GenericTest): Test case to follow.
+    Returns:
+        NodeTopology. The topology the test starts with.
+    """
+    # pylint: disable=protected-access
+    method = getattr(test, test._testMethodName, None)
+    if any(getattr(method, tag, False) for tag in INVALIDATING_TAGS):
+        invalidate()
+        test.addCleanup(invalidate)
+    for name in PLAN_COMPLETION_CALLS:
+        call = getattr(test, name, None)
+        if callable(call):
+            setattr(test, name, _invalidating(call))
+    return get_topology(test)
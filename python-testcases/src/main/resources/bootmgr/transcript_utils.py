@@ -0,0 +1,254 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Record and replay of the remote commands of a test run.
+
+            With BOOTMGR_TRANSCRIPT=record:<file> every run_command call
+            of the test sets that call install() in setUp (including
+            the ones made by the execute_cli_* helpers) is appended to
+            <file>, a gzip compressed JSON lines transcript with the
+            node, command, user, stdout, stderr, rc and latency. With
+            BOOTMGR_TRANSCRIPT=replay:<file> the recorded results are
+            served back instead. A transcript named transcript.jsonl.gz
+            in a fake MS fixture is replayed by the fake deployment.
+
+            Usage: python transcript_utils.py <file> [top]
+                   prints the commands that took the longest in total.
+"""
+import gzip
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+
+from bundle_utils import CommandBundle
+
+TRANSCRIPT_ENV = 'BOOTMGR_TRANSCRIPT'
+FIXTURE_TRANSCRIPT = 'transcript.jsonl.gz'
+
+_NUMBER_RE = re.compile(r'\d+')
+
+
+def key_of_test(test):
+    """
+    Returns:
+        str. module.Class.method of the test set defining the running
+        test, the same for a test set and its fake MS subclass.
+    """
+    name = test._testMethodName  # pylint: disable=protected-access
+    for cls in type(test).__mro__:
+        if name in vars(cls):
+            return "{0}.{1}.{2}".format(cls.__module__, cls.__name__, name)
+    return test.id()
+
+
+def read_transcript(path):
+    """
+    Returns:
+        list. The entries of a transcript, in the order recorded.
+    """
+    with gzip.GzipFile(path, 'rb') as transcript_file:
+        return [json.loads(line.decode('utf-8'))
+                for line in transcript_file if line.strip()]
+
+
+class TranscriptRecorder(object):
+    """
+    Appends the calls of a run_command function to a transcript. Safe
+    to use from several threads; each record() is written at once so
+    an interrupted run keeps what it recorded.
+    """
+
+    def __init__(self, path, test_key=None):
+        """
+        Args:
+            path (str): Transcript file, appended to.
+            test_key (str): Recorded with every entry.
+        """
+        self.path = path
+        self.test_key = test_key
+        self._lock = threading.Lock()
+        self._file = gzip.GzipFile(path, 'ab')
+
+    def record(self, node, cmd, su_root, result, elapsed):
+        """
+        Description:
+            Write one call. Bundles are stored as their commands and
+            per command results, so they replay whatever their token.
+        """
+        stdout, stderr, ret = result
+        entry = {'test': self.test_key, 'node': node, 'su_root': su_root,
+                 'elapsed': round(elapsed, 4)}
+        bundle = CommandBundle.from_cmd(cmd)
+        try:
+            results = bundle.parse(stdout) if bundle is not None else None
+        except ValueError:
+            results = None
+        if results is not None:
+            entry.update(bundle=bundle.cmds, results=results)
+        else:
+            entry.update(cmd=cmd, out=stdout, err=stderr, rc=ret)
+        line = json.dumps(entry, sort_keys=True) + '\n'
+        with self._lock:
+            self._file.write(line.encode('utf-8'))
+            self._file.flush()
+
+    def wrap(self, run_command):
+        """
+        Returns:
+            function. run_command, recording each call.
+        """
+        def recorded(node, cmd, *args, **kwargs):
+            """run_command, recorded"""
+            start = time.time()
+            result = run_command(node, cmd, *args, **kwargs)
+            self.record(node, cmd, bool(kwargs.get('su_root')), result,
+                        time.time() - start)
+            return result
+        return recorded
+
+    def close(self):
+        """Finish the gzip member"""
+        with self._lock:
+            self._file.close()
+
+
+class TranscriptReplayer(object):
+    """
+    Serves recorded results. Calls are matched on node, command and
+    user; a command recorded several times (e.g. 'litp show_plan' while
+    a plan runs) replays its results in order, the last one repeating.
+    """
+
+    def __init__(self, entries):
+        self._results = {}
+        self._lock = threading.Lock()
+        for entry in entries:
+            if 'bundle' in entry:
+                for cmd, result in zip(entry['bundle'], entry['results']):
+                    self._add((entry['node'], cmd, entry['su_root']),
+                              tuple(result))
+            else:
+                self._add((entry['node'], entry['cmd'], entry['su_root']),
+                          (entry['out'], entry['err'], entry['rc']))
+
+    @classmethod
+    def load(cls, path, test_key=None):
+        """
+        Returns:
+            TranscriptReplayer. Of the calls recorded by test_key if
+            the transcript holds any, otherwise of the whole file.
+        """
+        entries = read_transcript(path)
+        own = [entry for entry in entries if entry.get('test') == test_key]
+        return cls(own or entries)
+
+    def _add(self, key, result):
+        """Queue a recorded result"""
+        self._results.setdefault(key, deque()).append(result)
+
+    def respond(self, node, cmd, su_root=False):
+        """
+        Returns:
+            tuple. (stdout, stderr, rc) of the next recorded call, None
+            if the call was never recorded.
+        """
+        with self._lock:
+            results = self._results.get((node, cmd, bool(su_root)))
+            if not results:
+                return None
+            result = results.popleft() if len(results) > 1 else results[0]
+        return list(result[0]), list(result[1]), result[2]
+
+    def run_command(self, node, cmd, su_root=False, **kwargs):
+        """
+        Same contract as GenericTest.run_command, from the transcript.
+        Unrecorded commands fail with rc 127.
+        """
+        # pylint: disable=unused-argument
+        bundle = CommandBundle.from_cmd(cmd)
+        cmds = bundle.cmds if bundle is not None else [cmd]
+        results = []
+        for single in cmds:
+            result = self.respond(node, single, su_root)
+            if result is None:
+                result = [], ["replay: '{0}' was not recorded on {1}".format(
+                    single, node)], 127
+            results.append(result)
+        if bundle is None:
+            return results[0]
+        return bundle.format_results(results), [], 0
+
+
+def install(test, setting=None):
+    """
+    Description:
+        Record or replay the test's run_command calls as set by the
+        BOOTMGR_TRANSCRIPT environment variable; does nothing if it is
+        not set. Call at the end of setUp.
+    Args:
+        test (GenericTest): Test case to instrument.
+        setting (str): 'record:<file>' or 'replay:<file>'; read from
+            the environment by default.
+    Returns:
+        TranscriptRecorder, TranscriptReplayer or None.
+    """
+    if setting is None:
+        setting = os.environ.get(TRANSCRIPT_ENV)
+    if not setting:
+        return None
+    mode, _, path = setting.partition(':')
+    if mode == 'record':
+        recorder = TranscriptRecorder(path, key_of_test(test))
+        test.run_command = recorder.wrap(test.run_command)
+        test.addCleanup(recorder.close)
+        return recorder
+    if mode == 'replay':
+        replayer = TranscriptReplayer.load(path, key_of_test(test))
+        test.run_command = replayer.run_command
+        return replayer
+    raise ValueError("{0} must be record:<file> or replay:<file>, not "
+                     "{1!r}".format(TRANSCRIPT_ENV, setting))
+
+
+def summarize(entries):
+    """
+    Description:
+        Total the recorded latency per command, numbers masked so e.g.
+        the same probe on node1 and node2 add up.
+    Returns:
+        list. (total seconds, calls, command) tuples, slowest first.
+    """
+    totals = {}
+    for entry in entries:
+        cmd = entry.get('cmd') or "bundle: " + " ; ".join(entry['bundle'])
+        key = _NUMBER_RE.sub('N', cmd)
+        total, calls = totals.get(key, (0.0, 0))
+        totals[key] = (total + entry['elapsed'], calls + 1)
+    return sorted(((total, calls, cmd)
+                   for cmd, (total, calls) in totals.items()), reverse=True)
+
+
+def main(argv):
+    """Entry point"""
+    entries = read_transcript(argv[1])
+    top = int(argv[2]) if len(argv) > 2 else 20
+    sys.stdout.write("{0} calls, {1:.1f}s\n".format(
+        len(entries), sum(entry['elapsed'] for entry in entries)))
+    for total, calls, cmd in summarize(entries)[:top]:
+        sys.stdout.write("{0:9.2f}s {1:5d}  {2}\n".format(total, calls,
+                                                         cmd[:100]))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,117 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@author:    bootmgr testware
+@summary:   Snapshot of the VCS resource attributes of a cluster read
+            with one 'hares -display -attribute ...' call, indexed by
+            service group, resource and system. Replaces one
+            'hagrp -resources' and one 'hares -value' call per node and
+            attribute.
+"""
+from vcs_utils import VCSUtils
+
+GLOBAL_SYSTEM = 'global'
+DEFAULT_ATTRIBUTES = ('Group', 'Mii')
+
+
+def parse_hares_display(lines):
+    """
+    Description:
+        Parse the output of 'hares -display'.
+    Args:
+        lines (list): Lines printed by hares, a header line then one
+            '<resource> <attribute> <system> <value>' line per value.
+    Returns:
+        dict. resource -> attribute -> system -> value; attributes that
+        are not localized are under the 'global' system.
+    """
+    values = {}
+    for line in lines:
+        if not line.strip() or line.startswith('#'):
+            continue
+        fields = line.split(None, 3)
+        if len(fields) < 3:
+            continue
+        resource, attribute, system = fields[:3]
+        value = fields[3].strip() if len(fields) > 3 else ''
+        values.setdefault(resource, {}).setdefault(
+            attribute, {})[system] = value
+    return values
+
+
+class VcsState(object):
+    """
+    Resource attributes of one VCS cluster.
+
+    Example:
+        state = VcsState.fetch(self, 'node2', attributes=('Group', 'Mii'))
+        for resource in state.resources_of('Grp_NIC_c1_eth1'):
+            mii = state.value(resource, 'Mii', 'node2')
+    """
+
+    def __init__(self, values):
+        """
+        Args:
+            values (dict): As returned by parse_hares_display.
+        """
+        self.values = values
+        self.groups = {}
+        for resource in sorted(values):
+            group = self.value(resource, 'Group')
+            if group is not None:
+                self.groups.setdefault(group, []).append(resource)
+
+    @classmethod
+    def fetch(cls, test, node, attributes=DEFAULT_ATTRIBUTES, vcs=None):
+        """
+        Description:
+            Read the attributes of every resource of the cluster of
+            node in one run_command call.
+        Args:
+            test (GenericTest): Test case whose run_command is used.
+            node (str): Filename of a node of the cluster.
+            attributes (tuple): Resource attributes to read; 'Group' is
+                needed to look resources up by service group.
+            vcs (VCSUtils): Builds the hares command.
+        Returns:
+            VcsState.
+        """
+        vcs = vcs if vcs is not None else VCSUtils()
+        cmd = vcs.get_hares_cmd('-display -attribute {0}'.format(
+            ' '.join(attributes)))
+        stdout, _, _ = test.run_command(node, cmd, su_root=True,
+                                        default_asserts=True)
+        return cls(parse_hares_display(stdout))
+
+    def resources_of(self, group):
+        """
+        Returns:
+            list. Resources of the service group, sorted.
+        """
+        return list(self.groups.get(group, []))
+
+    def value(self, resource, attribute, system=None):
+        """
+        Returns:
+            str. Value of a resource attribute on system, or its global
+            value if the attribute is not localized; None if unknown.
+        """
+        by_system = self.values.get(resource, {}).get(attribute, {})
+        if system is not None and system in by_system:
+            return by_system[system]
+        return by_system.get(GLOBAL_SYSTEM)
+
+    def group_values(self, group, attribute, system=None):
+        """
+        Returns:
+            dict. resource -> value of attribute, for the resources of
+            the service group.
+        """
+        return dict((resource, self.value(resource, attribute, system))
+                    for resource in self.resources_of(group))